@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import sys
 import timeit
@@ -24,7 +25,10 @@ def main():
         256,
         1024,  # 1 KB
         1024 * 10,  # 10 KiB
-        # 1024 * 1024,  # 1 MiB
+    ]
+    bulk_data_sizes = [
+        1024 * 1024,  # 1 MiB
+        100 * 1024 * 1024,  # 100 MiB
     ]
 
     key_128 = os.urandom(16)
@@ -70,6 +74,24 @@ def main():
         )
         print("-" * 90)
 
+    # Only the batched NumPy engine is fast enough for megabytes of data
+    if importlib.util.find_spec("numpy") is None:
+        return
+
+    for size in bulk_data_sizes:
+        data = os.urandom(size)
+
+        benchmark_cipher("AES128 (numpy)", AES128(engine="numpy"), data, key_128, iterations=1)
+        benchmark_cipher("AES256 (numpy)", AES256(engine="numpy"), data, key_256, iterations=1)
+        benchmark_cipher(
+            "Rijndael (B:8, K:8) (numpy)",
+            Rijndael(block_size=8, key_size=8, engine="numpy"),
+            data,
+            key_256,
+            iterations=1,
+        )
+        print("-" * 90)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,271 @@
+"""
+Microbenchmarks of every cipher stage and end-to-end throughput.
+
+Results are written as JSON with min/median/p95 seconds per call and can be compared
+against a stored baseline, the run fails when a benchmark becomes slower than the
+baseline by more than the threshold:
+
+    python -m benchmarks.suite --output benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import typing
+
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.engines import ENGINES
+from gigarijndael.encryption.sbox import GigaInvSBox, GigaSBox, InvSBox, SBox
+from gigarijndael.finite_fields.field import FiniteField
+from gigarijndael.rijndael import Rijndael
+
+Stats: typing.TypeAlias = dict[str, float]
+
+END_TO_END_DATA_SIZE: int = 4096
+BATCH_SIZE: int = 64  # Operations per call of the cheapest benchmarks
+
+
+class Benchmark(typing.NamedTuple):
+    name: str
+    function: typing.Callable[[], object]
+    data_size: int = 0  # Bytes processed by a call, for the throughput
+
+
+def stage_benchmarks(experimental: bool) -> list[Benchmark]:
+    """Round stages and key expansion of the reference encrypter."""
+    encrypter = RijndaelEncrypter(block_size=4, key_size=4, experimental=experimental)
+    word_cls = encrypter.word_cls
+    items_range = encrypter.finite_field.q
+    rng = random.Random(0)
+    state = [
+        word_cls.from_items(rng.randrange(items_range) for _ in range(word_cls.LENGTH))
+        for _ in range(encrypter.block_size)
+    ]
+    prefix = "giga" if experimental else "gf8"
+    return [
+        Benchmark(f"{prefix}.sub_word", lambda: [encrypter.sub_word(word) for word in state]),
+        Benchmark(f"{prefix}.shift_rows", lambda: encrypter._shift_rows(state)),
+        Benchmark(f"{prefix}.mix_columns", lambda: encrypter._mix_columns(state)),
+        Benchmark(f"{prefix}.inv_mix_columns", lambda: encrypter._inv_mix_columns(state)),
+        Benchmark(f"{prefix}.key_expansion", lambda: encrypter._key_expansion(state)),
+    ]
+
+
+def s_box_benchmarks() -> list[Benchmark]:
+    """Computation of S-Box values, bypassing the shared tables and caches."""
+    rng = random.Random(0)
+    giga_items = [rng.getrandbits(32) for _ in range(BATCH_SIZE)]
+
+    def build(s_box_cls: type[SBox], items: typing.Sequence[int]) -> typing.Callable[[], object]:
+        s_box = s_box_cls()
+        return lambda: [s_box._substitute(item) for item in items]
+
+    return [
+        Benchmark("s_box.gf8", build(SBox, range(256))),
+        Benchmark("s_box.gf8_inverse", build(InvSBox, range(256))),
+        Benchmark("s_box.giga", build(GigaSBox, giga_items)),
+        Benchmark("s_box.giga_inverse", build(GigaInvSBox, giga_items)),
+    ]
+
+
+def field_benchmarks() -> list[Benchmark]:
+    """Multiplication and inversion of a batch of elements in every supported field."""
+    benchmarks = []
+    for n in sorted(FiniteField.general_polynomials):
+        field = FiniteField(n)
+        rng = random.Random(n)
+        pairs = [(rng.randrange(1, field.q), rng.randrange(1, field.q)) for _ in range(BATCH_SIZE)]
+        benchmarks += [
+            Benchmark(f"field.{n}.multiply", functools.partial(_multiply_all, field, pairs)),
+            Benchmark(f"field.{n}.inverse", functools.partial(_inverse_all, field, pairs)),
+        ]
+    return benchmarks
+
+
+def _multiply_all(field: FiniteField, pairs: list[tuple[int, int]]) -> list[int]:
+    return [field.multiply(first, second) for first, second in pairs]
+
+
+def _inverse_all(field: FiniteField, pairs: list[tuple[int, int]]) -> list[int]:
+    return [field.inverse(first) for first, _ in pairs]
+
+
+def end_to_end_benchmarks() -> list[Benchmark]:
+    """Encryption throughput for every block and key size, engine and the Giga mode."""
+    data = random.Random(0).randbytes(END_TO_END_DATA_SIZE)
+    key = bytes(range(32))
+
+    def encrypt(**kwargs: typing.Any) -> typing.Callable[[], object]:
+        rijndael = Rijndael(**kwargs)
+        return lambda: rijndael.encrypt(data, key)
+
+    benchmarks = [
+        Benchmark(
+            f"encrypt.b{block_size}k{key_size}",
+            encrypt(block_size=block_size, key_size=key_size),
+            len(data),
+        )
+        for block_size in (4, 6, 8)
+        for key_size in (4, 6, 8)
+    ]
+    engines = [name for name in ENGINES if name != "reference"]
+    if importlib.util.find_spec("numpy") is None:
+        engines.remove("numpy")
+    benchmarks += [
+        Benchmark(
+            f"encrypt.b4k4.{engine}", encrypt(block_size=4, key_size=4, engine=engine), len(data)
+        )
+        for engine in engines
+    ]
+    benchmarks += [
+        Benchmark(
+            f"encrypt.giga.b{size}k{size}",
+            encrypt(block_size=size, key_size=size, experimental=True),
+            len(data),
+        )
+        for size in (4, 8)
+    ]
+    return benchmarks
+
+
+def all_benchmarks() -> list[Benchmark]:
+    return [
+        *stage_benchmarks(experimental=False),
+        *stage_benchmarks(experimental=True),
+        *s_box_benchmarks(),
+        *field_benchmarks(),
+        *end_to_end_benchmarks(),
+    ]
+
+
+def measure(function: typing.Callable[[], object], repeat: int, min_time: float) -> Stats:
+    """
+    Time the function, calling it several times per sample for fast functions.
+
+    Returns:
+        Min, median and 95th percentile of the time of one call in seconds.
+    """
+    function()  # Warm up caches and lazily built tables
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number)
+    return summarize(samples)
+
+
+def summarize(samples: typing.Sequence[float]) -> Stats:
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[p95_index],
+    }
+
+
+def compare(
+    results: dict[str, Stats], baseline: dict[str, Stats], threshold: float
+) -> list[tuple[str, float]]:
+    """
+    Find benchmarks whose median is slower than the baseline by more than the threshold.
+
+    Returns:
+        Names of the regressed benchmarks with their slowdown ratio.
+    """
+    return [
+        (name, stats["median"] / baseline[name]["median"])
+        for name, stats in results.items()
+        if name in baseline and stats["median"] > baseline[name]["median"] * (1 + threshold)
+    ]
+
+
+def run(benchmarks: typing.Iterable[Benchmark], repeat: int, min_time: float) -> dict[str, Stats]:
+    results = {}
+    for benchmark in benchmarks:
+        stats = measure(benchmark.function, repeat=repeat, min_time=min_time)
+        if benchmark.data_size:
+            stats["mb_per_s"] = benchmark.data_size / stats["median"] / 1e6
+        results[benchmark.name] = stats
+        print(
+            f"{benchmark.name:<32} min {stats['min'] * 1e6:>12.1f} us"
+            f"  median {stats['median'] * 1e6:>12.1f} us  p95 {stats['p95'] * 1e6:>12.1f} us",
+            file=sys.stderr,
+        )
+    return results
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="write results as JSON to the file")
+    parser.add_argument("-b", "--baseline", help="JSON results to compare with")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 is 20%%"
+    )
+    parser.add_argument("-k", "--filter", default="", help="run benchmarks containing this")
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    arguments = parser.parse_args(argv)
+
+    # Loaded first, so a missing baseline fails before the whole suite runs
+    baseline = None
+    if arguments.baseline:
+        if not os.path.exists(arguments.baseline):
+            parser.error(
+                f"baseline {arguments.baseline} does not exist,"
+                " create it with `make benchmark-baseline`"
+            )
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)["results"]
+
+    benchmarks = [bench for bench in all_benchmarks() if arguments.filter in bench.name]
+    results = run(benchmarks, repeat=arguments.repeat, min_time=arguments.min_time)
+
+    report = {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if baseline is not None:
+        regressions = compare(results, baseline, arguments.threshold)
+        for name, ratio in regressions:
+            print(f"REGRESSION {name}: {ratio:.2f}x slower than the baseline", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 from gigarijndael.aes import AES128, AES192, AES256
+from gigarijndael.aio import AsyncRijndael
 from gigarijndael.rijndael import Rijndael
+from gigarijndael.sectors import SectorCipher
 
-__all__ = ["AES128", "AES192", "AES256", "Rijndael"]
+__all__ = ["AES128", "AES192", "AES256", "AsyncRijndael", "Rijndael", "SectorCipher"]
@@ -0,0 +1,5 @@
+import sys
+
+from gigarijndael.cli import main
+
+sys.exit(main())
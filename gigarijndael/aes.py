@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 
+from gigarijndael.encryption.engines import DEFAULT_ENGINE
 from gigarijndael.rijndael import Rijndael
 
 
@@ -14,8 +15,21 @@ class AES(abc.ABC, Rijndael):
     BLOCK_SIZE: int = 4
     KEY_SIZE: int
 
-    def __init__(self) -> None:
-        super().__init__(block_size=self.BLOCK_SIZE, key_size=self.KEY_SIZE, experimental=False)
+    def __init__(
+        self,
+        *,
+        engine: str = DEFAULT_ENGINE,
+        key_cache_size: int = Rijndael.KEY_CACHE_SIZE,
+        workers: int | None = 1,
+    ) -> None:
+        super().__init__(
+            block_size=self.BLOCK_SIZE,
+            key_size=self.KEY_SIZE,
+            experimental=False,
+            engine=engine,
+            key_cache_size=key_cache_size,
+            workers=workers,
+        )
 
 
 class AES128(AES):
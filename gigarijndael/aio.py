@@ -0,0 +1,223 @@
+"""
+Asyncio interface running the cipher in an executor, so the event loop is never blocked.
+
+Whole messages go to a thread or process executor. Process workers keep their own cipher
+with warm tables and expanded keys between calls. Streams are transformed chunk by chunk,
+reading ahead and writing behind at most `max_in_flight` chunks, in the original order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import copy
+import os
+import typing
+
+from gigarijndael.parallel import process_context
+from gigarijndael.rijndael import Rijndael
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.modes import CipherContext, Mode
+
+Options: typing.TypeAlias = tuple[tuple[str, typing.Any], ...]
+
+_worker_ciphers: dict[Options, Rijndael] = {}
+
+
+def _worker_cipher(options: Options) -> Rijndael:
+    """Return the cipher of the worker process, created and warmed up on the first use."""
+    if options not in _worker_ciphers:
+        # The worker is one of many processes already, it does not start its own pools
+        cipher = Rijndael(**{**dict(options), "workers": 1})
+        block = bytes(cipher.block_bytes)
+        cipher.decrypt(cipher.encrypt(block, block), block)
+        cipher.clear_key_cache()
+        _worker_ciphers[options] = cipher
+    return _worker_ciphers[options]
+
+
+def _initialize_worker(options: Options) -> None:
+    _worker_cipher(options)
+
+
+def _transform_in_worker(
+    options: Options, data: bytes, key: bytes, mode: Mode | None, decrypt: bool
+) -> bytes:
+    if mode is not None and getattr(mode, "workers", 1) != 1:
+        mode = copy.copy(mode)
+        mode.workers = 1  # type: ignore[attr-defined]
+    cipher = _worker_cipher(options)
+    return cipher.decrypt(data, key, mode) if decrypt else cipher.encrypt(data, key, mode)
+
+
+def process_executor(
+    cipher: Rijndael, workers: int | None = None
+) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Start worker processes that build the tables of the cipher before the first task.
+
+    Args:
+        cipher: Cipher whose configuration the workers replicate.
+        workers: Number of processes, the number of CPUs by default.
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=process_context(),
+        initializer=_initialize_worker,
+        initargs=(tuple(cipher.options().items()),),
+    )
+
+
+class AsyncRijndael:
+    """
+    Asyncio front end of a Rijndael cipher.
+    """
+
+    CHUNK_SIZE: int = 1 << 16  # Bytes read from a stream at once
+    MAX_IN_FLIGHT: int = 4  # Chunks read ahead and written behind the one being processed
+
+    def __init__(
+        self,
+        cipher: Rijndael,
+        executor: concurrent.futures.Executor | None = None,
+        *,
+        chunk_size: int = CHUNK_SIZE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ) -> None:
+        """
+        Initialize the front end.
+
+        Args:
+            cipher: Cipher doing the work.
+            executor: Thread or process executor, the default executor of the loop if None.
+                Stream contexts keep state between chunks, so with a process executor
+                streams run in the default executor of the loop.
+            chunk_size: Bytes read from a stream at once.
+            max_in_flight: Number of chunks buffered on each side of the cipher.
+
+        Raises:
+            ValueError: If the chunk size or the number of chunks is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        if max_in_flight <= 0:
+            raise ValueError(f"Invalid number of chunks in flight: {max_in_flight}")
+        self.cipher: Rijndael = cipher
+        self.executor: concurrent.futures.Executor | None = executor
+        self.chunk_size: int = chunk_size
+        self.max_in_flight: int = max_in_flight
+        self._options: Options = tuple(cipher.options().items())
+
+    async def encrypt(self, data: Buffer, key: bytes, mode: Mode | None = None) -> bytes:
+        """Encrypt data in the executor, see `Rijndael.encrypt`."""
+        return await self._run(data, key, mode, decrypt=False)
+
+    async def decrypt(self, data: Buffer, key: bytes, mode: Mode | None = None) -> bytes:
+        """Decrypt data in the executor, see `Rijndael.decrypt`."""
+        return await self._run(data, key, mode, decrypt=True)
+
+    async def encrypt_stream(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        key: bytes,
+        mode: Mode | None = None,
+    ) -> int:
+        """
+        Encrypt everything read from the reader until EOF into the writer.
+
+        Returns:
+            Number of bytes written.
+        """
+        return await self._transform(reader, writer, self.cipher.encryptor(key, mode))
+
+    async def decrypt_stream(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        key: bytes,
+        mode: Mode | None = None,
+    ) -> int:
+        """
+        Decrypt everything read from the reader until EOF into the writer.
+
+        Returns:
+            Number of bytes written.
+        """
+        return await self._transform(reader, writer, self.cipher.decryptor(key, mode))
+
+    async def _run(self, data: Buffer, key: bytes, mode: Mode | None, decrypt: bool) -> bytes:
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, concurrent.futures.ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                self.executor,
+                _transform_in_worker,
+                self._options,
+                bytes(data),
+                bytes(key),
+                mode,
+                decrypt,
+            )
+        transform = self.cipher.decrypt if decrypt else self.cipher.encrypt
+        return await loop.run_in_executor(self.executor, transform, data, key, mode)
+
+    async def _transform(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, context: CipherContext
+    ) -> int:
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            executor = None
+        # Bounded queues stop reading ahead when the cipher or the writer fall behind
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue(self.max_in_flight)
+        results: asyncio.Queue[bytes | None] = asyncio.Queue(self.max_in_flight)
+
+        async def read() -> None:
+            while chunk := await reader.read(self.chunk_size):
+                await chunks.put(chunk)
+            await chunks.put(None)
+
+        async def process() -> None:
+            # Chunks go through the context one at a time, which keeps their order
+            while (chunk := await chunks.get()) is not None:
+                await results.put(await loop.run_in_executor(executor, context.update, chunk))
+            await results.put(await loop.run_in_executor(executor, context.finalize))
+            await results.put(None)
+
+        tasks: list[asyncio.Future[typing.Any]] = [
+            asyncio.ensure_future(read()),
+            asyncio.ensure_future(process()),
+        ]
+        written = 0
+        try:
+            while True:
+                result = await self._next(results, tasks)
+                if result is None:
+                    break
+                writer.write(result)
+                written += len(result)
+                await writer.drain()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return written
+
+    @staticmethod
+    async def _next(
+        results: asyncio.Queue[bytes | None], tasks: list[asyncio.Future[typing.Any]]
+    ) -> bytes | None:
+        """Next processed chunk, raising the error of a failed reader or cipher instead."""
+        getter: asyncio.Future[typing.Any] = asyncio.ensure_future(results.get())
+        while not getter.done():
+            # Finished tasks would end every wait at once, so only running ones are watched
+            pending = [task for task in tasks if not task.done()]
+            await asyncio.wait([getter, *pending], return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    getter.cancel()
+                    task.result()
+        return getter.result()
@@ -0,0 +1,166 @@
+import collections
+import threading
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache, zero before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(typing.Generic[K, V]):
+    """
+    Bounded thread-safe mapping that evicts the least recently used entries.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of stored entries, zero disables caching.
+
+        Raises:
+            ValueError: If the size is negative.
+        """
+        self._check_size(maxsize)
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: collections.OrderedDict[K, V] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: K, factory: typing.Callable[[K], V]) -> V:
+        """
+        Return the cached value for the key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key.
+            factory: Function computing the value from the key.
+
+        Returns:
+            Cached or freshly computed value.
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+
+        value = factory(key)
+        if self.maxsize:
+            with self._lock:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                self._evict_overflow()
+        return value
+
+    def get_or_create_many(
+        self, keys: typing.Iterable[K], factory: typing.Callable[[list[K]], typing.Iterable[V]]
+    ) -> list[V]:
+        """
+        Return the values for many keys, computing all missing ones with a single call.
+
+        Args:
+            keys: Cache keys, repeated keys are computed once.
+            factory: Function computing the values of a list of distinct keys, in order.
+
+        Returns:
+            Values in the order of the keys.
+        """
+        keys = list(keys)
+        values: dict[K, V] = {}
+        missing: dict[K, None] = {}
+        with self._lock:
+            for key in keys:
+                if key in values or key in missing:
+                    self.hits += 1
+                elif key in self._data:
+                    self.hits += 1
+                    self._data.move_to_end(key)
+                    values[key] = self._data[key]
+                else:
+                    self.misses += 1
+                    missing[key] = None
+
+        if missing:
+            computed = dict(zip(missing, factory(list(missing)), strict=True))
+            values.update(computed)
+            self.update(computed.items())
+        return [values[key] for key in keys]
+
+    def update(self, items: typing.Iterable[tuple[K, V]]) -> None:
+        """
+        Store entries as the most recently used ones, without changing the statistics.
+
+        Used to warm the cache up, the oldest entries are evicted if they do not fit.
+        """
+        if not self.maxsize:
+            return
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            self._evict_overflow()
+
+    def items(self) -> list[tuple[K, V]]:
+        """Snapshot of the entries, from the least to the most recently used."""
+        with self._lock:
+            return list(self._data.items())
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of entries, evicting the least recently used ones.
+
+        Raises:
+            ValueError: If the size is negative.
+        """
+        self._check_size(maxsize)
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict_overflow()
+
+    def evict(self, key: K) -> bool:
+        """Remove the key from the cache. Returns True if it was cached."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss statistics and the current size."""
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data)
+            )
+
+    def _evict_overflow(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    @staticmethod
+    def _check_size(maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
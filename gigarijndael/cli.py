@@ -0,0 +1,211 @@
+"""
+Command line interface: encryption and decryption of files of any size.
+
+The input file is memory-mapped and processed in fixed-size chunks, the output file is
+preallocated, memory-mapped and filled chunk by chunk, so the memory used does not
+depend on the file size. The result is written next to the output file and renamed to it
+only once the whole input is processed, so a failed authentication or padding check never
+leaves unverified plaintext behind.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import mmap
+import os
+import sys
+import time
+import typing
+
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.engines import DEFAULT_ENGINE, ENGINES
+from gigarijndael.encryption.sbox import REGISTRY
+from gigarijndael.modes import CBC, CTR, ECB, GCM, Mode
+from gigarijndael.rijndael import Rijndael
+
+CHUNK_SIZE: int = 1 << 22  # Bytes read from the input at once
+MODES: tuple[str, ...] = ("ecb", "cbc", "ctr", "gcm")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="gigarijndael", description="Encrypt and decrypt files with Rijndael."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("encrypt", "decrypt"):
+        subparser = commands.add_parser(command, help=f"{command} a file")
+        subparser.add_argument("input", help="input file")
+        subparser.add_argument("output", help="output file, overwritten if it exists")
+        subparser.add_argument("-k", "--key", required=True, type=bytes.fromhex, help="hex key")
+        subparser.add_argument(
+            "-b", "--block-size", type=int, default=4, choices=(4, 6, 8), help="in 32-bit words"
+        )
+        subparser.add_argument(
+            "-s", "--key-size", type=int, default=4, choices=(4, 6, 8), help="in 32-bit words"
+        )
+        subparser.add_argument(
+            "-x", "--experimental", action="store_true", help='GF(2^32) "Giga" mode'
+        )
+        subparser.add_argument(
+            "--giga-bits",
+            type=int,
+            default=32,
+            choices=sorted(RijndaelEncrypter.GIGA_FIELDS),
+            help="size of the field elements in Giga mode",
+        )
+        subparser.add_argument("-m", "--mode", default="ecb", choices=MODES)
+        subparser.add_argument(
+            "--iv",
+            type=bytes.fromhex,
+            help="hex IV for cbc, initial counter block for ctr, nonce for gcm",
+        )
+        subparser.add_argument("-e", "--engine", default=DEFAULT_ENGINE, choices=sorted(ENGINES))
+        subparser.add_argument(
+            "-w", "--workers", type=int, default=1, help="worker processes, 0 for all CPUs"
+        )
+        subparser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="in bytes")
+        subparser.add_argument(
+            "--s-box-cache",
+            metavar="FILE",
+            help="load computed Giga S-Box values from the file if it exists, save them after",
+        )
+        subparser.add_argument(
+            "--s-box-cache-size",
+            type=int,
+            help=f"computed values kept per Giga S-Box, {REGISTRY.CACHE_SIZE} by default",
+        )
+    return parser
+
+
+def create_mode(name: str, iv: bytes | None, workers: int | None) -> Mode:
+    """
+    Create the mode of operation from the command line options.
+
+    Raises:
+        ValueError: If the mode needs an IV and none is given.
+    """
+    if name == "ecb":
+        return ECB(workers=workers)
+    if iv is None:
+        raise ValueError(f"Mode {name} requires --iv")
+    if name == "cbc":
+        return CBC(iv, workers=workers)
+    if name == "gcm":
+        return GCM(iv, workers=workers)
+    return CTR(iv, workers=workers)
+
+
+def process_file(
+    source: str,
+    target: str,
+    rijndael: Rijndael,
+    key: bytes,
+    mode: Mode,
+    decrypt: bool,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Encrypt or decrypt a file chunk by chunk.
+
+    The target is replaced only if the whole file is processed, an error removes
+    the partial result and leaves an existing target untouched.
+
+    Returns:
+        Size of the input in bytes.
+    """
+    temporary_path = f"{target}.tmp"
+    try:
+        size = _process_file(source, temporary_path, rijndael, key, mode, decrypt, chunk_size)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, target)
+    return size
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    workers = arguments.workers or None
+    rijndael = Rijndael(
+        block_size=arguments.block_size,
+        key_size=arguments.key_size,
+        experimental=arguments.experimental,
+        giga_bits=arguments.giga_bits,
+        engine=arguments.engine,
+        key_cache_size=1,
+        workers=workers,
+    )
+    decrypt = arguments.command == "decrypt"
+    try:
+        if arguments.s_box_cache_size is not None:
+            REGISTRY.resize(arguments.s_box_cache_size)
+        if arguments.s_box_cache and os.path.exists(arguments.s_box_cache):
+            REGISTRY.load(arguments.s_box_cache)
+        mode = create_mode(arguments.mode, arguments.iv, workers)
+        start = time.perf_counter()
+        size = process_file(
+            arguments.input,
+            arguments.output,
+            rijndael,
+            arguments.key,
+            mode,
+            decrypt,
+            arguments.chunk_size,
+        )
+        elapsed = time.perf_counter() - start
+        if arguments.s_box_cache:
+            REGISTRY.save(arguments.s_box_cache)
+    except (OSError, ValueError) as error:
+        print(f"gigarijndael: {error}", file=sys.stderr)
+        return 1
+    print(
+        f"{arguments.command}ed {size / 1e6:.1f} MB in {elapsed:.2f} s"
+        f" ({size / 1e6 / max(elapsed, 1e-9):.2f} MB/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _process_file(
+    source: str,
+    target: str,
+    rijndael: Rijndael,
+    key: bytes,
+    mode: Mode,
+    decrypt: bool,
+    chunk_size: int,
+) -> int:
+    context = rijndael.decryptor(key, mode) if decrypt else rijndael.encryptor(key, mode)
+    with open(source, "rb") as input_file, open(target, "w+b") as output_file:
+        size = _file_size(input_file)
+        # Padding or a tag add at most one block, the file is cut to the real size at the end
+        output_file.truncate(size + 2 * rijndael.block_bytes)
+        with _map(output_file, mmap.ACCESS_WRITE) as output_map:
+            written = 0
+            if size:  # Empty files can not be mapped
+                with _map(input_file, mmap.ACCESS_READ) as input_map, memoryview(input_map) as view:
+                    for offset in range(0, size, chunk_size):
+                        chunk = context.update(view[offset : offset + chunk_size])
+                        written = _write(output_map, written, chunk)
+            written = _write(output_map, written, context.finalize())
+            output_map.flush()
+        output_file.truncate(written)
+    return size
+
+
+def _file_size(file: typing.BinaryIO) -> int:
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+
+def _map(file: typing.BinaryIO, access: int) -> mmap.mmap:
+    return mmap.mmap(file.fileno(), 0, access=access)
+
+
+def _write(output_map: mmap.mmap, offset: int, data: bytes) -> int:
+    output_map[offset : offset + len(data)] = data
+    return offset + len(data)
@@ -1,4 +1,21 @@
+from gigarijndael.encryption.bitsliced import BitslicedRijndaelEncrypter
 from gigarijndael.encryption.encrypter import RijndaelEncrypter
-from gigarijndael.encryption.word import GigaWord, Word
+from gigarijndael.encryption.engines import DEFAULT_ENGINE, ENGINES, get_engine
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+from gigarijndael.encryption.table import TableRijndaelEncrypter
+from gigarijndael.encryption.vectorized import NumpyRijndaelEncrypter
+from gigarijndael.encryption.word import GigaWord, GigaWord64, Word
 
-__all__ = ["RijndaelEncrypter", "Word", "GigaWord"]
+__all__ = [
+    "BitslicedRijndaelEncrypter",
+    "DEFAULT_ENGINE",
+    "ENGINES",
+    "NumpyRijndaelEncrypter",
+    "PackedRijndaelEncrypter",
+    "RijndaelEncrypter",
+    "TableRijndaelEncrypter",
+    "Word",
+    "GigaWord",
+    "GigaWord64",
+    "get_engine",
+]
@@ -0,0 +1,408 @@
+import functools
+import typing
+
+from gigarijndael.encryption.block import Block, blocks_to_bytes, bytes_to_blocks
+from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+from gigarijndael.encryption.matrix import compile_affine_transformation
+from gigarijndael.encryption.sbox import SBox
+from gigarijndael.encryption.word import Word
+from gigarijndael.finite_fields.arithmetic import reduce
+from gigarijndael.finite_fields.field import FiniteField
+from gigarijndael.finite_fields.linear import apply_columns, invert_columns
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+# Bit planes of the state, bit k of plane 8*i + j is bit j of the item i of the block k
+Planes: typing.TypeAlias = list[int]
+Rows: typing.TypeAlias = tuple[tuple[int, ...], ...]
+
+ITEM_BITS: int = 8
+# Translation of every byte into the ASCII digit of one of its bits, and of the digits back
+BIT_DIGITS: tuple[bytes, ...] = tuple(
+    bytes(0x30 | (byte >> bit & 1) for byte in range(256)) for bit in range(ITEM_BITS)
+)
+DIGIT_BITS: bytes = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def linear_rows(columns: typing.Sequence[int], size: int) -> Rows:
+    """Indices of the input planes XOR-ed into every output plane of a linear map."""
+    return tuple(
+        tuple(index for index, column in enumerate(columns) if column >> bit & 1)
+        for bit in range(size)
+    )
+
+
+def apply_rows(rows: Rows, planes: typing.Sequence[int]) -> Planes:
+    """Apply a linear map compiled with `linear_rows` to bit planes."""
+    result = []
+    for row in rows:
+        plane = 0
+        for index in row:
+            plane ^= planes[index]
+        result.append(plane)
+    return result
+
+
+def compose_columns(outer: typing.Sequence[int], inner: typing.Sequence[int]) -> list[int]:
+    """Columns of the linear map applying the inner map first and the outer one second."""
+    return [apply_columns(outer, column) for column in inner]
+
+
+class BitslicedSBox:
+    """
+    S-Box of GF(2^8) evaluated as a Boolean circuit over bit planes.
+
+    The field is mapped onto the tower GF((2^4)^2): an element a*t + b has coefficients
+    in GF(2^4) and t^2 = t + l. Its inverse is (a*t + a + b) / (l*a^2 + a*b + b^2), so it
+    takes five GF(2^4) multiplications, the GF(2^4) inverse being x^14 = x^2 * x^4 * x^8.
+    The basis changes are merged with the affine transformation of the S-Box, so the
+    circuit consists of AND and XOR operations only, with no data dependent lookups.
+    """
+
+    SUBFIELD_N: int = 4
+
+    def __init__(self, s_box: SBox) -> None:
+        """
+        Build the circuit of the S-Box.
+
+        Raises:
+            ValueError: If the S-Box is not defined over GF(2^8).
+        """
+        field = s_box.finite_field
+        if field.n != 2 * self.SUBFIELD_N:
+            raise ValueError(f"Bitsliced S-Box requires GF(2^8), got GF(2^{field.n})")
+        subfield = FiniteField(self.SUBFIELD_N)
+
+        # Powers of a root of the subfield polynomial embed GF(2^4) into the field
+        generator = next(
+            element
+            for element in range(2, field.q)
+            if self._evaluate(field, subfield.general_polynomial, element) == 0
+        )
+        powers = [1]
+        for _ in range(self.SUBFIELD_N - 1):
+            powers.append(field.multiply(powers[-1], generator))
+
+        # t^2 + t + l is irreducible over GF(2^4) when no subfield element is its root
+        constant = next(
+            candidate
+            for candidate in range(1, subfield.q)
+            if all(
+                subfield.multiply(element, element) ^ element != candidate
+                for element in range(subfield.q)
+            )
+        )
+        embedded_constant = apply_columns(powers, constant)
+        root = next(
+            element
+            for element in range(field.q)
+            if field.multiply(element, element) ^ element == embedded_constant
+        )
+
+        # Columns of the map from the tower into the field: bits of b, then bits of a
+        from_tower = powers + [field.multiply(power, root) for power in powers]
+        to_tower = invert_columns(from_tower)
+
+        transform = compile_affine_transformation(s_box.AFFINE_ROW, s_box.AFFINE_CONST, field.n)
+        affine_const = transform(0)
+        affine_columns = [transform(1 << bit) ^ affine_const for bit in range(field.n)]
+        if s_box.INVERSE:
+            input_columns = compose_columns(to_tower, affine_columns)
+            input_const = apply_columns(to_tower, affine_const)
+            output_columns, output_const = list(from_tower), 0
+        else:
+            input_columns, input_const = list(to_tower), 0
+            output_columns = compose_columns(affine_columns, from_tower)
+            output_const = affine_const
+
+        self._input_rows: Rows = linear_rows(input_columns, field.n)
+        self._input_flips: tuple[int, ...] = self._bits(input_const, field.n)
+        self._output_rows: Rows = linear_rows(output_columns, field.n)
+        self._output_flips: tuple[int, ...] = self._bits(output_const, field.n)
+
+        def norm_part(element: int) -> int:
+            high, low = element >> self.SUBFIELD_N, element & (subfield.q - 1)
+            return subfield.multiply(constant, subfield.multiply(high, high)) ^ (
+                subfield.multiply(low, low)
+            )
+
+        # Linear part l*a^2 + b^2 of the norm, and the squarings of GF(2^4)
+        self._norm_rows: Rows = linear_rows(
+            [norm_part(1 << bit) for bit in range(field.n)], self.SUBFIELD_N
+        )
+        square_columns = [subfield.multiply(1 << bit, 1 << bit) for bit in range(self.SUBFIELD_N)]
+        self._square_rows: Rows = linear_rows(square_columns, self.SUBFIELD_N)
+        fourth_columns = compose_columns(square_columns, square_columns)
+        self._fourth_rows: Rows = linear_rows(fourth_columns, self.SUBFIELD_N)
+        self._eighth_rows: Rows = linear_rows(
+            compose_columns(square_columns, fourth_columns), self.SUBFIELD_N
+        )
+        self._reduction_rows: Rows = linear_rows(
+            [
+                reduce(1 << bit, subfield.general_polynomial)
+                for bit in range(2 * self.SUBFIELD_N - 1)
+            ],
+            self.SUBFIELD_N,
+        )
+
+    def __call__(self, planes: typing.Sequence[int], mask: int) -> Planes:
+        """
+        Substitute an item of every block.
+
+        Args:
+            planes: 8 bit planes of the item.
+            mask: Plane with the bits of all blocks set, used to add constants.
+        """
+        tower = apply_rows(self._input_rows, planes)
+        for bit in self._input_flips:
+            tower[bit] ^= mask
+        low, high = tower[: self.SUBFIELD_N], tower[self.SUBFIELD_N :]
+
+        norm = apply_rows(self._norm_rows, tower)
+        for bit, plane in enumerate(self._multiply(high, low)):
+            norm[bit] ^= plane
+        inverse_norm = self._multiply(
+            self._multiply(
+                apply_rows(self._square_rows, norm), apply_rows(self._fourth_rows, norm)
+            ),
+            apply_rows(self._eighth_rows, norm),
+        )
+        low = self._multiply([a ^ b for a, b in zip(high, low)], inverse_norm)
+        high = self._multiply(high, inverse_norm)
+
+        result = apply_rows(self._output_rows, low + high)
+        for bit in self._output_flips:
+            result[bit] ^= mask
+        return result
+
+    def _multiply(self, first: Planes, second: Planes) -> Planes:
+        """Product of two GF(2^4) elements given by their bit planes."""
+        a0, a1, a2, a3 = first
+        b0, b1, b2, b3 = second
+        product = [
+            a0 & b0,
+            (a0 & b1) ^ (a1 & b0),
+            (a0 & b2) ^ (a1 & b1) ^ (a2 & b0),
+            (a0 & b3) ^ (a1 & b2) ^ (a2 & b1) ^ (a3 & b0),
+            (a1 & b3) ^ (a2 & b2) ^ (a3 & b1),
+            (a2 & b3) ^ (a3 & b2),
+            a3 & b3,
+        ]
+        return apply_rows(self._reduction_rows, product)
+
+    @staticmethod
+    def _evaluate(field: FiniteField, polynomial: int, element: int) -> int:
+        """Value of a polynomial with binary coefficients at a field element."""
+        result = 0
+        power = 1
+        while polynomial:
+            if polynomial & 1:
+                result ^= power
+            power = field.multiply(power, element)
+            polynomial >>= 1
+        return result
+
+    @staticmethod
+    def _bits(number: int, size: int) -> tuple[int, ...]:
+        return tuple(bit for bit in range(size) if number >> bit & 1)
+
+
+class BitslicedRijndaelEncrypter(RijndaelEncrypter):
+    """
+    Bitsliced Rijndael encrypter for the GF(2^8) mode.
+
+    A batch of blocks is transposed into bit planes, one Python integer per bit of the
+    block holding that bit of every block of the batch. SubBytes is a Boolean circuit,
+    ShiftRows a permutation of planes and MixColumns XORs of planes, so every operation
+    processes the whole batch at once and no step depends on the data. It pays off for
+    large batches (ECB, CTR, CBC decryption), a single block costs a whole circuit.
+    """
+
+    BATCH_BLOCKS: int = 1 << 14  # Number of blocks, i.e. bits of a plane, processed at once
+    INSTRUMENTED_STAGES = {
+        "_sub_state": "sub_bytes",
+        "_shift_state": "shift_rows",
+        "_mix_state": "mix_columns",
+        "_inv_mix_state": "mix_columns",
+        "_add_key_planes": "add_round_key",
+        "key_schedule": "key_expansion",
+    }
+
+    def __init__(
+        self, block_size: int, key_size: int, experimental: bool = False, giga_bits: int = 32
+    ):
+        if experimental:
+            raise ValueError("Bitsliced engine supports only GF(2^8) mode")
+        super().__init__(
+            block_size=block_size, key_size=key_size, experimental=experimental, giga_bits=giga_bits
+        )
+
+    @functools.cached_property
+    def sub_circuit(self) -> BitslicedSBox:
+        """Circuit of the S-Box, shared by all instances."""
+        return self.s_box.derived("bitsliced_circuit", lambda: BitslicedSBox(self.s_box))
+
+    @functools.cached_property
+    def inv_sub_circuit(self) -> BitslicedSBox:
+        """Circuit of the inverse S-Box, shared by all instances."""
+        return self.inv_s_box.derived("bitsliced_circuit", lambda: BitslicedSBox(self.inv_s_box))
+
+    @functools.cached_property
+    def shift_permutation(self) -> tuple[int, ...]:
+        """Indices of the planes gathered by ShiftRows."""
+        return self._shift_permutation(sign=1)
+
+    @functools.cached_property
+    def inv_shift_permutation(self) -> tuple[int, ...]:
+        """Indices of the planes gathered by InvShiftRows."""
+        return self._shift_permutation(sign=-1)
+
+    @functools.cached_property
+    def _reduction_bits(self) -> tuple[int, ...]:
+        """Bits of the low part of the field polynomial, added back in xtime."""
+        return BitslicedSBox._bits(self.finite_field.general_polynomial, ITEM_BITS)
+
+    def encrypt_blocks(
+        self, blocks: typing.Iterable[Block], key_schedule: KeySchedule, decrypt: bool
+    ) -> list[Block]:
+        layout = self._block_layout
+        data = self.encrypt_bytes(blocks_to_bytes(blocks, **layout), key_schedule, decrypt)
+        return list(bytes_to_blocks(data, **layout))
+
+    def encrypt_bytes(self, data: "Buffer", key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        round_keys = key_schedule.reverse if decrypt else key_schedule.forward
+        process = self._decrypt_state if decrypt else self._encrypt_state
+        view = memoryview(data).cast("B")
+        output = bytearray(len(view))
+        batch_bytes = self.BATCH_BLOCKS * self.block_bytes
+        for offset in range(0, len(view), batch_bytes):
+            batch = view[offset : offset + batch_bytes].tobytes()
+            blocks = len(batch) // self.block_bytes
+            mask = (1 << blocks) - 1
+            key_planes = [[-bit & mask for bit in round_key] for round_key in round_keys]
+            state = process(self._to_planes(batch), key_planes, mask)
+            output[offset : offset + len(batch)] = self._from_planes(state, blocks)
+        return bytes(output)
+
+    def key_schedule(self, key: list[Word]) -> KeySchedule:
+        """Expand the key into round keys given as the bits of every plane."""
+        return KeySchedule(
+            *(
+                tuple(
+                    tuple(
+                        byte >> bit & 1
+                        for byte in b"".join(bytes(word) for word in round_key)
+                        for bit in range(ITEM_BITS)
+                    )
+                    for round_key in round_keys
+                )
+                for round_keys in super().key_schedule(key)
+            )
+        )
+
+    def _to_planes(self, batch: bytes) -> Planes:
+        """Transpose blocks into bit planes, the first block goes to the most significant bit."""
+        block_bytes = self.block_bytes
+        planes: Planes = []
+        for index in range(block_bytes):
+            items = batch[index::block_bytes]
+            planes += (int(items.translate(digits), 2) for digits in BIT_DIGITS)
+        return planes
+
+    def _from_planes(self, state: Planes, blocks: int) -> bytearray:
+        """Transpose bit planes back into blocks."""
+        block_bytes = self.block_bytes
+        output = bytearray(blocks * block_bytes)
+        width = f"0{blocks}b"
+        for index in range(block_bytes):
+            items = 0
+            for bit in range(ITEM_BITS):
+                digits = format(state[index * ITEM_BITS + bit], width).encode()
+                items |= int.from_bytes(digits.translate(DIGIT_BITS)) << bit
+            output[index::block_bytes] = items.to_bytes(blocks)
+        return output
+
+    def _encrypt_state(
+        self, state: Planes, round_keys: typing.Sequence[Planes], mask: int
+    ) -> Planes:
+        state = self._add_key_planes(state, round_keys[0])
+        for i in range(1, self.rounds_number):
+            state = self._mix_state(self._shift_state(self._sub_state(state, mask)))
+            state = self._add_key_planes(state, round_keys[i])
+        state = self._shift_state(self._sub_state(state, mask))
+        return self._add_key_planes(state, round_keys[self.rounds_number])
+
+    def _decrypt_state(
+        self, state: Planes, round_keys: typing.Sequence[Planes], mask: int
+    ) -> Planes:
+        state = self._add_key_planes(state, round_keys[0])
+        for i in range(1, self.rounds_number):
+            state = self._sub_state(self._shift_state(state, inverse=True), mask, inverse=True)
+            state = self._inv_mix_state(self._add_key_planes(state, round_keys[i]))
+        state = self._sub_state(self._shift_state(state, inverse=True), mask, inverse=True)
+        return self._add_key_planes(state, round_keys[self.rounds_number])
+
+    def _add_key_planes(self, state: Planes, round_key: Planes) -> Planes:
+        return [plane ^ key_plane for plane, key_plane in zip(state, round_key)]
+
+    def _sub_state(self, state: Planes, mask: int, inverse: bool = False) -> Planes:
+        """Apply the S-Box circuit (or the inverse one) to every item."""
+        circuit = self.inv_sub_circuit if inverse else self.sub_circuit
+        result = []
+        for offset in range(0, len(state), ITEM_BITS):
+            result += circuit(state[offset : offset + ITEM_BITS], mask)
+        return result
+
+    def _shift_state(self, state: Planes, inverse: bool = False) -> Planes:
+        """Cyclic shift of rows as a permutation of planes."""
+        permutation = self.inv_shift_permutation if inverse else self.shift_permutation
+        return [state[index] for index in permutation]
+
+    def _xtime(self, item: Planes) -> Planes:
+        """Multiply an item of every block by x in the finite field."""
+        high = item[-1]
+        result = [0, *item[:-1]]
+        for bit in self._reduction_bits:
+            result[bit] ^= high
+        return result
+
+    def _mix_state(self, state: Planes) -> Planes:
+        """Mix all columns: 2*a0 + 3*a1 + a2 + a3 for every row."""
+        length = Word.LENGTH
+        result = []
+        for column in range(0, len(state), length * ITEM_BITS):
+            items = [
+                state[column + row * ITEM_BITS : column + (row + 1) * ITEM_BITS]
+                for row in range(length)
+            ]
+            for row in range(length):
+                first, second, third = (items[(row + shift) % length] for shift in (1, 2, 3))
+                doubled = self._xtime([a ^ b for a, b in zip(items[row], first)])
+                result += [a ^ b ^ c ^ d for a, b, c, d in zip(doubled, first, second, third)]
+        return result
+
+    def _inv_mix_state(self, state: Planes) -> Planes:
+        """Inverse mix of all columns, MixColumns after adding 4*(a[i] + a[i+2])."""
+        length = Word.LENGTH
+        column_bits = length * ITEM_BITS
+        added = []
+        for column in range(0, len(state), column_bits):
+            items = [
+                state[column + row * ITEM_BITS : column + (row + 1) * ITEM_BITS]
+                for row in range(length)
+            ]
+            for row in range(length):
+                opposite = items[(row + 2) % length]
+                quadruple = self._xtime(self._xtime([a ^ b for a, b in zip(items[row], opposite)]))
+                added += [a ^ b for a, b in zip(items[row], quadruple)]
+        return self._mix_state(added)
+
+    def _shift_permutation(self, sign: int) -> tuple[int, ...]:
+        length = Word.LENGTH
+        return tuple(
+            (((column + sign * shift) % self.block_size) * length + row) * ITEM_BITS + bit
+            for column in range(self.block_size)
+            for row, shift in enumerate(self.shift_row_sizes)
+            for bit in range(ITEM_BITS)
+        )
@@ -1,6 +1,33 @@
+import struct
 import typing
 
 from gigarijndael.encryption.word import Word
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
 Block: typing.TypeAlias = tuple[int, ...]
 State: typing.TypeAlias = list[Word]
+PackedState: typing.TypeAlias = int  # Whole block state, the first word is the most significant
+
+ITEM_FORMATS: dict[int, str] = {1: "B", 2: "H", 4: "I", 8: "Q"}  # struct codes by item size
+
+
+def block_format(*, item_size: int, items_count: int) -> str:
+    """Return the big-endian struct format of a block with the given item layout."""
+    return f">{items_count}{ITEM_FORMATS[item_size]}"
+
+
+def bytes_to_blocks(data: "Buffer", *, item_size: int, items_count: int) -> typing.Iterator[Block]:
+    """
+    Split bytes into Blocks without intermediate copies.
+
+    The data length must be a multiple of the block length in bytes.
+    """
+    return struct.iter_unpack(block_format(item_size=item_size, items_count=items_count), data)
+
+
+def blocks_to_bytes(blocks: typing.Iterable[Block], *, item_size: int, items_count: int) -> bytes:
+    """Join Blocks back into bytes."""
+    pack = struct.Struct(block_format(item_size=item_size, items_count=items_count)).pack
+    return b"".join(pack(*block) for block in blocks)
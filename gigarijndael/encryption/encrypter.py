@@ -1,28 +1,74 @@
+import contextlib
 import functools
 import itertools
 import typing
 
 from more_itertools import grouper, padded
 
-from gigarijndael.encryption.block import Block, State
+from gigarijndael.encryption.block import Block, State, blocks_to_bytes, bytes_to_blocks
+from gigarijndael.encryption.instrumentation import Instrumentation, enabled_by_environment
 from gigarijndael.encryption.matrix import left_shift, right_shift
-from gigarijndael.encryption.sbox import GigaInvSBox, GigaSBox, InvSBox, SBox
-from gigarijndael.encryption.word import GigaWord, Word
+from gigarijndael.encryption.sbox import (
+    GigaInvSBox,
+    GigaInvSBox64,
+    GigaSBox,
+    GigaSBox64,
+    InvSBox,
+    SBox,
+)
+from gigarijndael.encryption.word import GigaWord, GigaWord64, Word
 from gigarijndael.finite_fields.field import FiniteField
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+
+class KeySchedule(typing.NamedTuple):
+    """
+    Round keys of an expanded key, the initial key comes first in both orders.
+
+    Engines running the equivalent inverse cipher keep the inner decryption round keys
+    with InvMixColumns applied, see `RijndaelEncrypter.equivalent_inverse_round_keys`.
+    """
+
+    forward: tuple[typing.Any, ...]
+    reverse: tuple[typing.Any, ...]
+
 
 class RijndaelEncrypter:
     ROUNDS_NUMBER_REFERENCE_VALUE = 6  # Used to dynamically determine the number of rounds
     AVAILABLE_SIZES = {4, 6, 8}
-
-    def __init__(self, block_size: int, key_size: int, experimental: bool = False):
+    # Methods timed by `instrument`, mapped to the stage they belong to
+    INSTRUMENTED_STAGES: typing.ClassVar[dict[str, str]] = {
+        "_sub_elements": "sub_bytes",
+        "_inv_sub_elements": "sub_bytes",
+        "_shift_rows": "shift_rows",
+        "_inv_shift_rows": "shift_rows",
+        "_mix_columns": "mix_columns",
+        "_inv_mix_columns": "mix_columns",
+        "_add_round_key": "add_round_key",
+        "key_schedule": "key_expansion",
+    }
+    # Word and S-Box classes of the Giga mode by the size of the field elements in bits
+    GIGA_FIELDS: typing.ClassVar[dict[int, tuple[type[Word], type[SBox], type[InvSBox]]]] = {
+        32: (GigaWord, GigaSBox, GigaInvSBox),
+        64: (GigaWord64, GigaSBox64, GigaInvSBox64),
+    }
+
+    def __init__(
+        self, block_size: int, key_size: int, experimental: bool = False, giga_bits: int = 32
+    ):
         if block_size not in self.AVAILABLE_SIZES:
             raise ValueError(f"Invalid block size: {block_size}")
         if key_size not in self.AVAILABLE_SIZES:
             raise ValueError(f"Invalid key size: {key_size}")
+        if giga_bits not in self.GIGA_FIELDS:
+            raise ValueError(f"Invalid Giga field size: {giga_bits}")
 
         self.block_size: int = block_size
         self.key_size: int = key_size
+        self.experimental: bool = experimental
+        self.giga_bits: int = giga_bits
 
         if not experimental:
             self.word_cls = Word
@@ -30,11 +76,34 @@ class RijndaelEncrypter:
             self.s_box = SBox()
             self.inv_s_box = InvSBox()
         else:
-            self.word_cls = GigaWord
-            self.s_box = GigaSBox()
-            self.inv_s_box = GigaInvSBox()
+            word_cls, s_box_cls, inv_s_box_cls = self.GIGA_FIELDS[giga_bits]
+            self.word_cls = word_cls
+            self.s_box = s_box_cls()
+            self.inv_s_box = inv_s_box_cls()
             self.finite_field = self.s_box.finite_field
 
+        self.instrumentation: Instrumentation | None = None
+        if enabled_by_environment():
+            self.instrumentation = Instrumentation(self).install()
+
+    @contextlib.contextmanager
+    def instrument(self) -> typing.Iterator[Instrumentation]:
+        """
+        Count and time the cipher stages while the context is active.
+
+        Yields the instrumentation, `snapshot()` returns its counters as a dict. Stages
+        are timed only inside the context, outside it the encrypter runs uninstrumented.
+        """
+        if self.instrumentation is not None:
+            yield self.instrumentation
+            return
+        self.instrumentation = Instrumentation(self).install()
+        try:
+            yield self.instrumentation
+        finally:
+            self.instrumentation.uninstall()
+            self.instrumentation = None
+
     @functools.cached_property
     def rounds_number(self) -> int:
         return max(self.key_size, self.block_size) + self.ROUNDS_NUMBER_REFERENCE_VALUE
@@ -61,6 +130,11 @@ class RijndaelEncrypter:
         second_row_shift = 2 if self.block_size < 8 else 3
         return 0, 1, second_row_shift, second_row_shift + 1
 
+    @property
+    def block_bytes(self) -> int:
+        """Block size in bytes."""
+        return self.block_size * self.word_cls.size()
+
     @property
     def total_words(self) -> int:
         """Total number of words in the key schedule."""
@@ -80,22 +154,120 @@ class RijndaelEncrypter:
         Returns:
             List of processed blocks.
         """
+        return self.encrypt_blocks(blocks, self.key_schedule(key), decrypt=decrypt)
+
+    def encrypt_blocks(
+        self, blocks: typing.Iterable[Block], key_schedule: KeySchedule, decrypt: bool
+    ) -> list[Block]:
+        """
+        Encrypt or decrypt multiple blocks with an already prepared key schedule.
+
+        Args:
+            blocks: Iterable of blocks to process.
+            key_schedule: Round keys returned by `key_schedule`.
+            decrypt: If True, perform decryption.
+
+        Returns:
+            List of processed blocks.
+        """
+        round_keys = key_schedule.reverse if decrypt else key_schedule.forward
+        return [self._block_encrypt(block, round_keys, decrypt=decrypt) for block in blocks]
+
+    def encrypt_bytes(self, data: "Buffer", key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        """
+        Encrypt or decrypt whole blocks given as bytes.
+
+        Args:
+            data: Data which length is a multiple of `block_bytes`.
+            key_schedule: Round keys returned by `key_schedule`.
+            decrypt: If True, perform decryption.
+
+        Returns:
+            Processed data of the same length.
+        """
+        layout = self._block_layout
+        blocks = bytes_to_blocks(data, **layout)
+        return blocks_to_bytes(self.encrypt_blocks(blocks, key_schedule, decrypt), **layout)
+
+    def split_key(self, key: bytes) -> list[Word]:
+        """Split bytes key into Word list. Padds with zeros if necessary."""
+        item_size_bytes = self.word_cls.ITEM_SIZE
+        word_len = self.word_cls.LENGTH
+        key_size_in_items = self.key_size * word_len
+
+        # Padding data with zeros if not enough key bytes
+        items = [
+            int.from_bytes(item, byteorder="big")
+            for item in grouper(key, item_size_bytes, fillvalue=0)
+        ]
+
+        if len(items) < key_size_in_items:
+            items.extend([0] * (key_size_in_items - len(items)))
+        else:
+            items = items[:key_size_in_items]
+
+        return [
+            self.word_cls.from_items(word_items)
+            for word_items in itertools.batched(items, word_len)
+        ]
+
+    def key_schedule(self, key: list[Word]) -> KeySchedule:
+        """
+        Expand the key and split it into round keys for both directions.
+
+        Args:
+            key: Original key words, extra words are ignored.
+
+        Returns:
+            Round keys in encryption and decryption order.
+        """
         key_schedule = self._key_expansion(key[: self.key_size])
-        return [self._block_encrypt(block, key_schedule, decrypt=decrypt) for block in blocks]
+        round_keys = tuple(itertools.batched(key_schedule, self.block_size))
+        return KeySchedule(forward=round_keys, reverse=round_keys[::-1])
+
+    def equivalent_inverse_round_keys(
+        self, round_keys: typing.Sequence[typing.Sequence[Word]]
+    ) -> tuple[tuple[Word, ...], ...]:
+        """
+        Decryption round keys of the equivalent inverse cipher (FIPS-197, section 5.3.5).
 
-    def _block_encrypt(self, block: Block, key_schedule: list[Word], decrypt: bool) -> Block:
+        InvMixColumns is linear, so it can be moved before AddRoundKey by applying it to
+        the round key. Applying it to all keys but the first and the last once at key setup
+        lets decryption rounds run InvSubBytes, InvShiftRows, InvMixColumns and AddRoundKey,
+        the same structure as encryption rounds.
+
+        Args:
+            round_keys: Round keys in decryption order.
+        """
+        first, *inner, last = round_keys
+        return (
+            tuple(first),
+            *(tuple(self._inv_mix_columns(list(round_key))) for round_key in inner),
+            tuple(last),
+        )
+
+    def _block_encrypt(
+        self, block: Block, round_keys: typing.Sequence[typing.Sequence[Word]], decrypt: bool
+    ) -> Block:
         """Process a single block."""
         state = self._init_state(block=block)
-        init_key, round_keys = self._round_keys(key_schedule=key_schedule, decrypt=decrypt)
         round_func = self._inverse_round if decrypt else self._round
 
-        state = self._add_round_key(state, init_key)
-        for i in range(self.rounds_number - 1):
+        state = self._add_round_key(state, round_keys[0])
+        for i in range(1, self.rounds_number):
             state = round_func(state, round_keys[i])
-        state = round_func(state, round_keys[self.rounds_number - 1], is_final=True)
+        state = round_func(state, round_keys[self.rounds_number], is_final=True)
 
         return tuple(itertools.chain.from_iterable(state))
 
+    @functools.cached_property
+    def _block_layout(self) -> dict[str, int]:
+        """Item size and count of a block, as expected by the block conversion helpers."""
+        return {
+            "item_size": self.word_cls.ITEM_SIZE,
+            "items_count": self.block_size * self.word_cls.LENGTH,
+        }
+
     def _round(
         self, state: State, round_key: typing.Iterable[Word], is_final: bool = False
     ) -> State:
@@ -200,15 +372,6 @@ class RijndaelEncrypter:
             new_state.append(self.word_cls.from_items(column_elements))
         return new_state
 
-    def _round_keys(
-        self, key_schedule: list[Word], decrypt: bool
-    ) -> tuple[tuple[Word, ...], list[tuple[Word, ...]]]:
-        """Split key schedule into round keys."""
-        round_keys = list(itertools.batched(key_schedule, self.block_size))
-        if decrypt:
-            round_keys.reverse()
-        return round_keys[0], round_keys[1:]
-
     def _init_state(self, block: Block) -> State:
         """Initialize state from block."""
         return [
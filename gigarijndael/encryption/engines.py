@@ -0,0 +1,23 @@
+from gigarijndael.encryption.bitsliced import BitslicedRijndaelEncrypter
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+from gigarijndael.encryption.table import TableRijndaelEncrypter
+from gigarijndael.encryption.vectorized import NumpyRijndaelEncrypter
+
+DEFAULT_ENGINE: str = "packed"
+
+ENGINES: dict[str, type[RijndaelEncrypter]] = {
+    "reference": RijndaelEncrypter,
+    "packed": PackedRijndaelEncrypter,
+    "table": TableRijndaelEncrypter,
+    "bitsliced": BitslicedRijndaelEncrypter,
+    "numpy": NumpyRijndaelEncrypter,
+}
+
+
+def get_engine(name: str) -> type[RijndaelEncrypter]:
+    """Return the encrypter class registered under the given engine name."""
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Invalid engine: {name}") from None
@@ -0,0 +1,128 @@
+"""
+Opt-in timing of the cipher stages.
+
+Instrumentation replaces the stage methods of a single encrypter instance with timed
+wrappers and removes them when it is disabled, so an encrypter that is not instrumented
+runs exactly the same code as before and pays nothing.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import os
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.encryption.encrypter import RijndaelEncrypter
+
+ENVIRONMENT_VARIABLE: str = "GIGARIJNDAEL_INSTRUMENT"  # Set to 1 to instrument all encrypters
+
+
+def enabled_by_environment() -> bool:
+    return os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+class Instrumentation:
+    """
+    Call counters and cumulative nanosecond timers of the stages of an encrypter.
+
+    Stages are the methods listed in `INSTRUMENTED_STAGES` of the encrypter class,
+    e.g. "sub_bytes", "shift_rows", "mix_columns", "add_round_key" and "key_expansion".
+    A stage called from within itself (InvMixColumns built on MixColumns) is timed once.
+    """
+
+    def __init__(self, encrypter: RijndaelEncrypter) -> None:
+        self.encrypter: RijndaelEncrypter = encrypter
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.nanoseconds: collections.Counter[str] = collections.Counter()
+        self.blocks: int = 0
+        self._active: set[str] = set()
+        self._s_box_start: tuple[int, int] = self._s_box_info()
+        self._installed: list[str] = []
+
+    def install(self) -> Instrumentation:
+        """Wrap the stage methods of the encrypter instance."""
+        encrypter = self.encrypter
+        for method_name, stage in encrypter.INSTRUMENTED_STAGES.items():
+            setattr(encrypter, method_name, self._timed(getattr(encrypter, method_name), stage))
+            self._installed.append(method_name)
+        encrypter.encrypt_bytes = self._counted(encrypter.encrypt_bytes)  # type: ignore[method-assign]
+        self._installed.append("encrypt_bytes")
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the original methods of the encrypter instance."""
+        for method_name in self._installed:
+            delattr(self.encrypter, method_name)
+        self._installed.clear()
+
+    def reset(self) -> None:
+        """Zero all counters and timers."""
+        self.calls.clear()
+        self.nanoseconds.clear()
+        self.blocks = 0
+        self._s_box_start = self._s_box_info()
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """
+        Current counters as a dict.
+
+        Returns:
+            Calls and nanoseconds per stage, blocks processed by `encrypt_bytes`,
+            and hits and misses of the process-wide S-Box caches of large fields since
+            the instrumentation was enabled or reset.
+        """
+        hits, misses = self._s_box_info()
+        return {
+            "stages": {
+                stage: {"calls": self.calls[stage], "nanoseconds": self.nanoseconds[stage]}
+                for stage in self.calls
+            },
+            "blocks": self.blocks,
+            "s_box_cache": {
+                "hits": hits - self._s_box_start[0],
+                "misses": misses - self._s_box_start[1],
+            },
+        }
+
+    def _timed(self, method: typing.Callable[..., typing.Any], stage: str) -> typing.Callable:
+        calls, nanoseconds, active = self.calls, self.nanoseconds, self._active
+        perf_counter_ns = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            if stage in active:
+                return method(*args, **kwargs)
+            active.add(stage)
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                nanoseconds[stage] += perf_counter_ns() - start
+                calls[stage] += 1
+                active.discard(stage)
+
+        return wrapper
+
+    def _counted(self, encrypt_bytes: typing.Callable[..., bytes]) -> typing.Callable[..., bytes]:
+        timed = self._timed(encrypt_bytes, "encrypt_bytes")
+
+        @functools.wraps(encrypt_bytes)
+        def wrapper(data: Buffer, *args: typing.Any, **kwargs: typing.Any) -> bytes:
+            self.blocks += len(memoryview(data).cast("B")) // self.encrypter.block_bytes
+            return timed(data, *args, **kwargs)
+
+        return wrapper
+
+    def _s_box_info(self) -> tuple[int, int]:
+        """Total hits and misses of the computed values caches of the S-Boxes."""
+        hits = misses = 0
+        for s_box in (self.encrypter.s_box, self.encrypter.inv_s_box):
+            if (info := s_box.cache_info()) is not None:
+                hits += info.hits
+                misses += info.misses
+        return hits, misses
@@ -1,6 +1,8 @@
+import functools
 import typing
 
 from gigarijndael.encryption.bits import reverse_bits, right_rotate_bits, xor_bits
+from gigarijndael.finite_fields.linear import apply_byte_tables, byte_tables
 
 
 def affine_transformation(number: int, affine: int, const: int, size: int = 8) -> int:
@@ -18,6 +20,49 @@ def affine_transformation(number: int, affine: int, const: int, size: int = 8) -
     return result ^ const
 
 
+@functools.cache
+def compile_affine_transformation(
+    affine: int, const: int, size: int = 8
+) -> typing.Callable[[int], int]:
+    """
+    Compile the affine transformation into byte-sliced lookup tables.
+
+    Apart from the constant the transformation is linear over GF(2), so the image of a number
+    is the XOR of the images of its bytes. The constant is folded into the table of the low
+    byte, an 8-bit transformation is a single lookup and a 32-bit one XORs four lookups.
+    """
+    columns = [affine_transformation(1 << i, affine, 0, size=size) for i in range(size)]
+    low_table, *high_tables = byte_tables(columns)
+    low_table = tuple(value ^ const for value in low_table)
+
+    if not high_tables:
+
+        def transform_byte(number: int) -> int:
+            return low_table[number]
+
+        return transform_byte
+
+    if len(high_tables) == 3:
+        table_1, table_2, table_3 = high_tables
+
+        def transform_word(number: int) -> int:
+            return (
+                low_table[number & 0xFF]
+                ^ table_1[(number >> 8) & 0xFF]
+                ^ table_2[(number >> 16) & 0xFF]
+                ^ table_3[number >> 24]
+            )
+
+        return transform_word
+
+    high = tuple(high_tables)
+
+    def transform(number: int) -> int:
+        return low_table[number & 0xFF] ^ apply_byte_tables(high, number >> 8)
+
+    return transform
+
+
 def left_shift(items: list[typing.Any], shift: int) -> list[typing.Any]:
     """Cyclic left shift of a list."""
     if not items:
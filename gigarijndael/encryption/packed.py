@@ -0,0 +1,192 @@
+import functools
+import struct
+import typing
+
+from gigarijndael.encryption.block import (
+    Block,
+    PackedState,
+    block_format,
+    blocks_to_bytes,
+    bytes_to_blocks,
+)
+from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+from gigarijndael.encryption.word import Word
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+
+class PackedRijndaelEncrypter(RijndaelEncrypter):
+    """
+    Rijndael encrypter keeping the whole block state in a single integer.
+
+    Blocks go straight from bytes to an integer state, ShiftRows is done with row masks
+    and rotations, MixColumns with shifts and masks applied to all items at once,
+    so no objects are created per state element. Works in both GF(2^8) and Giga modes.
+    AddRoundKey is a single XOR inlined into the rounds and is not instrumented.
+    """
+
+    INSTRUMENTED_STAGES = {
+        "_sub_state": "sub_bytes",
+        "_shift_state": "shift_rows",
+        "_mix_state": "mix_columns",
+        "_inv_mix_state": "mix_columns",
+        "key_schedule": "key_expansion",
+    }
+
+    @functools.cached_property
+    def sub_table(self) -> bytes:
+        """S-Box as a translation table, available in GF(2^8) mode only."""
+        return self.s_box.table
+
+    @functools.cached_property
+    def inv_sub_table(self) -> bytes:
+        """Inverse S-Box as a translation table, available in GF(2^8) mode only."""
+        return self.inv_s_box.table
+
+    @property
+    def block_bits(self) -> int:
+        return self.block_size * self.word_cls.size_bits()
+
+    @functools.cached_property
+    def row_masks(self) -> tuple[int, ...]:
+        """Masks selecting the items of each state row across all columns."""
+        item_bits = self.word_cls.item_size_bits()
+        word_bits = self.word_cls.size_bits()
+        length = self.word_cls.LENGTH
+        return tuple(
+            sum(
+                ((1 << item_bits) - 1) << ((length - row - 1) * item_bits + column * word_bits)
+                for column in range(self.block_size)
+            )
+            for row in range(length)
+        )
+
+    @functools.cached_property
+    def _item_masks(self) -> tuple[int, int]:
+        """Masks of the most significant bits and of the remaining bits of all items."""
+        item_bits = self.word_cls.item_size_bits()
+        full_mask = (1 << self.block_bits) - 1
+        high_bits = (full_mask // ((1 << item_bits) - 1)) << (item_bits - 1)
+        return high_bits, full_mask ^ high_bits
+
+    @functools.cached_property
+    def _column_rotation_masks(self) -> tuple[tuple[int, int], ...]:
+        """Masks of the rows receiving items from below and from above, for every shift."""
+        length = self.word_cls.LENGTH
+        return tuple(
+            (sum(self.row_masks[: length - shift]), sum(self.row_masks[length - shift :]))
+            for shift in range(length)
+        )
+
+    @functools.cached_property
+    def _reduction(self) -> int:
+        """Low part of the field polynomial, added back when an item overflows in xtime."""
+        return self.finite_field.general_polynomial & (self.finite_field.q - 1)
+
+    def encrypt_blocks(
+        self, blocks: typing.Iterable[Block], key_schedule: KeySchedule, decrypt: bool
+    ) -> list[Block]:
+        layout = self._block_layout
+        data = self.encrypt_bytes(blocks_to_bytes(blocks, **layout), key_schedule, decrypt)
+        return list(bytes_to_blocks(data, **layout))
+
+    def encrypt_bytes(self, data: "Buffer", key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        round_keys = key_schedule.reverse if decrypt else key_schedule.forward
+        process = self._decrypt_state if decrypt else self._encrypt_state
+        block_bytes = self.block_bytes
+        view = memoryview(data)
+        return b"".join(
+            process(int.from_bytes(view[offset : offset + block_bytes]), round_keys).to_bytes(
+                block_bytes
+            )
+            for offset in range(0, len(view), block_bytes)
+        )
+
+    def key_schedule(self, key: list[Word]) -> KeySchedule:
+        """Expand the key into round keys packed into block integers, see `_decrypt_state`."""
+        forward, reverse = super().key_schedule(key)
+        return KeySchedule(
+            *(
+                tuple(
+                    int.from_bytes(b"".join(bytes(word) for word in round_key))
+                    for round_key in round_keys
+                )
+                for round_keys in (forward, self.equivalent_inverse_round_keys(reverse))
+            )
+        )
+
+    def _encrypt_state(self, state: PackedState, round_keys: typing.Sequence[int]) -> PackedState:
+        state ^= round_keys[0]
+        for i in range(1, self.rounds_number):
+            state = self._mix_state(self._shift_state(self._sub_state(state))) ^ round_keys[i]
+        return self._shift_state(self._sub_state(state)) ^ round_keys[self.rounds_number]
+
+    def _decrypt_state(self, state: PackedState, round_keys: typing.Sequence[int]) -> PackedState:
+        """Equivalent inverse cipher, the inner round keys went through InvMixColumns."""
+        state ^= round_keys[0]
+        for i in range(1, self.rounds_number):
+            state = self._sub_state(self._shift_state(state, inverse=True), inverse=True)
+            state = self._inv_mix_state(state) ^ round_keys[i]
+        state = self._sub_state(self._shift_state(state, inverse=True), inverse=True)
+        return state ^ round_keys[self.rounds_number]
+
+    def _sub_state(self, state: PackedState, inverse: bool = False) -> PackedState:
+        """Apply the S-Box (or the inverse one) to every item of the state."""
+        block_bytes = self.block_bytes
+        if self.word_cls.ITEM_SIZE == 1:
+            table = self.inv_sub_table if inverse else self.sub_table
+            return int.from_bytes(state.to_bytes(block_bytes).translate(table))
+
+        s_box = self.inv_s_box if inverse else self.s_box
+        item_format = self._item_format
+        items = struct.unpack(item_format, state.to_bytes(block_bytes))
+        return int.from_bytes(struct.pack(item_format, *s_box.substitute_many(items)))
+
+    @functools.cached_property
+    def _item_format(self) -> str:
+        return block_format(**self._block_layout)
+
+    def _shift_state(self, state: PackedState, inverse: bool = False) -> PackedState:
+        """Cyclic shift of rows, done as a rotation of the masked rows of the whole state."""
+        block_bits = self.block_bits
+        full_mask = (1 << block_bits) - 1
+        word_bits = self.word_cls.size_bits()
+        result = 0
+        for row_mask, shift_size in zip(self.row_masks, self.shift_row_sizes):
+            row = state & row_mask
+            shift = shift_size * word_bits
+            if inverse:
+                shift = block_bits - shift
+            result |= ((row << shift) | (row >> (block_bits - shift))) & full_mask
+        return result
+
+    def _rotate_columns(self, state: PackedState, shift: int) -> PackedState:
+        """Left cyclic shift of items inside every column of the state."""
+        item_bits = self.word_cls.item_size_bits()
+        upper_rows, lower_rows = self._column_rotation_masks[shift]
+        return ((state << (shift * item_bits)) & upper_rows) | (
+            (state >> ((self.word_cls.LENGTH - shift) * item_bits)) & lower_rows
+        )
+
+    def _xtime(self, state: PackedState) -> PackedState:
+        """Multiply every item of the state by x in the finite field."""
+        high_bits, rest_bits = self._item_masks
+        overflow = (state & high_bits) >> (self.word_cls.item_size_bits() - 1)
+        return ((state & rest_bits) << 1) ^ (overflow * self._reduction)
+
+    def _mix_state(self, state: PackedState) -> PackedState:
+        """Mix all columns at once: 2*a0 + 3*a1 + a2 + a3 for every row."""
+        first = self._rotate_columns(state, 1)
+        second = self._rotate_columns(state, 2)
+        third = self._rotate_columns(state, 3)
+        return self._xtime(state ^ first) ^ first ^ second ^ third
+
+    def _inv_mix_state(self, state: PackedState) -> PackedState:
+        """
+        Inverse mix of all columns at once.
+
+        InvMixColumns equals MixColumns applied after adding 4*(a[i] + a[i+2]) to every item.
+        """
+        quadruple = self._xtime(self._xtime(state ^ self._rotate_columns(state, 2)))
+        return self._mix_state(state ^ quadruple)
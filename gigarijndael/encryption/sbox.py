@@ -1,8 +1,149 @@
-from functools import lru_cache
+import array
+import mmap
+import os
+import struct
+import sys
+import threading
+import typing
 
-from gigarijndael.encryption.matrix import affine_transformation
+from gigarijndael.cache import CacheInfo, LRUCache
+from gigarijndael.encryption.matrix import compile_affine_transformation
 from gigarijndael.finite_fields.field import FiniteField
 
+T = typing.TypeVar("T")
+
+SBoxKey: typing.TypeAlias = tuple[int, int, int, int, bool]
+
+# Snapshot file: magic and number of sections, then for every S-Box its parameters and
+# the number of entries, followed by sorted little-endian 32-bit keys and their values
+SNAPSHOT_MAGIC: bytes = b"GRSB\x01"
+SNAPSHOT_HEADER: struct.Struct = struct.Struct("<5sI")
+SNAPSHOT_SECTION: struct.Struct = struct.Struct("<QQQQ?I")
+SNAPSHOT_ITEM_BITS: int = 32
+
+
+class SBoxRegistry:
+    """
+    Process-wide storage of S-Box tables and of the tables derived from them.
+
+    Tables are keyed by the S-Box parameters (field, affine row and constant, direction),
+    built once and shared by all S-Box and encrypter instances. S-Boxes of fields too large
+    for a table share a bounded cache of computed values instead, which can be saved
+    to a file and loaded by the next run.
+    """
+
+    CACHE_SIZE: int = 1 << 14  # Computed values kept per S-Box of a large field
+
+    def __init__(self, cache_size: int = CACHE_SIZE) -> None:
+        self.cache_size: int = cache_size
+        self._tables: dict[typing.Hashable, typing.Any] = {}
+        self._caches: dict[SBoxKey, LRUCache[int, int]] = {}
+        # Derived tables are built from the S-Box table, so the lock is reentrant
+        self._lock = threading.RLock()
+
+    def table(self, key: typing.Hashable, factory: typing.Callable[[], T]) -> T:
+        """Return the table stored under the key, building it on the first request."""
+        with self._lock:
+            if key not in self._tables:
+                self._tables[key] = factory()
+            return self._tables[key]
+
+    def cache(self, key: SBoxKey) -> LRUCache[int, int]:
+        """Return the cache of computed values of the S-Box."""
+        with self._lock:
+            if key not in self._caches:
+                self._caches[key] = LRUCache(maxsize=self.cache_size)
+            return self._caches[key]
+
+    def resize(self, cache_size: int) -> None:
+        """
+        Change the number of computed values kept per S-Box, for existing caches too.
+
+        Raises:
+            ValueError: If the size is negative.
+        """
+        with self._lock:
+            for cache in self._caches.values():
+                cache.resize(cache_size)
+            self.cache_size = cache_size
+
+    def save(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write the computed values of all S-Boxes of fields up to GF(2^32) to a file.
+
+        Returns:
+            Number of saved values.
+        """
+        with self._lock:
+            sections = [
+                (key, sorted(cache.items()))
+                for key, cache in self._caches.items()
+                if key[0] <= SNAPSHOT_ITEM_BITS and len(cache)
+            ]
+        temporary_path = f"{os.fspath(path)}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(sections)))
+            for key, items in sections:
+                file.write(SNAPSHOT_SECTION.pack(*key, len(items)))
+                for column in zip(*items):
+                    values = array.array("I", column)
+                    if sys.byteorder == "big":
+                        values.byteswap()
+                    values.tofile(file)
+        # Readers never see a partially written snapshot
+        os.replace(temporary_path, path)
+        return sum(len(items) for _, items in sections)
+
+    def load(self, path: str | os.PathLike[str]) -> int:
+        """
+        Warm the caches up with the values saved by `save`.
+
+        Returns:
+            Number of loaded values.
+
+        Raises:
+            ValueError: If the file is not an S-Box snapshot or is truncated.
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < SNAPSHOT_HEADER.size:
+                raise ValueError(f"Invalid S-Box snapshot: {os.fspath(path)}")
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+                return self._load_snapshot(snapshot, os.fspath(path))
+
+    def clear(self) -> None:
+        """Drop all tables and caches."""
+        with self._lock:
+            self._tables.clear()
+            self._caches.clear()
+
+    def _load_snapshot(self, snapshot: mmap.mmap, path: str) -> int:
+        magic, sections = SNAPSHOT_HEADER.unpack_from(snapshot)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Invalid S-Box snapshot: {path}")
+        offset = SNAPSHOT_HEADER.size
+        loaded = 0
+        for _ in range(sections):
+            if offset + SNAPSHOT_SECTION.size > len(snapshot):
+                raise ValueError(f"Truncated S-Box snapshot: {path}")
+            *key, count = SNAPSHOT_SECTION.unpack_from(snapshot, offset)
+            offset += SNAPSHOT_SECTION.size
+            size = count * SNAPSHOT_ITEM_BITS // 8
+            if offset + 2 * size > len(snapshot):
+                raise ValueError(f"Truncated S-Box snapshot: {path}")
+            keys, values = array.array("I"), array.array("I")
+            keys.frombytes(snapshot[offset : offset + size])
+            values.frombytes(snapshot[offset + size : offset + 2 * size])
+            if sys.byteorder == "big":
+                keys.byteswap()
+                values.byteswap()
+            offset += 2 * size
+            self.cache(typing.cast(SBoxKey, tuple(key))).update(zip(keys, values))
+            loaded += count
+        return loaded
+
+
+REGISTRY = SBoxRegistry()
+
 
 class SBox:
     """
@@ -11,23 +152,81 @@ class SBox:
 
     AFFINE_ROW: int = 0b10001111
     AFFINE_CONST: int = 0x63
+    INVERSE: bool = False
+    TABLE_MAX_N: int = 8  # Larger fields compute values on demand
     finite_field: FiniteField = FiniteField(8)
 
+    def __init__(self) -> None:
+        self.key: SBoxKey = (
+            self.finite_field.n,
+            self.finite_field.general_polynomial,
+            self.AFFINE_ROW,
+            self.AFFINE_CONST,
+            self.INVERSE,
+        )
+        self._affine_transformation: typing.Callable[[int], int] = compile_affine_transformation(
+            self.AFFINE_ROW, self.AFFINE_CONST, size=self.finite_field.n
+        )
+        self._values: LRUCache[int, int] = REGISTRY.cache(self.key)
+        self._table: bytes | None = None
+        if self.finite_field.n <= self.TABLE_MAX_N:
+            self._table = REGISTRY.table(("s_box", self.key), self._build_table)
+
+    @property
+    def table(self) -> bytes:
+        """
+        All values of the S-Box, shared by all instances with the same parameters.
+
+        Raises:
+            ValueError: If the field is too large for a table.
+        """
+        if self._table is None:
+            raise ValueError(f"S-Box of GF(2^{self.finite_field.n}) has no table")
+        return self._table
+
+    def derived(self, name: str, factory: typing.Callable[[], T]) -> T:
+        """Return a table derived from the S-Box, built once per process."""
+        return REGISTRY.table((name, self.key), factory)
+
+    def cache_info(self) -> CacheInfo | None:
+        """Statistics of the computed values cache, None if the S-Box is a table."""
+        if self._table is not None:
+            return None
+        return self._values.info()
+
     def _multiplicative_inverse(self, item: int) -> int:
         """Find multiplicative inverse in GF(2^n)."""
         if item == 0:
             return 0
         return self.finite_field.inverse(item)
 
-    @lru_cache(maxsize=1024)
     def __getitem__(self, item: int) -> int:
         """Substitute a single value."""
-        return affine_transformation(
-            self._multiplicative_inverse(item),
-            affine=self.AFFINE_ROW,
-            const=self.AFFINE_CONST,
-            size=self.finite_field.n,
-        )
+        if self._table is not None:
+            return self._table[item]
+        return self._values.get_or_create(item, self._substitute)
+
+    def substitute_many(self, items: typing.Iterable[int]) -> list[int]:
+        """
+        Substitute many values, e.g. a whole state or a batch of states, in one call.
+
+        Values missing from the cache of a large field are computed together,
+        inverting them with `FiniteField.inverse_many`.
+        """
+        if self._table is not None:
+            table = self._table
+            return [table[item] for item in items]
+        return self._values.get_or_create_many(items, self._substitute_many)
+
+    def _substitute(self, item: int) -> int:
+        return self._affine_transformation(self._multiplicative_inverse(item))
+
+    def _substitute_many(self, items: list[int]) -> list[int]:
+        affine_transformation = self._affine_transformation
+        return [affine_transformation(item) for item in self.finite_field.inverse_many(items)]
+
+    def _build_table(self) -> bytes:
+        return bytes(self._substitute(item) for item in range(self.finite_field.q))
 
 
 class InvSBox(SBox):
@@ -37,19 +236,15 @@ class InvSBox(SBox):
 
     AFFINE_ROW: int = 0b00100101
     AFFINE_CONST: int = 0x5
+    INVERSE: bool = True
     finite_field: FiniteField = FiniteField(8)
 
-    @lru_cache(maxsize=1024)
-    def __getitem__(self, item: int) -> int:
+    def _substitute(self, item: int) -> int:
         """Substitute a single value using inverse S-Box."""
-        return self._multiplicative_inverse(
-            affine_transformation(
-                item,
-                affine=self.AFFINE_ROW,
-                const=self.AFFINE_CONST,
-                size=self.finite_field.n,
-            )
-        )
+        return self._multiplicative_inverse(self._affine_transformation(item))
+
+    def _substitute_many(self, items: list[int]) -> list[int]:
+        return self.finite_field.inverse_many(map(self._affine_transformation, items))
 
 
 class GigaSBox(SBox):
@@ -62,3 +257,16 @@ class GigaInvSBox(InvSBox):
     finite_field = FiniteField(32)
     AFFINE_ROW = 0xFC76DEE1
     AFFINE_CONST: int = 0xA38D0057
+
+
+class GigaSBox64(SBox):
+    finite_field = FiniteField(64)
+    # Hexadecimal digits of pi, the row has an odd weight so the transformation is invertible
+    AFFINE_ROW: int = 0x243F6A8885A308D3
+    AFFINE_CONST: int = 0x13198A2E03707344
+
+
+class GigaInvSBox64(InvSBox):
+    finite_field = FiniteField(64)
+    AFFINE_ROW: int = 0x39326A1252E41ECB
+    AFFINE_CONST: int = 0xEC545E73E5C0AD40
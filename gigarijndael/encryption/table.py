@@ -0,0 +1,223 @@
+import functools
+import itertools
+import struct
+import typing
+
+from gigarijndael.encryption.bits import right_rotate
+from gigarijndael.encryption.block import Block, block_format, blocks_to_bytes, bytes_to_blocks
+from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+from gigarijndael.encryption.word import Word
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+Columns: typing.TypeAlias = list[int]
+Table: typing.TypeAlias = tuple[int, ...]
+
+
+class TableRijndaelEncrypter(RijndaelEncrypter):
+    """
+    Table-driven Rijndael encrypter for the GF(2^8) mode.
+
+    SubBytes, ShiftRows and MixColumns of a round are merged into four 256-entry tables
+    of 32-bit words (T-tables), so a round costs four lookups per state column.
+    Decryption runs the equivalent inverse cipher with the same structure and its own tables.
+    The state is kept as a list of plain integers, one per column.
+    All stages of a block are fused, so they are instrumented as a single "rounds" stage.
+    """
+
+    INSTRUMENTED_STAGES = {
+        "_encrypt_columns": "rounds",
+        "_decrypt_columns": "rounds",
+        "key_schedule": "key_expansion",
+    }
+
+    def __init__(
+        self, block_size: int, key_size: int, experimental: bool = False, giga_bits: int = 32
+    ):
+        if experimental:
+            raise ValueError("Table engine supports only GF(2^8) mode")
+        super().__init__(
+            block_size=block_size, key_size=key_size, experimental=experimental, giga_bits=giga_bits
+        )
+
+    @functools.cached_property
+    def encryption_tables(self) -> tuple[Table, Table, Table, Table]:
+        """T-tables combining SubBytes, ShiftRows and MixColumns for a state row."""
+
+        def build() -> tuple[Table, Table, Table, Table]:
+            multiply = self.finite_field.multiply
+            first_table = tuple(
+                int(Word.from_items([multiply(0x02, s), s, s, multiply(0x03, s)]))
+                for s in self.s_box.table
+            )
+            return self._rotated_tables(first_table)
+
+        return self.s_box.derived("t_tables", build)
+
+    @functools.cached_property
+    def final_round_table(self) -> Table:
+        """S-Box values replicated into every item of a word, used by the final round."""
+        return self.s_box.derived(
+            "final_round_table",
+            lambda: tuple(int(Word.from_items([s] * Word.LENGTH)) for s in self.s_box.table),
+        )
+
+    @functools.cached_property
+    def sub_table(self) -> bytes:
+        """S-Box as a plain lookup table."""
+        return self.s_box.table
+
+    @functools.cached_property
+    def inv_sub_table(self) -> bytes:
+        """Inverse S-Box as a plain lookup table."""
+        return self.inv_s_box.table
+
+    @functools.cached_property
+    def decryption_tables(self) -> tuple[Table, Table, Table, Table]:
+        """Tables combining InvSubBytes, InvShiftRows and InvMixColumns for a state row."""
+
+        def build() -> tuple[Table, Table, Table, Table]:
+            u0 = self.inv_mix_tables[0]
+            return self._rotated_tables(tuple(u0[s] for s in self.inv_s_box.table))
+
+        return self.inv_s_box.derived("inv_t_tables", build)
+
+    @functools.cached_property
+    def inv_mix_tables(self) -> tuple[Table, Table, Table, Table]:
+        """Tables applying InvMixColumns to a state column, one per row, used at key setup."""
+
+        def build() -> tuple[Table, Table, Table, Table]:
+            multiply = self.finite_field.multiply
+            first_table = tuple(
+                int(Word.from_items([multiply(coef, item) for coef in (0x0E, 0x09, 0x0D, 0x0B)]))
+                for item in range(self.finite_field.q)
+            )
+            return self._rotated_tables(first_table)
+
+        return self.inv_s_box.derived("inv_mix_tables", build)
+
+    @functools.cached_property
+    def shift_columns(self) -> tuple[tuple[int, ...], ...]:
+        """Source columns of each state row after ShiftRows, for every output column."""
+        return tuple(
+            tuple((column + shift) % self.block_size for shift in self.shift_row_sizes)
+            for column in range(self.block_size)
+        )
+
+    @functools.cached_property
+    def inv_shift_columns(self) -> tuple[tuple[int, ...], ...]:
+        """Source columns of each state row after InvShiftRows, for every output column."""
+        return tuple(
+            tuple((column - shift) % self.block_size for shift in self.shift_row_sizes)
+            for column in range(self.block_size)
+        )
+
+    def encrypt_blocks(
+        self, blocks: typing.Iterable[Block], key_schedule: KeySchedule, decrypt: bool
+    ) -> list[Block]:
+        layout = self._block_layout
+        data = self.encrypt_bytes(blocks_to_bytes(blocks, **layout), key_schedule, decrypt)
+        return list(bytes_to_blocks(data, **layout))
+
+    def encrypt_bytes(self, data: "Buffer", key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        round_keys = key_schedule.reverse if decrypt else key_schedule.forward
+        process = self._decrypt_columns if decrypt else self._encrypt_columns
+        columns_format = block_format(item_size=Word.size(), items_count=self.block_size)
+        pack = struct.Struct(columns_format).pack
+        return b"".join(
+            pack(*process(columns, round_keys))
+            for columns in struct.iter_unpack(columns_format, data)
+        )
+
+    def key_schedule(self, key: list[Word]) -> KeySchedule:
+        """Expand the key into round keys of column integers, see `_decrypt_columns`."""
+        forward, reverse = super().key_schedule(key)
+        return KeySchedule(
+            *(
+                tuple(tuple(int(word) for word in round_key) for round_key in round_keys)
+                for round_keys in (forward, self.equivalent_inverse_round_keys(reverse))
+            )
+        )
+
+    def equivalent_inverse_round_keys(
+        self, round_keys: typing.Sequence[typing.Sequence[Word]]
+    ) -> tuple[tuple[Word, ...], ...]:
+        """Apply InvMixColumns to the inner round keys with the InvMixColumns tables."""
+        u0, u1, u2, u3 = self.inv_mix_tables
+        first, *inner, last = round_keys
+        return (
+            tuple(first),
+            *(
+                tuple(
+                    Word(u0[word[0]] ^ u1[word[1]] ^ u2[word[2]] ^ u3[word[3]])
+                    for word in round_key
+                )
+                for round_key in inner
+            ),
+            tuple(last),
+        )
+
+    def _encrypt_columns(
+        self, state: typing.Sequence[int], round_keys: typing.Sequence[tuple[int, ...]]
+    ) -> Columns:
+        """Encrypt a state of column integers with T-tables."""
+        te0, te1, te2, te3 = self.encryption_tables
+        te4 = self.final_round_table
+        shift_columns = self.shift_columns
+
+        state = [s ^ k for s, k in zip(state, round_keys[0])]
+        for round_key in itertools.islice(round_keys, 1, self.rounds_number):
+            state = [
+                te0[state[c0] >> 24]
+                ^ te1[(state[c1] >> 16) & 0xFF]
+                ^ te2[(state[c2] >> 8) & 0xFF]
+                ^ te3[state[c3] & 0xFF]
+                ^ k
+                for (c0, c1, c2, c3), k in zip(shift_columns, round_key)
+            ]
+        return [
+            (te4[state[c0] >> 24] & 0xFF000000)
+            ^ (te4[(state[c1] >> 16) & 0xFF] & 0x00FF0000)
+            ^ (te4[(state[c2] >> 8) & 0xFF] & 0x0000FF00)
+            ^ (te4[state[c3] & 0xFF] & 0x000000FF)
+            ^ k
+            for (c0, c1, c2, c3), k in zip(shift_columns, round_keys[-1])
+        ]
+
+    def _decrypt_columns(
+        self, state: typing.Sequence[int], round_keys: typing.Sequence[tuple[int, ...]]
+    ) -> Columns:
+        """Decrypt a state of column integers with the equivalent inverse cipher."""
+        td0, td1, td2, td3 = self.decryption_tables
+        isb = self.inv_sub_table
+        inv_shift_columns = self.inv_shift_columns
+
+        state = [s ^ k for s, k in zip(state, round_keys[0])]
+        for round_key in itertools.islice(round_keys, 1, self.rounds_number):
+            state = [
+                td0[state[c0] >> 24]
+                ^ td1[(state[c1] >> 16) & 0xFF]
+                ^ td2[(state[c2] >> 8) & 0xFF]
+                ^ td3[state[c3] & 0xFF]
+                ^ k
+                for (c0, c1, c2, c3), k in zip(inv_shift_columns, round_key)
+            ]
+        return [
+            (
+                (isb[state[c0] >> 24] << 24)
+                | (isb[(state[c1] >> 16) & 0xFF] << 16)
+                | (isb[(state[c2] >> 8) & 0xFF] << 8)
+                | isb[state[c3] & 0xFF]
+            )
+            ^ k
+            for (c0, c1, c2, c3), k in zip(inv_shift_columns, round_keys[-1])
+        ]
+
+    @staticmethod
+    def _rotated_tables(first_table: Table) -> tuple[Table, Table, Table, Table]:
+        """Build the per-row tables, each one is the previous rotated by one item."""
+        return first_table, *(  # type: ignore[return-value]
+            tuple(right_rotate(value, shift=shift) for value in first_table)
+            for shift in range(1, Word.LENGTH)
+        )
@@ -0,0 +1,165 @@
+import functools
+import typing
+
+from gigarijndael.encryption.block import Block, blocks_to_bytes, bytes_to_blocks
+from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+from gigarijndael.encryption.sbox import SBox
+from gigarijndael.encryption.word import Word
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+class NumpyRijndaelEncrypter(RijndaelEncrypter):
+    """
+    Rijndael encrypter processing many blocks at once with NumPy.
+
+    The data is loaded into a (blocks, block_size, 4) array of items, SubBytes is
+    a fancy-indexed table lookup, ShiftRows an index permutation and MixColumns
+    a vectorized xtime over the whole batch.
+    """
+
+    BATCH_BLOCKS: int = 1 << 16  # Number of blocks processed by one array operation
+    INSTRUMENTED_STAGES = {
+        "_sub_state": "sub_bytes",
+        "_shift_state": "shift_rows",
+        "_mix_state": "mix_columns",
+        "_inv_mix_state": "mix_columns",
+        "key_schedule": "key_expansion",
+    }
+
+    def __init__(
+        self, block_size: int, key_size: int, experimental: bool = False, giga_bits: int = 32
+    ):
+        if np is None:
+            raise ImportError("NumPy engine requires numpy, install gigarijndael[numpy]")
+        super().__init__(
+            block_size=block_size, key_size=key_size, experimental=experimental, giga_bits=giga_bits
+        )
+
+    @functools.cached_property
+    def dtype(self) -> "np.dtype":
+        """Native unsigned integer type holding one state item."""
+        return np.dtype(f"u{self.word_cls.ITEM_SIZE}")
+
+    @functools.cached_property
+    def sub_table(self) -> "np.ndarray":
+        """S-Box as an array, available in GF(2^8) mode only."""
+        return self._array_table(self.s_box)
+
+    @functools.cached_property
+    def inv_sub_table(self) -> "np.ndarray":
+        """Inverse S-Box as an array, available in GF(2^8) mode only."""
+        return self._array_table(self.inv_s_box)
+
+    @functools.cached_property
+    def shift_indices(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Column and row indices gathering the state after ShiftRows."""
+        return self._shift_indices(sign=1)
+
+    @functools.cached_property
+    def inv_shift_indices(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Column and row indices gathering the state after InvShiftRows."""
+        return self._shift_indices(sign=-1)
+
+    def encrypt_blocks(
+        self, blocks: typing.Iterable[Block], key_schedule: KeySchedule, decrypt: bool
+    ) -> list[Block]:
+        layout = self._block_layout
+        data = self.encrypt_bytes(blocks_to_bytes(blocks, **layout), key_schedule, decrypt)
+        return list(bytes_to_blocks(data, **layout))
+
+    def encrypt_bytes(self, data: "Buffer", key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        round_keys = key_schedule.reverse if decrypt else key_schedule.forward
+        process = self._decrypt_state if decrypt else self._encrypt_state
+        big_endian = self.dtype.newbyteorder(">")
+        items = np.frombuffer(data, dtype=big_endian).astype(self.dtype)
+        state = items.reshape(-1, self.block_size, self.word_cls.LENGTH)
+        batch = self.BATCH_BLOCKS
+        return b"".join(
+            process(state[offset : offset + batch], round_keys).astype(big_endian).tobytes()
+            for offset in range(0, len(state), batch)
+        )
+
+    def key_schedule(self, key: list[Word]) -> KeySchedule:
+        """Expand the key into round keys as (block_size, 4) arrays."""
+        return KeySchedule(
+            *(
+                tuple(
+                    np.array([list(word) for word in round_key], self.dtype) for round_key in keys
+                )
+                for keys in super().key_schedule(key)
+            )
+        )
+
+    def _encrypt_state(
+        self, state: "np.ndarray", round_keys: typing.Sequence["np.ndarray"]
+    ) -> "np.ndarray":
+        state = state ^ round_keys[0]
+        for i in range(1, self.rounds_number):
+            state = self._mix_state(self._shift_state(self._sub_state(state))) ^ round_keys[i]
+        return self._shift_state(self._sub_state(state)) ^ round_keys[self.rounds_number]
+
+    def _decrypt_state(
+        self, state: "np.ndarray", round_keys: typing.Sequence["np.ndarray"]
+    ) -> "np.ndarray":
+        state = state ^ round_keys[0]
+        for i in range(1, self.rounds_number):
+            state = self._sub_state(self._shift_state(state, inverse=True), inverse=True)
+            state = self._inv_mix_state(state ^ round_keys[i])
+        state = self._sub_state(self._shift_state(state, inverse=True), inverse=True)
+        return state ^ round_keys[self.rounds_number]
+
+    def _sub_state(self, state: "np.ndarray", inverse: bool = False) -> "np.ndarray":
+        """Apply the S-Box (or the inverse one) to every item of the batch."""
+        if self.word_cls.ITEM_SIZE == 1:
+            return (self.inv_sub_table if inverse else self.sub_table)[state]
+
+        # 2^32 items do not fit a table, so only distinct items go through the S-Box
+        s_box = self.inv_s_box if inverse else self.s_box
+        items, positions = np.unique(state, return_inverse=True)
+        substituted = np.array(s_box.substitute_many(items.tolist()), self.dtype)
+        return substituted[positions].reshape(state.shape)
+
+    def _shift_state(self, state: "np.ndarray", inverse: bool = False) -> "np.ndarray":
+        """Cyclic shift of rows of the whole batch as a single gather."""
+        columns, rows = self.inv_shift_indices if inverse else self.shift_indices
+        return state[:, columns, rows]
+
+    def _xtime(self, state: "np.ndarray") -> "np.ndarray":
+        """Multiply every item of the batch by x in the finite field."""
+        reduction = self.finite_field.general_polynomial & (self.finite_field.q - 1)
+        overflow = state >> (self.word_cls.item_size_bits() - 1)
+        return (state << 1) ^ (overflow * self.dtype.type(reduction))
+
+    def _mix_state(self, state: "np.ndarray") -> "np.ndarray":
+        """Mix columns of the whole batch: 2*a0 + 3*a1 + a2 + a3 for every row."""
+        first = np.roll(state, -1, axis=2)
+        second = np.roll(state, -2, axis=2)
+        third = np.roll(state, -3, axis=2)
+        return self._xtime(state ^ first) ^ first ^ second ^ third
+
+    def _inv_mix_state(self, state: "np.ndarray") -> "np.ndarray":
+        """Inverse mix of the whole batch, MixColumns after adding 4*(a[i] + a[i+2])."""
+        quadruple = self._xtime(self._xtime(state ^ np.roll(state, -2, axis=2)))
+        return self._mix_state(state ^ quadruple)
+
+    def _array_table(self, s_box: SBox) -> "np.ndarray":
+        """Read-only array of the S-Box values, shared by all instances."""
+
+        def build() -> "np.ndarray":
+            table = np.frombuffer(s_box.table, np.uint8).astype(self.dtype)
+            table.flags.writeable = False
+            return table
+
+        return s_box.derived(f"numpy_{self.dtype.str}", build)
+
+    def _shift_indices(self, sign: int) -> tuple["np.ndarray", "np.ndarray"]:
+        rows = np.arange(self.word_cls.LENGTH)
+        columns = np.arange(self.block_size)[:, None] + sign * np.array(self.shift_row_sizes)
+        return columns % self.block_size, np.broadcast_to(rows, columns.shape)
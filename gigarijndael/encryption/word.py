@@ -148,3 +148,7 @@ class Word:
 
 class GigaWord(Word):
     ITEM_SIZE = 4
+
+
+class GigaWord64(Word):
+    ITEM_SIZE = 8
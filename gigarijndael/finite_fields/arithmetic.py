@@ -0,0 +1,326 @@
+"""
+Multiplication backends of GF(2^n) Finite Fields, selected by the field size.
+"""
+
+from __future__ import annotations
+
+import abc
+import functools
+import typing
+
+from gigarijndael.finite_fields.linear import byte_tables
+
+
+def reduce(product: int, general_polynomial: int) -> int:
+    """Reduce a polynomial modulo the general polynomial, one bit at a time."""
+    polynomial_length = general_polynomial.bit_length()
+    while (shift := product.bit_length() - polynomial_length) >= 0:
+        product ^= general_polynomial << shift
+    return product
+
+
+def multiply_by_x(element: int, n: int, general_polynomial: int) -> int:
+    """Multiply a field element by x."""
+    element <<= 1
+    if element >> n:
+        element ^= general_polynomial
+    return element
+
+
+# Bits of every byte moved to the even positions of 16 bits, the square of the byte polynomial
+SPREAD_BYTES: tuple[int, ...] = tuple(
+    sum(((byte >> bit) & 1) << (2 * bit) for bit in range(8)) for byte in range(256)
+)
+
+
+class Arithmetic(abc.ABC):
+    """Multiplication and inversion of elements of GF(2^n) with a fixed polynomial."""
+
+    def __init__(self, n: int, general_polynomial: int) -> None:
+        self.n: int = n
+        self.q: int = 1 << n
+        self.general_polynomial: int = general_polynomial
+
+    @abc.abstractmethod
+    def multiply(self, first: int, second: int) -> int:
+        """Product of two field elements."""
+
+    def square(self, element: int) -> int:
+        """Square of a field element."""
+        return self.multiply(element, element)
+
+    def multiplier(self, constant: int) -> typing.Callable[[int], int]:
+        """Function multiplying field elements by a constant, for many products by one value."""
+        return functools.partial(self.multiply, constant)
+
+    def inverse(self, element: int) -> int | None:
+        """Multiplicative inverse of a nonzero element, None if the backend can not compute it."""
+        return None
+
+    def _multiply_unreduced(self, first: int, second: int) -> int:
+        """Product of operands that may be longer than n bits, for table backends."""
+        return reduce(CombArithmetic.multiply_polynomials(first, second), self.general_polynomial)
+
+
+class TableArithmetic(Arithmetic):
+    """
+    Full multiplication table, the product of a and b is stored at (a << n) | b.
+
+    Used for small fields, the table of GF(2^8) takes 64 KiB.
+    """
+
+    MAX_N: int = 8
+
+    def __init__(self, n: int, general_polynomial: int) -> None:
+        super().__init__(n, general_polynomial)
+        table = bytearray(self.q * self.q)
+        for first in range(1, self.q):
+            # Products by powers of x, the rest of the row follows from linearity
+            row = table[first << n : (first + 1) << n]
+            power_product = first
+            for bit in range(n):
+                row[1 << bit] = power_product
+                power_product = multiply_by_x(power_product, n, general_polynomial)
+            for second in range(3, self.q):
+                low_bit = second & -second
+                if second != low_bit:
+                    row[second] = row[second ^ low_bit] ^ row[low_bit]
+            table[first << n : (first + 1) << n] = row
+        self._table: bytes = bytes(table)
+        self._inverses: tuple[int, ...] = tuple(
+            self._table.find(1, element << n, (element + 1) << n) - (element << n)
+            for element in range(self.q)
+        )
+
+    def multiply(self, first: int, second: int) -> int:
+        if (first | second) >> self.n:
+            return self._multiply_unreduced(first, second)
+        return self._table[(first << self.n) | second]
+
+    def inverse(self, element: int) -> int | None:
+        inverse = self._inverses[element]
+        return inverse if inverse >= 0 else None
+
+
+class LogArithmetic(Arithmetic):
+    """
+    Logarithm and antilogarithm tables built from a generator of the multiplicative group.
+
+    Used for fields up to GF(2^16), where a full table would be too large.
+    """
+
+    MAX_N: int = 16
+
+    def __init__(self, n: int, general_polynomial: int, generator: int) -> None:
+        super().__init__(n, general_polynomial)
+        self.order: int = self.q - 1
+        exp = [0] * (2 * self.order)
+        log = [0] * self.q
+        element = 1
+        for i in range(self.order):
+            exp[i] = exp[i + self.order] = element
+            log[element] = i
+            element = CombArithmetic.multiply_polynomials(element, generator)
+            element = reduce(element, general_polynomial)
+        self._exp: tuple[int, ...] = tuple(exp)
+        self._log: tuple[int, ...] = tuple(log)
+
+    def multiply(self, first: int, second: int) -> int:
+        if not first or not second:
+            return 0
+        if (first | second) >> self.n:
+            return self._multiply_unreduced(first, second)
+        return self._exp[self._log[first] + self._log[second]]
+
+    def inverse(self, element: int) -> int | None:
+        return self._exp[self.order - self._log[element]]
+
+
+class CombArithmetic(Arithmetic):
+    """
+    Windowed comb multiplication with table-driven reduction, for any field size.
+
+    The first operand is expanded into its products with all 4-bit polynomials,
+    the second one is consumed 4 bits at a time, and the overflowing part of the product
+    is reduced 8 bits at a time with a precomputed table.
+    Polynomials longer than `KARATSUBA_BITS` are split with Karatsuba first.
+    """
+
+    REDUCTION_BITS: int = 8
+    # Operands up to this length are faster with the comb alone, measured on CPython
+    KARATSUBA_BITS: int = 4096
+
+    def __init__(self, n: int, general_polynomial: int) -> None:
+        super().__init__(n, general_polynomial)
+        # Every chunk of bits above the degree together with its residue, XOR-ing clears it
+        self._reduction: tuple[int, ...] = tuple(
+            (chunk << n) ^ reduce(chunk << n, general_polynomial)
+            for chunk in range(1 << self.REDUCTION_BITS)
+        )
+        # Sparse polynomials (trinomials and pentanomials of large fields) reduce with shifts,
+        # x^n is replaced by the low terms, and each pass halves the excess bits at least
+        low_polynomial = general_polynomial ^ (1 << n)
+        self._low_terms: tuple[int, ...] | None = None
+        if low_polynomial.bit_length() <= n // 2 and low_polynomial.bit_count() <= 4:
+            self._low_terms = tuple(
+                bit for bit in range(low_polynomial.bit_length()) if low_polynomial >> bit & 1
+            )
+
+    @classmethod
+    def multiply_polynomials(cls, first: int, second: int) -> int:
+        """Carry-less product of two polynomials without reduction."""
+        bits = max(first.bit_length(), second.bit_length())
+        if bits <= cls.KARATSUBA_BITS:
+            return cls._comb_multiply(first, second)
+
+        # Three half-size products instead of four: (a1 + a0)(b1 + b0) - a1*b1 - a0*b0
+        half = bits // 2
+        mask = (1 << half) - 1
+        first_low, first_high = first & mask, first >> half
+        second_low, second_high = second & mask, second >> half
+        low = cls.multiply_polynomials(first_low, second_low)
+        high = cls.multiply_polynomials(first_high, second_high)
+        middle = cls.multiply_polynomials(first_low ^ first_high, second_low ^ second_high)
+        return (high << 2 * half) ^ ((middle ^ high ^ low) << half) ^ low
+
+    @staticmethod
+    def _comb_multiply(first: int, second: int) -> int:
+        """Carry-less product with the 4-bit windowed comb."""
+        # Products of the first operand with every 4-bit polynomial
+        double, quadruple, octuple = first << 1, first << 2, first << 3
+        multiples = (
+            0,
+            first,
+            double,
+            double ^ first,
+            quadruple,
+            quadruple ^ first,
+            quadruple ^ double,
+            quadruple ^ double ^ first,
+            octuple,
+            octuple ^ first,
+            octuple ^ double,
+            octuple ^ double ^ first,
+            octuple ^ quadruple,
+            octuple ^ quadruple ^ first,
+            octuple ^ quadruple ^ double,
+            octuple ^ quadruple ^ double ^ first,
+        )
+        product = 0
+        shift = 0
+        while second:
+            product ^= multiples[second & 0xF] << shift
+            second >>= 4
+            shift += 4
+        return product
+
+    def multiply(self, first: int, second: int) -> int:
+        return self.reduce(self.multiply_polynomials(first, second))
+
+    def multiplier(self, constant: int) -> typing.Callable[[int], int]:
+        """
+        Multiplication by a constant with 8-bit window tables (Shoup's method).
+
+        The product is linear in the other operand, so it is the XOR of the products of the
+        constant with every byte of it, each a lookup in a reduced table built once.
+        A multiplication then costs n/8 lookups and no reduction.
+        """
+        columns = [constant]
+        for _ in range(self.n - 1):
+            columns.append(multiply_by_x(columns[-1], self.n, self.general_polynomial))
+        tables = byte_tables(columns)
+
+        def multiply_by_constant(element: int) -> int:
+            product = 0
+            for table in tables:
+                product ^= table[element & 0xFF]
+                element >>= 8
+            return product
+
+        return multiply_by_constant
+
+    def square(self, element: int) -> int:
+        """Squaring is linear in GF(2^n): bits are spread apart, then the result is reduced."""
+        spread = SPREAD_BYTES
+        product = 0
+        shift = 0
+        while element:
+            product |= spread[element & 0xFF] << shift
+            element >>= 8
+            shift += 16
+        return self.reduce(product)
+
+    def reduce(self, product: int) -> int:
+        """Reduce a product of two field elements modulo the general polynomial."""
+        n = self.n
+        if (terms := self._low_terms) is not None:
+            mask = self.q - 1
+            while high := product >> n:
+                product &= mask
+                for term in terms:
+                    product ^= high << term
+            return product
+        reduction = self._reduction
+        while product >> n:
+            shift = product.bit_length() - n - self.REDUCTION_BITS
+            if shift < 0:
+                shift = 0
+            product ^= reduction[(product >> (n + shift)) & 0xFF] << shift
+        return product
+
+
+@functools.cache
+def select_arithmetic(n: int, general_polynomial: int) -> Arithmetic:
+    """
+    Choose the fastest backend for the field, tables are shared by equal fields.
+
+    Args:
+        n: Power of 2 (exponent).
+        general_polynomial: Polynomial of the field.
+
+    Returns:
+        Full table for n <= 8, log tables for n <= 16 with an irreducible polynomial
+        and windowed comb multiplication otherwise.
+    """
+    if n <= TableArithmetic.MAX_N:
+        return TableArithmetic(n, general_polynomial)
+    if n <= LogArithmetic.MAX_N and (generator := find_generator(n, general_polynomial)):
+        return LogArithmetic(n, general_polynomial, generator)
+    return CombArithmetic(n, general_polynomial)
+
+
+def find_generator(n: int, general_polynomial: int) -> int | None:
+    """Find a generator of the multiplicative group, None if the polynomial is reducible."""
+    arithmetic = CombArithmetic(n, general_polynomial)
+    order = (1 << n) - 1
+    prime_factors = _prime_factors(order)
+
+    def power(element: int, exponent: int) -> int:
+        result = 1
+        while exponent:
+            if exponent & 1:
+                result = arithmetic.multiply(result, element)
+            element = arithmetic.multiply(element, element)
+            exponent >>= 1
+        return result
+
+    for candidate in range(2, 1 << n):
+        if power(candidate, order) != 1:
+            return None
+        if all(power(candidate, order // prime) != 1 for prime in prime_factors):
+            return candidate
+    return None
+
+
+def _prime_factors(number: int) -> list[int]:
+    factors = []
+    divisor = 2
+    while divisor * divisor <= number:
+        if number % divisor == 0:
+            factors.append(divisor)
+            while number % divisor == 0:
+                number //= divisor
+        divisor += 1
+    if number > 1:
+        factors.append(number)
+    return factors
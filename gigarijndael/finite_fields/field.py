@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import functools
 import operator
+import typing
+
+from gigarijndael.finite_fields.arithmetic import Arithmetic, reduce, select_arithmetic
+from gigarijndael.finite_fields.tower import TowerField
 
 
 class FiniteField:
@@ -16,6 +20,8 @@ class FiniteField:
         7: 0b10011101,
         8: 0b100011011,
         32: 0b100000000000000000000000010001101,
+        64: (1 << 64) | 0b11011,  # x^64 + x^4 + x^3 + x + 1
+        128: (1 << 128) | 0b10000111,  # x^128 + x^7 + x^2 + x + 1, as in GCM
     }
 
     def __init__(self, n: int, general_polynomial: int | None = None) -> None:
@@ -40,17 +46,36 @@ class FiniteField:
         return self.add(*polynomials)
 
     def multiply(self, first: int, second: int) -> int:
-        """Multiplication in Finite Field using Russian Peasant Multiplication."""
-        product = 0
-        while first and second:
-            if second & 1:
-                product = self.add(product, first)
-            if first & (self.q >> 1):
-                first = self.add(first << 1, self.general_polynomial)
-            else:
-                first <<= 1
-            second >>= 1
-        return product
+        """
+        Multiplication in Finite Field.
+
+        Uses the backend chosen by the field size: a full table for n <= 8,
+        log/antilog tables for n <= 16 and windowed comb multiplication otherwise.
+        """
+        return self._arithmetic.multiply(first, second)
+
+    def square(self, polynomial: int) -> int:
+        """Square in Finite Field, cheaper than a multiplication in large fields."""
+        return self._arithmetic.square(polynomial)
+
+    def multiplier(self, constant: int) -> typing.Callable[[int], int]:
+        """
+        Function multiplying by a fixed element.
+
+        Large fields precompute 8-bit window tables of the constant, which pays off
+        when many elements are multiplied by the same one (e.g. the GHASH key).
+        """
+        return self._arithmetic.multiplier(constant)
+
+    def multiply_many(self, first: typing.Iterable[int], second: typing.Iterable[int]) -> list[int]:
+        """
+        Pairwise multiplication of two sequences of the same length.
+
+        Raises:
+            ValueError: If the sequences have different lengths.
+        """
+        multiply = self._arithmetic.multiply
+        return [multiply(a, b) for a, b in zip(first, second, strict=True)]
 
     def divide(self, dividend: int, divisor: int) -> int:
         """Division in Finite Field."""
@@ -58,28 +83,98 @@ class FiniteField:
         return self.multiply(dividend, inverse_divisor)
 
     def inverse(self, polynomial: int) -> int:
-        """Multiplicative inverse in Finite Field."""
+        """Multiplicative inverse in Finite Field, of the residue of unreduced polynomials."""
+        if polynomial >> self.n:
+            # Inversion backends index tables by the element, they take reduced ones only
+            polynomial = reduce(polynomial, self.general_polynomial)
         if polynomial == 0:
             raise ZeroDivisionError("Cannot find inverse of zero")
+        if (inverse := self._arithmetic.inverse(polynomial)) is not None:
+            return inverse
+        if self.n == 2 * TowerField.SUBFIELD_N:
+            return self._tower_field.inverse(polynomial)
         _, inverse, _ = self.egcd(polynomial, self.general_polynomial)
         return inverse
 
+    def inverse_many(self, polynomials: typing.Iterable[int]) -> list[int]:
+        """
+        Multiplicative inverses of many elements, zeros are mapped to zero.
+
+        Fields inverting through the extended GCD use Montgomery's trick: a single
+        inversion of the product of all elements and 3(k-1) multiplications for k elements.
+        Fields with table or tower inversion invert every element directly, which is cheaper.
+        """
+        polynomials = list(polynomials)
+        if self._direct_inverse:
+            return [self.inverse(polynomial) if polynomial else 0 for polynomial in polynomials]
+
+        multiply = self._arithmetic.multiply
+        nonzero = [index for index, polynomial in enumerate(polynomials) if polynomial]
+        if not nonzero:
+            return polynomials
+        # prefixes[i] is the product of the first i + 1 nonzero elements
+        prefixes = [polynomials[nonzero[0]]]
+        for index in nonzero[1:]:
+            prefixes.append(multiply(prefixes[-1], polynomials[index]))
+
+        inverses = [0] * len(polynomials)
+        inverse = self.inverse(prefixes[-1])
+        for position in range(len(nonzero) - 1, 0, -1):
+            index = nonzero[position]
+            inverses[index] = multiply(inverse, prefixes[position - 1])
+            inverse = multiply(inverse, polynomials[index])
+        inverses[nonzero[0]] = inverse
+        return inverses
+
+    @functools.cached_property
+    def _direct_inverse(self) -> bool:
+        """Whether a single inversion is cheaper than the multiplications saved by batching."""
+        return self._arithmetic.inverse(1) is not None or self.n == 2 * TowerField.SUBFIELD_N
+
+    @functools.cached_property
+    def _arithmetic(self) -> Arithmetic:
+        """Multiplication backend, built on first use and shared by equal fields."""
+        return select_arithmetic(self.n, self.general_polynomial)
+
+    @functools.cached_property
+    def _tower_field(self) -> TowerField:
+        """Isomorphic GF((2^16)^2) used for fast inversion in GF(2^32)."""
+        return TowerField(self)
+
     def divmod(self, dividend: int, divisor: int) -> tuple[int, int]:
-        """Division with remainder for polynomials."""
+        """Division with remainder for polynomials, one shifted subtraction per quotient bit."""
+        if divisor == 0:
+            raise ZeroDivisionError("Cannot divide by zero polynomial")
         floor = 0
         divisor_length = divisor.bit_length()
         while (shift := dividend.bit_length() - divisor_length) >= 0:
-            floor = self.add(floor, 1 << shift)
-            dividend = self.add(dividend, divisor << shift)
+            floor ^= 1 << shift
+            dividend ^= divisor << shift
         return floor, dividend
 
     def egcd(self, first: int, second: int) -> tuple[int, int, int]:
-        """Extended Euclidean Algorithm for polynomials."""
-        if first == 0:
-            return second, 0, 1
-        floor, mod = self.divmod(second, first)
-        gcd, x, y = self.egcd(mod, first)
-        return gcd, self.subtract(y, self.multiply(floor, x)), x
+        """
+        Extended Euclidean Algorithm for polynomials.
+
+        Iterative and shift-based: instead of computing quotients, the larger remainder
+        is reduced by the shifted smaller one, and the Bezout coefficients follow with
+        the same shifts, so no multiplication or recursion is needed.
+
+        Returns:
+            gcd, x and y with x * first + y * second = gcd.
+        """
+        # Invariants: remainder = x * first + y * second for both rows
+        remainder, x, y = second, 0, 1
+        next_remainder, next_x, next_y = first, 1, 0
+        while next_remainder:
+            while (shift := remainder.bit_length() - next_remainder.bit_length()) >= 0:
+                remainder ^= next_remainder << shift
+                x ^= next_x << shift
+                y ^= next_y << shift
+            remainder, next_remainder = next_remainder, remainder
+            x, next_x = next_x, x
+            y, next_y = next_y, y
+        return remainder, x, y
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FiniteField):
@@ -0,0 +1,102 @@
+"""
+Linear maps over GF(2).
+
+A map of `size` bits is given by its columns: `columns[i]` is the image of the bit `1 << i`.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import typing
+
+BYTE_SIZE: int = 8
+
+ByteTables: typing.TypeAlias = tuple[tuple[int, ...], ...]
+
+
+def apply_columns(columns: typing.Sequence[int], number: int) -> int:
+    """Apply the linear map to a number bit by bit."""
+    return functools.reduce(
+        operator.xor, (column for i, column in enumerate(columns) if number >> i & 1), 0
+    )
+
+
+def invert_columns(columns: typing.Sequence[int]) -> tuple[int, ...]:
+    """
+    Invert the linear map with Gaussian elimination.
+
+    Raises:
+        ValueError: If the map is not invertible.
+    """
+    size = len(columns)
+    # Every row holds the column image in the low bits and its preimage in the high bits
+    rows = [column | (1 << (size + i)) for i, column in enumerate(columns)]
+    for bit in range(size):
+        pivot = next((i for i in range(bit, size) if rows[i] >> bit & 1), None)
+        if pivot is None:
+            raise ValueError("Linear map is not invertible")
+        rows[bit], rows[pivot] = rows[pivot], rows[bit]
+        for i in range(size):
+            if i != bit and rows[i] >> bit & 1:
+                rows[i] ^= rows[bit]
+    return tuple(row >> size for row in rows)
+
+
+def solve_columns(columns: typing.Sequence[int], target: int) -> int:
+    """
+    Find a preimage of the target under a possibly singular linear map.
+
+    Raises:
+        ValueError: If the target is not in the image of the map.
+    """
+    # Reduced images keyed by their highest bit, with the combinations of columns producing them
+    basis: dict[int, tuple[int, int]] = {}
+    for i, column in enumerate(columns):
+        combination = 1 << i
+        while column:
+            pivot = column.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = column, combination
+                break
+            column ^= basis[pivot][0]
+            combination ^= basis[pivot][1]
+
+    solution = 0
+    while target:
+        pivot = target.bit_length() - 1
+        if pivot not in basis:
+            raise ValueError("Linear system has no solution")
+        target ^= basis[pivot][0]
+        solution ^= basis[pivot][1]
+    return solution
+
+
+def byte_tables(columns: typing.Sequence[int]) -> ByteTables:
+    """
+    Compile the linear map into byte-sliced lookup tables.
+
+    The image of a number is the XOR of `tables[i][byte_i]` over all its bytes.
+    """
+    tables = []
+    for offset in range(0, len(columns), BYTE_SIZE):
+        # Bytes with the bit set reuse the entries of the bytes below it, one XOR per entry
+        table = [0] * 256
+        for bit, column in enumerate(columns[offset : offset + BYTE_SIZE]):
+            step = 1 << bit
+            for byte in range(step):
+                table[step | byte] = table[byte] ^ column
+        for bit in range(len(columns) - offset, BYTE_SIZE):
+            step = 1 << bit
+            table[step : 2 * step] = table[:step]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def apply_byte_tables(tables: ByteTables, number: int) -> int:
+    """Apply a linear map compiled with `byte_tables`."""
+    result = 0
+    for table in tables:
+        result ^= table[number & 0xFF]
+        number >>= BYTE_SIZE
+    return result
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import array
+import typing
+
+from gigarijndael.finite_fields.linear import byte_tables, invert_columns, solve_columns
+
+if typing.TYPE_CHECKING:
+    from gigarijndael.finite_fields.field import FiniteField
+
+
+class TowerField:
+    """
+    Composite field GF((2^16)^2) isomorphic to a GF(2^32) Finite Field.
+
+    An element a*t + b of the tower has coefficients a, b in GF(2^16) and t^2 = t + l.
+    Elements are moved between the fields with byte-sliced basis-change tables,
+    and GF(2^16) arithmetic uses log/antilog tables, so an inverse costs a few lookups
+    instead of an extended Euclidean algorithm.
+    """
+
+    SUBFIELD_N: int = 16
+    SUBFIELD_ORDER: int = (1 << SUBFIELD_N) - 1  # Order of the multiplicative group of GF(2^16)
+
+    def __init__(self, field: FiniteField) -> None:
+        """
+        Build the tower and the isomorphism for the given field.
+
+        Args:
+            field: Finite Field GF(2^32) with an irreducible polynomial.
+
+        Raises:
+            ValueError: If the field is not GF(2^32).
+        """
+        if field.n != 2 * self.SUBFIELD_N:
+            raise ValueError(
+                f"Tower field requires GF(2^{2 * self.SUBFIELD_N}), got GF(2^{field.n})"
+            )
+        self.field: FiniteField = field
+
+        generator = self._subfield_generator()
+        powers = [1]
+        for _ in range(self.SUBFIELD_N - 1):
+            powers.append(field.multiply(powers[-1], generator))
+        self.subfield_polynomial: int = self._minimal_polynomial(generator)
+        self._exp, self._log = self._log_tables(self.subfield_polynomial)
+
+        # The smallest power of the generator with trace 1 makes t^2 + t + l irreducible
+        self.constant_log: int = next(
+            k for k in range(1, self.SUBFIELD_ORDER) if self._trace(self._pow(generator, k)) == 1
+        )
+        root = self._solve_artin_schreier(self._pow(generator, self.constant_log))
+
+        # Columns of the map from the tower into the field: bits of b, then bits of a
+        columns = powers + [field.multiply(power, root) for power in powers]
+        self._from_tower = byte_tables(columns)
+        self._to_tower = byte_tables(invert_columns(columns))
+
+    def inverse(self, element: int) -> int:
+        """Multiplicative inverse of a nonzero field element."""
+        exp, log = self._exp, self._log
+        to_tower, from_tower = self._to_tower, self._from_tower
+        element = (
+            to_tower[0][element & 0xFF]
+            ^ to_tower[1][(element >> 8) & 0xFF]
+            ^ to_tower[2][(element >> 16) & 0xFF]
+            ^ to_tower[3][element >> 24]
+        )
+        high, low = element >> self.SUBFIELD_N, element & 0xFFFF
+
+        # (a*t + b)^-1 = (a*t + a + b) / (a^2*l + a*b + b^2)
+        norm = exp[2 * log[low]] if low else 0
+        if high:
+            norm ^= exp[2 * log[high] + self.constant_log]
+            if low:
+                norm ^= exp[log[high] + log[low]]
+        norm_log = self.SUBFIELD_ORDER - log[norm]
+        high_sum = high ^ low
+        high = exp[log[high] + norm_log] if high else 0
+        low = exp[log[high_sum] + norm_log] if high_sum else 0
+
+        return (
+            from_tower[0][low & 0xFF]
+            ^ from_tower[1][low >> 8]
+            ^ from_tower[2][high & 0xFF]
+            ^ from_tower[3][high >> 8]
+        )
+
+    def _pow(self, element: int, exponent: int) -> int:
+        """Exponentiation by squaring in the field."""
+        result = 1
+        while exponent:
+            if exponent & 1:
+                result = self.field.multiply(result, element)
+            element = self.field.multiply(element, element)
+            exponent >>= 1
+        return result
+
+    def _subfield_generator(self) -> int:
+        """Find a field element generating the multiplicative group of the GF(2^16) subfield."""
+        cofactor = (self.field.q - 1) // self.SUBFIELD_ORDER
+        prime_factors = (3, 5, 17, 257)  # 2^16 - 1 = 3 * 5 * 17 * 257
+        for candidate in range(2, self.field.q):
+            generator = self._pow(candidate, cofactor)
+            if all(
+                self._pow(generator, self.SUBFIELD_ORDER // prime) != 1 for prime in prime_factors
+            ):
+                return generator
+        raise ValueError("Field polynomial is not irreducible")
+
+    def _minimal_polynomial(self, element: int) -> int:
+        """Minimal polynomial over GF(2) of an element of the GF(2^16) subfield."""
+        coefficients = [1]
+        conjugate = element
+        for _ in range(self.SUBFIELD_N):
+            shifted = [0, *coefficients]
+            coefficients = [
+                high ^ self.field.multiply(conjugate, low)
+                for high, low in zip(shifted, [*coefficients, 0])
+            ]
+            conjugate = self.field.multiply(conjugate, conjugate)
+        if any(coefficient > 1 for coefficient in coefficients):
+            raise ValueError("Field polynomial is not irreducible")
+        return sum(coefficient << i for i, coefficient in enumerate(coefficients))
+
+    def _log_tables(self, polynomial: int) -> tuple[array.array, array.array]:
+        """Antilog table (repeated three times to skip the modulo) and log table of GF(2^16)."""
+        exp = array.array("H", bytes(6 * self.SUBFIELD_ORDER))
+        log = array.array("H", bytes(2 << self.SUBFIELD_N))
+        element = 1
+        for i in range(self.SUBFIELD_ORDER):
+            exp[i] = exp[i + self.SUBFIELD_ORDER] = exp[i + 2 * self.SUBFIELD_ORDER] = element
+            log[element] = i
+            element <<= 1
+            if element >> self.SUBFIELD_N:
+                element ^= polynomial
+        return exp, log
+
+    def _trace(self, element: int) -> int:
+        """Absolute trace of an element of the GF(2^16) subfield."""
+        trace = 0
+        for _ in range(self.SUBFIELD_N):
+            trace ^= element
+            element = self.field.multiply(element, element)
+        return trace
+
+    def _solve_artin_schreier(self, constant: int) -> int:
+        """Find a root of t^2 + t = constant in the field, the map t -> t^2 + t is linear."""
+        columns = [self.field.multiply(1 << i, 1 << i) ^ (1 << i) for i in range(self.field.n)]
+        return solve_columns(columns, constant)
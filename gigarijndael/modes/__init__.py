@@ -0,0 +1,24 @@
+from gigarijndael.modes.base import CipherContext, Mode
+from gigarijndael.modes.cbc import CBC, CBCContext
+from gigarijndael.modes.ctr import CTR, CTRContext
+from gigarijndael.modes.ecb import ECB, ECBContext
+from gigarijndael.modes.gcm import GCM, GCMContext
+from gigarijndael.modes.padding import pkcs7_pad, pkcs7_unpad
+from gigarijndael.modes.xts import XTS, XTSContext
+
+__all__ = [
+    "CBC",
+    "CTR",
+    "ECB",
+    "GCM",
+    "XTS",
+    "CBCContext",
+    "CTRContext",
+    "CipherContext",
+    "ECBContext",
+    "GCMContext",
+    "Mode",
+    "XTSContext",
+    "pkcs7_pad",
+    "pkcs7_unpad",
+]
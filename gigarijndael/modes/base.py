@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import abc
+import typing
+
+from gigarijndael.parallel import WorkerPool, get_pool
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+
+def check_output(output: Buffer, size: int) -> None:
+    """
+    Check that a writable buffer can take `size` bytes.
+
+    Raises:
+        ValueError: If the buffer is too small.
+    """
+    with memoryview(output) as view:
+        if view.nbytes < size:
+            raise ValueError(f"Output buffer is too small: {view.nbytes} bytes, {size} required")
+
+
+def write_into(output: Buffer, data: bytes) -> int:
+    """
+    Copy data to the start of a writable buffer.
+
+    Returns:
+        Number of bytes written.
+
+    Raises:
+        ValueError: If the buffer is too small.
+    """
+    check_output(output, len(data))
+    with memoryview(output).cast("B") as view:
+        view[: len(data)] = data
+    return len(data)
+
+
+def xor_bytes(first: Buffer, second: Buffer) -> bytes:
+    """XOR of two byte strings of equal length, done on whole integers."""
+    return (int.from_bytes(first) ^ int.from_bytes(second)).to_bytes(len(memoryview(first)))
+
+
+class CipherContext(abc.ABC):
+    """
+    Incremental encryption or decryption of a stream of data.
+
+    `update` may be called any number of times with chunks of any size, only whole blocks
+    are processed and the incomplete tail is kept until the next call, so memory stays
+    bounded by the chunk size. `finalize` processes the tail and closes the context.
+    """
+
+    PARALLEL_THRESHOLD: int = 1 << 20  # Smaller chunks are not worth sending to workers
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        workers: int | None = 1,
+    ) -> None:
+        self.encrypter: RijndaelEncrypter = encrypter
+        self.key_schedule: KeySchedule = key_schedule
+        self.decrypt: bool = decrypt
+        self.workers: int | None = workers
+        self._unit_bytes: int = encrypter.block_bytes  # Data is processed in multiples of it
+        self._held_blocks: int = 0  # Whole units kept until `finalize`, e.g. a padded block
+        self._buffer: bytes = b""
+        self._finalized: bool = False
+
+    def update(self, data: Buffer) -> bytes:
+        """
+        Process the next chunk of data.
+
+        Args:
+            data: Chunk of data to encrypt or decrypt, any contiguous buffer.
+
+        Returns:
+            Result for all blocks completed so far, may be empty.
+        """
+        self._check_active()
+        buffered, ready = self._split(data)
+        self._buffer = bytes(buffered[ready:])
+        return self._process(buffered[:ready]) if ready else b""
+
+    def update_into(self, data: Buffer, output: Buffer) -> int:
+        """
+        Process the next chunk of data, writing the result into a buffer.
+
+        The result is computed as bytes and copied into the buffer, which saves the caller
+        an allocation but not the copy. The output may be the same buffer as the data
+        for in-place processing.
+
+        Args:
+            data: Chunk of data to encrypt or decrypt, any contiguous buffer.
+            output: Writable buffer large enough for the result.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            ValueError: If the output buffer is too small, checked before any data is
+                processed, so the call can be repeated with a larger buffer.
+        """
+        self._check_active()
+        buffered, ready = self._split(data)
+        check_output(output, self._result_bytes(ready, final=False))
+        self._buffer = bytes(buffered[ready:])
+        return write_into(output, self._process(buffered[:ready])) if ready else 0
+
+    def finalize_into(self, output: Buffer) -> int:
+        """
+        Process the remaining data, writing the result into a buffer, and close the context.
+
+        The result is copied into the buffer as in `update_into`.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            ValueError: If the output buffer is too small for the largest possible result,
+                checked before the context is closed.
+        """
+        self._check_active()
+        check_output(output, self._result_bytes(len(self._buffer), final=True))
+        return write_into(output, self.finalize())
+
+    def finalize(self) -> bytes:
+        """
+        Process the remaining data and close the context.
+
+        Returns:
+            Result for the remaining data.
+        """
+        self._check_active()
+        self._finalized = True
+        tail, self._buffer = self._buffer, b""
+        return self._finalize(tail)
+
+    def _split(self, data: Buffer) -> tuple[bytes | memoryview, int]:
+        """Buffered data followed by the chunk, and the size of its part ready to process."""
+        view = memoryview(data).cast("B")
+        # Whole blocks of the caller's buffer are processed without copying it
+        buffered = self._buffer + view if self._buffer else view
+        unit_bytes = self._unit_bytes
+        ready = max(len(buffered) // unit_bytes - self._held_blocks, 0) * unit_bytes
+        return buffered, ready
+
+    def _result_bytes(self, size: int, final: bool) -> int:
+        """Largest result of `_process`, or of `_finalize` if final, for `size` bytes."""
+        return size
+
+    @abc.abstractmethod
+    def _process(self, data: bytes | memoryview) -> bytes:
+        """Process whole units of data, given as bytes or a view of the caller's buffer."""
+
+    @abc.abstractmethod
+    def _finalize(self, tail: bytes) -> bytes:
+        """Process the data left in the buffer, shorter than `_held_blocks + 1` units."""
+
+    def _worker_pool(self, size: int) -> WorkerPool | None:
+        """Pool of worker processes for a chunk of `size` bytes, None if it is not worth it."""
+        if self.workers == 1 or size < self.PARALLEL_THRESHOLD:
+            return None
+        return get_pool(self.encrypter, self.workers)
+
+    def _check_active(self) -> None:
+        if self._finalized:
+            raise ValueError("Context is already finalized")
+
+
+class Mode(abc.ABC):
+    """Mode of operation, creates contexts chaining the block transform."""
+
+    name: typing.ClassVar[str]
+
+    @abc.abstractmethod
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> CipherContext:
+        """Create a context for one message."""
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import typing
+
+from gigarijndael.modes.base import CipherContext, Mode, xor_bytes
+from gigarijndael.modes.padding import PKCS7_MAX_BLOCK_BYTES, pkcs7_pad, pkcs7_unpad
+
+if typing.TYPE_CHECKING:
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+
+class CBCContext(CipherContext):
+    """
+    Every plaintext block is XOR-ed with the previous ciphertext block before encryption.
+
+    Encryption is sequential. Decryption of a block needs only two ciphertext blocks,
+    so whole chunks are decrypted at once, large ones by worker processes.
+    """
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        iv: bytes,
+        padding: bool,
+        workers: int | None,
+    ) -> None:
+        super().__init__(encrypter, key_schedule, decrypt, workers)
+        if len(iv) != encrypter.block_bytes:
+            raise ValueError(f"Invalid IV size: {len(iv)}")
+        if padding and encrypter.block_bytes > PKCS7_MAX_BLOCK_BYTES:
+            raise ValueError(
+                f"PKCS#7 padding supports blocks of up to {PKCS7_MAX_BLOCK_BYTES} bytes,"
+                f" got {encrypter.block_bytes}, use padding=False"
+            )
+        self.padding: bool = padding
+        self._previous: bytes = iv
+        if decrypt and padding:
+            self._held_blocks = 1
+
+    def _process(self, data: bytes | memoryview) -> bytes:
+        if self.decrypt:
+            return self._decrypt(data)
+        return self._encrypt(data)
+
+    def _finalize(self, tail: bytes) -> bytes:
+        block_bytes = self.encrypter.block_bytes
+        if self.padding:
+            if self.decrypt:
+                return pkcs7_unpad(self._decrypt(tail) if tail else b"", block_bytes)
+            return self._encrypt(pkcs7_pad(tail, block_bytes))
+        if tail:
+            raise ValueError("Data is not a multiple of the block size")
+        return b""
+
+    def _result_bytes(self, size: int, final: bool) -> int:
+        if final and self.padding and not self.decrypt:
+            block_bytes = self.encrypter.block_bytes
+            return (size // block_bytes + 1) * block_bytes
+        return size
+
+    def _encrypt(self, data: bytes | memoryview) -> bytes:
+        block_bytes = self.encrypter.block_bytes
+        encrypt_bytes, key_schedule = self.encrypter.encrypt_bytes, self.key_schedule
+        previous = self._previous
+        blocks = []
+        for offset in range(0, len(data), block_bytes):
+            previous = encrypt_bytes(
+                xor_bytes(data[offset : offset + block_bytes], previous), key_schedule, False
+            )
+            blocks.append(previous)
+        self._previous = previous
+        return b"".join(blocks)
+
+    def _decrypt(self, data: bytes | memoryview) -> bytes:
+        block_bytes = self.encrypter.block_bytes
+        encrypt_bytes = self.encrypter.encrypt_bytes
+        if (pool := self._worker_pool(len(data))) is not None:
+            encrypt_bytes = pool.encrypt_bytes
+        decrypted = encrypt_bytes(data, self.key_schedule, True)
+        chained = self._previous + data[:-block_bytes]
+        self._previous = bytes(data[-block_bytes:])
+        return xor_bytes(decrypted, chained)
+
+
+class CBC(Mode):
+    """Cipher block chaining mode with PKCS#7 padding."""
+
+    name = "cbc"
+
+    def __init__(self, iv: bytes, padding: bool = True, workers: int | None = None) -> None:
+        """
+        Configure cipher block chaining mode.
+
+        Args:
+            iv: Initialization vector of the block size, unpredictable for every message.
+            padding: Use PKCS#7 padding, otherwise the data must be a multiple of the block size.
+            workers: Number of processes decrypting large chunks, 1 disables them,
+                all CPUs by default.
+        """
+        self.iv: bytes = bytes(iv)
+        self.padding: bool = padding
+        self.workers: int | None = workers
+
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> CipherContext:
+        return CBCContext(encrypter, key_schedule, decrypt, self.iv, self.padding, self.workers)
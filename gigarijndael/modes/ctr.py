@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import typing
+
+from gigarijndael.modes.base import CipherContext, Mode, xor_bytes
+
+if typing.TYPE_CHECKING:
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+
+def counter_keystream(
+    encrypter: RijndaelEncrypter,
+    start: int,
+    count: int,
+    key_schedule: KeySchedule,
+    counter_bits: int | None = None,
+) -> bytes:
+    """
+    Encrypt `count` consecutive counter blocks in a single batch.
+
+    Only the low `counter_bits` of the block are incremented and wrap around, the rest
+    of the block is kept, e.g. 32 bits in GCM. The whole block is the counter by default.
+    """
+    block_bytes = encrypter.block_bytes
+    mask = (1 << (counter_bits or 8 * block_bytes)) - 1
+    prefix = start & ((1 << (8 * block_bytes)) - 1) & ~mask
+    counters = b"".join((prefix | ((start + i) & mask)).to_bytes(block_bytes) for i in range(count))
+    return encrypter.encrypt_bytes(counters, key_schedule, decrypt=False)
+
+
+def xor_counter_keystream(
+    encrypter: RijndaelEncrypter,
+    view: memoryview,
+    block_offset: int,
+    start: int,
+    key_schedule: KeySchedule,
+    counter_bits: int | None = None,
+) -> None:
+    """XOR whole blocks of data in place with the keystream, used by worker processes."""
+    count = len(view) // encrypter.block_bytes
+    mask = (1 << (counter_bits or 8 * encrypter.block_bytes)) - 1
+    start = (start & ~mask) | ((start + block_offset) & mask)  # Carries stay in the counter
+    keystream = counter_keystream(encrypter, start, count, key_schedule, counter_bits)
+    view[:] = xor_bytes(bytes(view), keystream)
+
+
+class CTRContext(CipherContext):
+    """Data is XOR-ed with encrypted counter blocks, encryption and decryption are the same."""
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        nonce: bytes,
+        workers: int | None,
+    ) -> None:
+        super().__init__(encrypter, key_schedule, decrypt, workers)
+        if len(nonce) != encrypter.block_bytes:
+            raise ValueError(f"Invalid nonce size: {len(nonce)}")
+        self._counter: int = int.from_bytes(nonce)
+
+    def _process(self, data: bytes | memoryview) -> bytes:
+        count = len(data) // self.encrypter.block_bytes
+        start = self._counter
+        self._counter += count
+        if (pool := self._worker_pool(len(data))) is not None:
+            return pool.run_shared(xor_counter_keystream, data, start, self.key_schedule)
+        return xor_bytes(data, counter_keystream(self.encrypter, start, count, self.key_schedule))
+
+    def _finalize(self, tail: bytes) -> bytes:
+        if not tail:
+            return b""
+        keystream = counter_keystream(self.encrypter, self._counter, 1, self.key_schedule)
+        return xor_bytes(tail, keystream[: len(tail)])
+
+
+class CTR(Mode):
+    """
+    Counter mode, turns the block cipher into a stream cipher without padding.
+
+    Counter blocks start at the nonce taken as a big-endian integer. Large chunks are
+    processed by a pool of worker processes.
+    """
+
+    name = "ctr"
+
+    def __init__(self, nonce: bytes, workers: int | None = None) -> None:
+        """
+        Configure counter mode.
+
+        Args:
+            nonce: Initial counter block, unique for every message encrypted with a key.
+            workers: Number of worker processes, 1 disables them, all CPUs by default.
+        """
+        self.nonce: bytes = bytes(nonce)
+        self.workers: int | None = workers
+
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> CipherContext:
+        return CTRContext(encrypter, key_schedule, decrypt, self.nonce, self.workers)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import typing
+
+from gigarijndael.modes.base import CipherContext, Mode
+
+if typing.TYPE_CHECKING:
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+
+class ECBContext(CipherContext):
+    """
+    Every block is transformed independently, the last block is padded with zeros.
+
+    Trailing zero bytes of the output are dropped, as `Rijndael.encrypt` does. The stream
+    can not know which zeros are trailing until it ends, so only their number is kept.
+    """
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        workers: int | None = 1,
+    ) -> None:
+        super().__init__(encrypter, key_schedule, decrypt, workers)
+        self._pending_zeros: int = 0
+
+    def _process(self, data: bytes | memoryview) -> bytes:
+        encrypt_bytes = self.encrypter.encrypt_bytes
+        if (pool := self._worker_pool(len(data))) is not None:
+            encrypt_bytes = pool.encrypt_bytes
+        return self._strip_zeros(encrypt_bytes(data, self.key_schedule, self.decrypt))
+
+    def _finalize(self, tail: bytes) -> bytes:
+        # Zeros still pending at the end of the stream are trailing ones and are dropped
+        if not tail:
+            return b""
+        return self._process(tail + bytes(self.encrypter.block_bytes - len(tail)))
+
+    def _result_bytes(self, size: int, final: bool) -> int:
+        # Zeros kept from earlier chunks come out in front of the next result
+        if not size:
+            return 0
+        block_bytes = self.encrypter.block_bytes
+        return -(-size // block_bytes) * block_bytes + self._pending_zeros
+
+    def _strip_zeros(self, data: bytes) -> bytes:
+        stripped = data.rstrip(b"\x00")
+        if not stripped:
+            self._pending_zeros += len(data)
+            return b""
+        result = bytes(self._pending_zeros) + stripped if self._pending_zeros else stripped
+        self._pending_zeros = len(data) - len(stripped)
+        return result
+
+
+class ECB(Mode):
+    """Electronic codebook mode with zero padding, the default mode of `Rijndael`."""
+
+    name = "ecb"
+
+    def __init__(self, workers: int | None = 1) -> None:
+        """
+        Configure electronic codebook mode.
+
+        Args:
+            workers: Number of processes transforming large chunks, 1 disables them,
+                None uses all CPUs.
+        """
+        self.workers: int | None = workers
+
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> CipherContext:
+        return ECBContext(encrypter, key_schedule, decrypt, self.workers)
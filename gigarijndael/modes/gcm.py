@@ -0,0 +1,267 @@
+"""
+Galois/Counter Mode (NIST SP 800-38D): counter mode encryption authenticated with GHASH.
+
+GHASH multiplies by the hash key in GF(2^128), the product is linear in the other operand,
+so it is computed with 8-bit window tables (Shoup's method): a block costs 16 lookups,
+far less than the block cipher. The tables reveal the hash key, which is enough to forge
+tags, so they belong to a single context and are never cached beyond it.
+"""
+
+from __future__ import annotations
+
+import hmac
+import typing
+
+from gigarijndael.finite_fields.arithmetic import multiply_by_x
+from gigarijndael.finite_fields.field import FiniteField
+from gigarijndael.finite_fields.linear import ByteTables, byte_tables
+from gigarijndael.modes.base import CipherContext, Mode, xor_bytes
+from gigarijndael.modes.ctr import counter_keystream, xor_counter_keystream
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+BLOCK_BYTES: int = 16
+BLOCK_BITS: int = 8 * BLOCK_BYTES
+COUNTER_BITS: int = 32  # Counter blocks increment only their low 32 bits
+TAG_SIZES: frozenset[int] = frozenset({4, 8, 12, 13, 14, 15, 16})  # Allowed by SP 800-38D
+GHASH_FIELD: FiniteField = FiniteField(BLOCK_BITS)  # x^128 + x^7 + x^2 + x + 1
+
+
+def reflect(element: int) -> int:
+    """Reverse the bits of a block, GCM keeps the coefficient of x^0 in the leftmost bit."""
+    return int(f"{element:0{BLOCK_BITS}b}"[::-1], 2)
+
+
+def ghash_tables(hash_key: int) -> ByteTables:
+    """
+    Tables multiplying a block by the hash key, `tables[i][byte]` for the i-th low byte.
+
+    Args:
+        hash_key: Encrypted zero block as a big-endian integer.
+    """
+    # Products of the key with every power of x, in the bit order of GCM blocks
+    powers = [reflect(hash_key)]
+    for _ in range(BLOCK_BITS - 1):
+        powers.append(multiply_by_x(powers[-1], BLOCK_BITS, GHASH_FIELD.general_polynomial))
+    return byte_tables([reflect(power) for power in reversed(powers)])
+
+
+class GHash:
+    """GHASH of a sequence of whole blocks: Y = (Y + X) * H for every block X."""
+
+    def __init__(self, tables: ByteTables) -> None:
+        """
+        Start a hash.
+
+        Args:
+            tables: Multiplication tables of the hash key returned by `ghash_tables`.
+        """
+        self.tables: ByteTables = tables
+        self.value: int = 0
+
+    def update(self, data: Buffer) -> None:
+        """Absorb whole blocks of data."""
+        view = memoryview(data).cast("B")
+        t0, t1, t2, t3, t4, t5, t6, t7, t8, t9, t10, t11, t12, t13, t14, t15 = self.tables
+        from_bytes = int.from_bytes
+        value = self.value
+        for offset in range(0, len(view), BLOCK_BYTES):
+            # b[0] is the most significant byte, the last table covers it
+            b = (value ^ from_bytes(view[offset : offset + BLOCK_BYTES])).to_bytes(BLOCK_BYTES)
+            value = (
+                t15[b[0]] ^ t14[b[1]] ^ t13[b[2]] ^ t12[b[3]]
+                ^ t11[b[4]] ^ t10[b[5]] ^ t9[b[6]] ^ t8[b[7]]
+                ^ t7[b[8]] ^ t6[b[9]] ^ t5[b[10]] ^ t4[b[11]]
+                ^ t3[b[12]] ^ t2[b[13]] ^ t1[b[14]] ^ t0[b[15]]
+            )  # fmt: skip
+        self.value = value
+
+    def update_padded(self, data: Buffer) -> None:
+        """Absorb data padded with zeros to whole blocks."""
+        view = memoryview(data).cast("B")
+        self.update(bytes(view) + bytes(-len(view) % BLOCK_BYTES))
+
+
+class GCMContext(CipherContext):
+    """
+    Counter mode encryption with a GHASH tag over the additional data and the ciphertext.
+
+    Encryption appends the tag to the ciphertext in `finalize`, decryption expects it at the
+    end of the data and raises `ValueError` there if it does not match. Plaintext returned
+    by `update` during decryption is not authenticated until `finalize` succeeds.
+    """
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        nonce: bytes,
+        associated_data: bytes,
+        tag_size: int,
+        workers: int | None,
+    ) -> None:
+        super().__init__(encrypter, key_schedule, decrypt, workers)
+        if encrypter.block_bytes != BLOCK_BYTES:
+            raise ValueError(f"GCM requires 128-bit blocks, got {8 * encrypter.block_bytes} bits")
+        if not nonce:
+            raise ValueError("Invalid nonce size: 0")
+        self.tag_size: int = tag_size
+        self.tag: bytes | None = None
+        # With the usual 96-bit nonce the hash key and the tag mask are encrypted in one batch
+        blocks = bytes(BLOCK_BYTES)
+        if len(nonce) == 12:
+            blocks += nonce + b"\x00\x00\x00\x01"
+        encrypted = encrypter.encrypt_bytes(blocks, key_schedule, False)
+        hash_key = int.from_bytes(encrypted[:BLOCK_BYTES])
+        self._ghash: GHash = GHash(ghash_tables(hash_key))
+        initial_counter = int.from_bytes(blocks[BLOCK_BYTES:]) or self._hash_nonce(nonce)
+        self._tag_mask: bytes = encrypted[BLOCK_BYTES:] or counter_keystream(
+            encrypter, initial_counter, 1, key_schedule
+        )
+        self._counter: int = initial_counter + 1
+        self._data_size: int = 0
+        self._associated_data: bytes = b""  # Incomplete block of additional data
+        self._associated_size: int = 0
+        self._data_started: bool = False
+        if decrypt:
+            # The tag ends the data, it is never mistaken for ciphertext
+            self._held_blocks = 1
+        self.authenticate_additional_data(associated_data)
+
+    def authenticate_additional_data(self, data: Buffer) -> None:
+        """
+        Add data that is authenticated but not encrypted, may be called repeatedly.
+
+        Raises:
+            ValueError: If encryption or decryption of the data has already started.
+        """
+        self._check_active()
+        if self._data_started:
+            raise ValueError("Additional data must come before the data")
+        view = memoryview(data).cast("B")
+        buffered = self._associated_data + view
+        whole = len(buffered) - len(buffered) % BLOCK_BYTES
+        self._ghash.update(buffered[:whole])
+        self._associated_data = buffered[whole:]
+        self._associated_size += len(view)
+
+    def update(self, data: Buffer) -> bytes:
+        self._start_data()
+        return super().update(data)
+
+    def _process(self, data: bytes | memoryview) -> bytes:
+        if self.decrypt:
+            self._ghash.update(data)
+        result = self._xor_keystream(data)
+        if not self.decrypt:
+            self._ghash.update(result)
+        self._data_size += len(data)
+        return result
+
+    def _finalize(self, tail: bytes) -> bytes:
+        self._start_data()
+        tag = b""
+        if self.decrypt:
+            if len(tail) < self.tag_size:
+                raise ValueError("Data is shorter than the authentication tag")
+            tail, tag = tail[: -self.tag_size], tail[-self.tag_size :]
+            self._ghash.update_padded(tail)
+        result = self._xor_keystream(tail) if tail else b""
+        if not self.decrypt:
+            self._ghash.update_padded(result)
+        self._data_size += len(tail)
+
+        lengths = (8 * self._associated_size) << 64 | (8 * self._data_size)
+        self._ghash.update(lengths.to_bytes(BLOCK_BYTES))
+        full_tag = xor_bytes(self._ghash.value.to_bytes(BLOCK_BYTES), self._tag_mask)
+        self.tag = full_tag[: self.tag_size]
+        if self.decrypt:
+            if not hmac.compare_digest(self.tag, tag):
+                raise ValueError("Invalid authentication tag")
+            return result
+        return result + self.tag
+
+    def _result_bytes(self, size: int, final: bool) -> int:
+        if not final:
+            return size
+        return max(size - self.tag_size, 0) if self.decrypt else size + self.tag_size
+
+    def _start_data(self) -> None:
+        """Pad the additional data once the data starts."""
+        if not self._data_started:
+            self._data_started = True
+            self._ghash.update_padded(self._associated_data)
+            self._associated_data = b""
+
+    def _xor_keystream(self, data: bytes | memoryview) -> bytes:
+        count = -(-len(data) // BLOCK_BYTES)
+        start = self._counter
+        self._counter = (start & ~0xFFFFFFFF) | ((start + count) & 0xFFFFFFFF)
+        if (pool := self._worker_pool(len(data))) is not None:
+            return pool.run_shared(
+                xor_counter_keystream, data, start, self.key_schedule, COUNTER_BITS
+            )
+        keystream = counter_keystream(self.encrypter, start, count, self.key_schedule, COUNTER_BITS)
+        return xor_bytes(data, keystream[: len(data)])
+
+    def _hash_nonce(self, nonce: bytes) -> int:
+        """Initial counter block of a nonce that is not 96 bits long."""
+        ghash = GHash(self._ghash.tables)
+        ghash.update_padded(nonce)
+        ghash.update((8 * len(nonce)).to_bytes(BLOCK_BYTES))
+        return ghash.value
+
+
+class GCM(Mode):
+    """
+    Galois/Counter Mode, authenticated encryption for ciphers with 128-bit blocks.
+
+    The ciphertext is as long as the plaintext and followed by the tag. Counter blocks
+    are encrypted in batches, large chunks by a pool of worker processes.
+    """
+
+    name = "gcm"
+
+    def __init__(
+        self,
+        nonce: bytes,
+        associated_data: bytes = b"",
+        tag_size: int = 16,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Configure Galois/Counter Mode.
+
+        Args:
+            nonce: Unique for every message encrypted with a key, 12 bytes recommended.
+            associated_data: Data authenticated but not encrypted, more can be added
+                with `GCMContext.authenticate_additional_data` before the data.
+            tag_size: Tag size in bytes, 16, 15, 14, 13, 12, 8 or 4.
+            workers: Number of worker processes, 1 disables them, all CPUs by default.
+
+        Raises:
+            ValueError: If the tag size is not allowed.
+        """
+        if tag_size not in TAG_SIZES:
+            raise ValueError(f"Invalid tag size: {tag_size}")
+        self.nonce: bytes = bytes(nonce)
+        self.associated_data: bytes = bytes(associated_data)
+        self.tag_size: int = tag_size
+        self.workers: int | None = workers
+
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> GCMContext:
+        return GCMContext(
+            encrypter,
+            key_schedule,
+            decrypt,
+            self.nonce,
+            self.associated_data,
+            self.tag_size,
+            self.workers,
+        )
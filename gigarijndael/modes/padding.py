@@ -0,0 +1,26 @@
+"""
+PKCS#7 padding: the data is extended with N bytes of value N, 1 <= N <= block size.
+"""
+
+PKCS7_MAX_BLOCK_BYTES: int = 255  # The padding length is stored in one byte
+
+
+def pkcs7_pad(data: bytes, block_bytes: int) -> bytes:
+    """Pad the data to a multiple of the block size, a whole block is added to aligned data."""
+    size = block_bytes - len(data) % block_bytes
+    return data + bytes((size,)) * size
+
+
+def pkcs7_unpad(data: bytes, block_bytes: int) -> bytes:
+    """
+    Remove the padding.
+
+    Raises:
+        ValueError: If the data is not a padded multiple of the block size.
+    """
+    if not data or len(data) % block_bytes:
+        raise ValueError("Invalid padding")
+    size = data[-1]
+    if not 1 <= size <= block_bytes or data[-size:] != bytes((size,)) * size:
+        raise ValueError("Invalid padding")
+    return data[:-size]
@@ -0,0 +1,256 @@
+"""
+XTS mode (IEEE 1619, NIST SP 800-38E): tweaked encryption of storage sectors.
+
+Every sector is encrypted on its own, with a tweak derived from its index, so a sector
+can be read or rewritten without touching the rest of the image. The tweak of the first
+block of a sector is the encrypted sector index, the tweak of every next block is
+the previous one multiplied by x in GF(2^128). A sector whose size is not a multiple
+of the block size ends with ciphertext stealing.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from gigarijndael.finite_fields.field import FiniteField
+from gigarijndael.modes.base import CipherContext, Mode, xor_bytes
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+BLOCK_BYTES: int = 16
+BLOCK_BITS: int = 8 * BLOCK_BYTES
+# Tweaks are little-endian integers, x^128 + x^7 + x^2 + x + 1 reduces their doubling
+TWEAK_POLYNOMIAL: int = FiniteField(BLOCK_BITS).general_polynomial
+
+
+def sector_tweaks(
+    encrypter: RijndaelEncrypter, tweak_key_schedule: KeySchedule, first_sector: int, count: int
+) -> list[int]:
+    """Tweaks of the first blocks of `count` consecutive sectors, encrypted in one batch."""
+    indexes = b"".join((first_sector + i).to_bytes(BLOCK_BYTES, "little") for i in range(count))
+    encrypted = encrypter.encrypt_bytes(indexes, tweak_key_schedule, False)
+    return [
+        int.from_bytes(encrypted[offset : offset + BLOCK_BYTES], "little")
+        for offset in range(0, len(encrypted), BLOCK_BYTES)
+    ]
+
+
+def tweak_masks(tweak: int, start: int, count: int) -> list[bytes]:
+    """Tweaks of blocks `start` to `start + count` of a sector starting with the tweak."""
+    masks = []
+    for block in range(start + count):
+        if block >= start:
+            masks.append(tweak.to_bytes(BLOCK_BYTES, "little"))
+        tweak <<= 1
+        if tweak >> BLOCK_BITS:
+            tweak ^= TWEAK_POLYNOMIAL
+    return masks
+
+
+def xor_encrypt_xor(
+    encrypter: RijndaelEncrypter,
+    data: Buffer,
+    masks: bytes,
+    key_schedule: KeySchedule,
+    decrypt: bool,
+) -> bytes:
+    """Apply the block transform to whole blocks masked before and after with their tweaks."""
+    return xor_bytes(encrypter.encrypt_bytes(xor_bytes(data, masks), key_schedule, decrypt), masks)
+
+
+def xts_blocks(
+    encrypter: RijndaelEncrypter,
+    data: Buffer,
+    block_offset: int,
+    key_schedule: KeySchedule,
+    tweak_key_schedule: KeySchedule,
+    sector_bytes: int,
+    first_sector: int,
+    decrypt: bool,
+) -> bytes:
+    """
+    Encrypt or decrypt whole blocks of consecutive sectors in a single batch.
+
+    The data starts at block `block_offset` counted from the beginning of `first_sector`,
+    it may start and end in the middle of a sector.
+    """
+    count = len(memoryview(data)) // BLOCK_BYTES
+    if not count:
+        return b""
+    blocks_per_sector = sector_bytes // BLOCK_BYTES
+    start_sector, start = divmod(block_offset, blocks_per_sector)
+    end_sector = -(-(block_offset + count) // blocks_per_sector)
+    tweaks = sector_tweaks(
+        encrypter, tweak_key_schedule, first_sector + start_sector, end_sector - start_sector
+    )
+    masks: list[bytes] = []
+    for tweak in tweaks:
+        size = min(blocks_per_sector - start, count - len(masks))
+        masks.extend(tweak_masks(tweak, start, size))
+        start = 0
+    return xor_encrypt_xor(encrypter, data, b"".join(masks), key_schedule, decrypt)
+
+
+def xts_sector(
+    encrypter: RijndaelEncrypter,
+    data: Buffer,
+    sector: int,
+    key_schedule: KeySchedule,
+    tweak_key_schedule: KeySchedule,
+    decrypt: bool,
+) -> bytes:
+    """
+    Encrypt or decrypt one sector of any size of at least one block.
+
+    Raises:
+        ValueError: If the sector is shorter than a block.
+    """
+    data = bytes(data)
+    size = len(data)
+    if size < BLOCK_BYTES:
+        raise ValueError(f"XTS sector is shorter than a block: {size} bytes")
+    remainder = size % BLOCK_BYTES
+    whole = size - remainder
+    [tweak] = sector_tweaks(encrypter, tweak_key_schedule, sector, 1)
+    masks = tweak_masks(tweak, 0, whole // BLOCK_BYTES + bool(remainder))
+    if not remainder:
+        return xor_encrypt_xor(encrypter, data, b"".join(masks), key_schedule, decrypt)
+
+    # Ciphertext stealing: the partial block is padded with the end of the ciphertext of
+    # the last whole block, which takes the place of the partial one, and swapped with it
+    last = whole - BLOCK_BYTES
+    head_masks, last_mask = b"".join(masks[:-1]), masks[-1]
+    if decrypt:
+        stolen = xor_encrypt_xor(encrypter, data[last:whole], last_mask, key_schedule, True)
+        head = data[:last] + data[whole:] + stolen[remainder:]
+        return xor_encrypt_xor(encrypter, head, head_masks, key_schedule, True) + stolen[:remainder]
+    head = xor_encrypt_xor(encrypter, data[:whole], head_masks, key_schedule, False)
+    stolen = data[whole:] + head[last + remainder :]
+    return (
+        head[:last]
+        + xor_encrypt_xor(encrypter, stolen, last_mask, key_schedule, False)
+        + head[last : last + remainder]
+    )
+
+
+def transform_sectors(
+    encrypter: RijndaelEncrypter,
+    view: memoryview,
+    block_offset: int,
+    key_schedule: KeySchedule,
+    tweak_key_schedule: KeySchedule,
+    sector_bytes: int,
+    first_sector: int,
+    decrypt: bool,
+) -> None:
+    """Encrypt or decrypt whole blocks of sectors in place, used by worker processes."""
+    view[:] = xts_blocks(
+        encrypter,
+        bytes(view),
+        block_offset,
+        key_schedule,
+        tweak_key_schedule,
+        sector_bytes,
+        first_sector,
+        decrypt,
+    )
+
+
+class XTSContext(CipherContext):
+    """
+    Consecutive sectors starting at `first_sector`, the last one may be shorter.
+
+    Whole sectors are processed as soon as they are complete, large chunks of them by
+    worker processes, the tail is processed as the last sector in `finalize`.
+    """
+
+    def __init__(
+        self,
+        encrypter: RijndaelEncrypter,
+        key_schedule: KeySchedule,
+        decrypt: bool,
+        tweak_key_schedule: KeySchedule,
+        sector_size: int,
+        first_sector: int,
+        workers: int | None,
+    ) -> None:
+        super().__init__(encrypter, key_schedule, decrypt, workers)
+        if encrypter.block_bytes != BLOCK_BYTES:
+            raise ValueError(f"XTS requires 128-bit blocks, got {8 * encrypter.block_bytes} bits")
+        if sector_size < BLOCK_BYTES or sector_size % BLOCK_BYTES:
+            raise ValueError(f"Invalid sector size: {sector_size}")
+        if first_sector < 0:
+            raise ValueError(f"Invalid sector index: {first_sector}")
+        self.tweak_key_schedule: KeySchedule = tweak_key_schedule
+        self.sector_size: int = sector_size
+        self._sector: int = first_sector
+        self._unit_bytes = sector_size
+
+    def _process(self, data: bytes | memoryview) -> bytes:
+        sector = self._sector
+        self._sector += len(data) // self.sector_size
+        args = (self.key_schedule, self.tweak_key_schedule, self.sector_size, sector, self.decrypt)
+        if (pool := self._worker_pool(len(data))) is not None:
+            return pool.run_shared(transform_sectors, data, *args)
+        return xts_blocks(self.encrypter, data, 0, *args)
+
+    def _finalize(self, tail: bytes) -> bytes:
+        if not tail:
+            return b""
+        return xts_sector(
+            self.encrypter,
+            tail,
+            self._sector,
+            self.key_schedule,
+            self.tweak_key_schedule,
+            self.decrypt,
+        )
+
+
+class XTS(Mode):
+    """
+    XTS mode for ciphers with 128-bit blocks, encrypts data as a run of sectors.
+
+    The data is encrypted with the cipher key, sector indexes with the tweak key,
+    which must be independent of it. The ciphertext is as long as the plaintext,
+    at least one block. For random access to single sectors see `SectorCipher`.
+    """
+
+    name = "xts"
+
+    def __init__(
+        self,
+        tweak_key: bytes,
+        sector_size: int = 512,
+        first_sector: int = 0,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Configure XTS mode.
+
+        Args:
+            tweak_key: Key encrypting the sector indexes, of the cipher key size.
+            sector_size: Sector size in bytes, a multiple of the block size.
+            first_sector: Index of the sector the data starts with.
+            workers: Number of worker processes, 1 disables them, all CPUs by default.
+        """
+        self.tweak_key: bytes = bytes(tweak_key)
+        self.sector_size: int = sector_size
+        self.first_sector: int = first_sector
+        self.workers: int | None = workers
+
+    def create_context(
+        self, encrypter: RijndaelEncrypter, key_schedule: KeySchedule, decrypt: bool
+    ) -> XTSContext:
+        return XTSContext(
+            encrypter,
+            key_schedule,
+            decrypt,
+            encrypter.key_schedule(encrypter.split_key(self.tweak_key)),
+            self.sector_size,
+            self.first_sector,
+            self.workers,
+        )
@@ -0,0 +1,191 @@
+"""
+Process pools running the block transform on several cores.
+
+Every worker builds its own encrypter with its S-Box and lookup tables once at startup
+and keeps it for the lifetime of the pool. Data is exchanged through shared memory:
+the parent copies the input into a segment, workers transform their block ranges
+in place, so only segment names, offsets and key schedules go through the pipes.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import itertools
+import multiprocessing
+import os
+import threading
+import typing
+from multiprocessing import shared_memory
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+
+SharedFunction: typing.TypeAlias = typing.Callable[..., None]
+
+_worker_encrypter: RijndaelEncrypter | None = None
+
+
+def process_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method of worker processes.
+
+    Pools are started lazily from any thread, e.g. an executor thread of an asyncio stream,
+    and forking a multi-threaded process may deadlock, so workers come from a fork server
+    where it is available, otherwise they are spawned.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _initialize_worker(
+    encrypter_cls: type[RijndaelEncrypter],
+    block_size: int,
+    key_size: int,
+    experimental: bool,
+    giga_bits: int,
+) -> None:
+    global _worker_encrypter
+    _worker_encrypter = encrypter_cls(
+        block_size=block_size, key_size=key_size, experimental=experimental, giga_bits=giga_bits
+    )
+    # Tables are built on first use, doing it here keeps the first tasks fast
+    word = _worker_encrypter.word_cls.from_items([0] * _worker_encrypter.word_cls.LENGTH)
+    key_schedule = _worker_encrypter.key_schedule([word] * key_size)
+    for decrypt in (False, True):
+        _worker_encrypter.encrypt_bytes(bytes(_worker_encrypter.block_bytes), key_schedule, decrypt)
+
+
+def _segment_buffer(segment: shared_memory.SharedMemory) -> memoryview:
+    buffer = segment.buf
+    assert buffer is not None, "Shared memory is closed"
+    return buffer
+
+
+def _call_shared(
+    function: SharedFunction, name: str, offset: int, size: int, *args: typing.Any
+) -> None:
+    assert _worker_encrypter is not None, "Worker is not initialized"
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        with _segment_buffer(segment)[offset : offset + size] as view:
+            function(_worker_encrypter, view, *args)
+    finally:
+        segment.close()
+
+
+def transform_blocks(
+    encrypter: RijndaelEncrypter,
+    view: memoryview,
+    block_offset: int,
+    key_schedule: KeySchedule,
+    decrypt: bool,
+) -> None:
+    """Apply the block transform to every block of the view in place."""
+    view[:] = encrypter.encrypt_bytes(bytes(view), key_schedule, decrypt)
+
+
+class WorkerPool:
+    """Pool of persistent processes sharing the configuration of an encrypter."""
+
+    TASKS_PER_WORKER: int = 4  # Smaller tasks balance the load of unequal workers
+
+    def __init__(self, encrypter: RijndaelEncrypter, workers: int | None = None) -> None:
+        """
+        Start the pool.
+
+        Args:
+            encrypter: Encrypter whose class and sizes the workers replicate.
+            workers: Number of processes, the number of CPUs by default.
+        """
+        self.workers: int = workers or os.cpu_count() or 1
+        self.block_bytes: int = encrypter.block_bytes
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=process_context(),
+            initializer=_initialize_worker,
+            initargs=(
+                type(encrypter),
+                encrypter.block_size,
+                encrypter.key_size,
+                encrypter.experimental,
+                encrypter.giga_bits,
+            ),
+        )
+
+    def run_shared(self, function: SharedFunction, data: Buffer, *args: typing.Any) -> bytes:
+        """
+        Process whole blocks of data in place in shared memory, split between the workers.
+
+        Every task calls `function(encrypter, view, block_offset, *args)`, where the view
+        covers the blocks of the task starting at `block_offset`. The function must be
+        importable at module level and write its result into the view.
+
+        Returns:
+            Content of the shared memory after all tasks are done.
+        """
+        size = len(memoryview(data))
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            buffer = _segment_buffer(segment)
+            buffer[:size] = data
+            ranges = split_range(size // self.block_bytes, self.workers * self.TASKS_PER_WORKER)
+            block_offsets = [offset for offset, _ in ranges]
+            # Consume the results so that exceptions of the workers are raised here
+            for _ in self._executor.map(
+                functools.partial(_call_shared, function, segment.name),
+                [offset * self.block_bytes for offset in block_offsets],
+                [count * self.block_bytes for _, count in ranges],
+                block_offsets,
+                *(itertools.repeat(arg, len(ranges)) for arg in args),
+            ):
+                pass
+            return bytes(buffer[:size])
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def encrypt_bytes(self, data: Buffer, key_schedule: KeySchedule, decrypt: bool) -> bytes:
+        """Apply the block transform to every block of data, see `RijndaelEncrypter`."""
+        return self.run_shared(transform_blocks, data, key_schedule, decrypt)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+
+_pools: dict[tuple[typing.Any, ...], WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(encrypter: RijndaelEncrypter, workers: int | None = None) -> WorkerPool:
+    """Return a pool for the encrypter configuration, started on the first request."""
+    key = (
+        type(encrypter),
+        encrypter.block_size,
+        encrypter.key_size,
+        encrypter.experimental,
+        encrypter.giga_bits,
+        workers,
+    )
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = WorkerPool(encrypter, workers)
+        return _pools[key]
+
+
+def shutdown_pools() -> None:
+    """Stop the workers of all pools started by `get_pool`."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def split_range(count: int, parts: int) -> list[tuple[int, int]]:
+    """Split `count` items into at most `parts` contiguous (offset, size) ranges."""
+    size = -(-count // max(parts, 1))
+    return [(offset, min(size, count - offset)) for offset in range(0, count, max(size, 1))]
@@ -1,11 +1,16 @@
-import itertools
+from __future__ import annotations
+
+import contextlib
 import typing
 
-from more_itertools import grouper
+from gigarijndael.cache import CacheInfo, LRUCache
+from gigarijndael.encryption.encrypter import KeySchedule, RijndaelEncrypter
+from gigarijndael.encryption.engines import DEFAULT_ENGINE, get_engine
+from gigarijndael.encryption.instrumentation import Instrumentation
+from gigarijndael.modes import ECB, CipherContext, Mode
 
-from gigarijndael.encryption.block import Block
-from gigarijndael.encryption.encrypter import RijndaelEncrypter
-from gigarijndael.encryption.word import Word
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
 
 
 class Rijndael:
@@ -13,7 +18,19 @@ class Rijndael:
     Rijndael cipher implementation.
     """
 
-    def __init__(self, *, block_size: int, key_size: int, experimental: bool = False) -> None:
+    KEY_CACHE_SIZE: int = 128  # Number of expanded keys kept between calls by default
+
+    def __init__(
+        self,
+        *,
+        block_size: int,
+        key_size: int,
+        experimental: bool = False,
+        giga_bits: int = 32,
+        engine: str = DEFAULT_ENGINE,
+        key_cache_size: int = KEY_CACHE_SIZE,
+        workers: int | None = 1,
+    ) -> None:
         """
         Initialize Rijndael cipher.
 
@@ -21,83 +38,204 @@ class Rijndael:
             block_size: Block size in 32-bit words (4, 6, or 8).
             key_size: Key size in 32-bit words (4, 6, or 8).
             experimental: Use GF(2^32) "Giga" mode.
+            giga_bits: Size of the field elements in Giga mode, 32 or 64 bits.
+            engine: Name of the block engine ("packed", "reference", "table", "bitsliced"
+                or "numpy").
+            key_cache_size: Number of expanded keys to keep, zero disables the cache.
+            workers: Number of worker processes encrypting large inputs in the default mode,
+                1 disables them, None uses all CPUs.
         """
-        self._encrypter: RijndaelEncrypter = RijndaelEncrypter(
-            block_size=block_size, key_size=key_size, experimental=experimental
+        self._encrypter: RijndaelEncrypter = get_engine(engine)(
+            block_size=block_size,
+            key_size=key_size,
+            experimental=experimental,
+            giga_bits=giga_bits,
         )
+        self._key_schedules: LRUCache[bytes, KeySchedule] = LRUCache(maxsize=key_cache_size)
+        self._workers: int | None = workers
+        self._engine: str = engine
+
+    @property
+    def block_bytes(self) -> int:
+        """Block size in bytes."""
+        return self._encrypter.block_bytes
 
-    def encrypt(self, data: bytes, key: bytes) -> bytes:
+    @property
+    def encrypter(self) -> RijndaelEncrypter:
+        """Block transform of the cipher, for modes driven outside of `encrypt` and `decrypt`."""
+        return self._encrypter
+
+    def encrypt(self, data: Buffer, key: bytes, mode: Mode | None = None) -> bytes:
         """
         Encrypt data.
 
         Args:
-            data: Data to encrypt.
+            data: Data to encrypt, bytes or any other contiguous buffer.
             key: Encryption key.
+            mode: Mode of operation, ECB with zero padding by default.
 
         Returns:
             Encrypted data.
         """
-        return self._encrypt(data=data, key=key, decrypt=False)
+        return self._encrypt(data=data, key=key, mode=mode, decrypt=False)
 
-    def decrypt(self, data: bytes, key: bytes) -> bytes:
+    def encrypt_into(
+        self, data: Buffer, output: Buffer, key: bytes, mode: Mode | None = None
+    ) -> int:
+        """
+        Encrypt data into a caller-provided buffer.
+
+        The result is copied into the buffer, so this saves an allocation, not a copy.
+        The output may be the same buffer as the data to encrypt in place.
+
+        Args:
+            data: Data to encrypt, bytes or any other contiguous buffer.
+            output: Writable buffer large enough for the encrypted data.
+            key: Encryption key.
+            mode: Mode of operation, ECB with zero padding by default.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            ValueError: If the output buffer is too small for the largest possible result.
+        """
+        return self._encrypt_into(data=data, output=output, key=key, mode=mode, decrypt=False)
+
+    def decrypt(self, data: Buffer, key: bytes, mode: Mode | None = None) -> bytes:
         """
         Decrypt data.
 
         Args:
-            data: Data to decrypt.
+            data: Data to decrypt, bytes or any other contiguous buffer.
             key: Decryption key.
+            mode: Mode of operation, ECB with zero padding by default.
 
         Returns:
             Decrypted data.
         """
-        return self._encrypt(data=data, key=key, decrypt=True)
-
-    def _encrypt(self, data: bytes, key: bytes, decrypt: bool) -> bytes:
-        keys = self._split_key(key=key)
-        blocks = list(self._split_blocks(data=data))
-        cipher_blocks = self._encrypter.encrypt(blocks=blocks, key=keys, decrypt=decrypt)
-        return self._blocks_to_bytes(blocks=cipher_blocks)
-
-    def _split_key(self, key: bytes) -> list[Word]:
-        """Split bytes key into Word list. Padds with zeros if necessary."""
-        item_size_bytes = self._encrypter.word_cls.ITEM_SIZE
-        word_len = self._encrypter.word_cls.LENGTH
-        key_size_in_items = self._encrypter.key_size * word_len
-
-        # Padding data with zeros if not enough key bytes
-        items = [
-            int.from_bytes(item, byteorder="big")
-            for item in grouper(key, item_size_bytes, fillvalue=0)
-        ]
-
-        if len(items) < key_size_in_items:
-            items.extend([0] * (key_size_in_items - len(items)))
-        else:
-            items = items[:key_size_in_items]
-
-        return [
-            self._encrypter.word_cls.from_items(word_items)
-            for word_items in itertools.batched(items, word_len)
-        ]
-
-    def _split_blocks(self, data: bytes) -> typing.Iterator[Block]:
-        """Split bytes data into Blocks."""
-        item_size_bytes = self._encrypter.word_cls.ITEM_SIZE
-        word_len = self._encrypter.word_cls.LENGTH
-        block_size_in_items = word_len * self._encrypter.block_size
-
-        # Padding data with zeros if not multiple of block size
-        items = [
-            int.from_bytes(item, byteorder="big")
-            for item in grouper(data, item_size_bytes, fillvalue=0)
-        ]
-        return (tuple(block) for block in grouper(items, block_size_in_items, fillvalue=0))
-
-    def _blocks_to_bytes(self, blocks: typing.Iterable[Block]) -> bytes:
-        """Convert Blocks back to bytes."""
-        item_size = self._encrypter.word_cls.ITEM_SIZE
-        result = bytearray()
-        for block in blocks:
-            for item in block:
-                result.extend(item.to_bytes(item_size, byteorder="big"))
-        return bytes(result).rstrip(b"\x00")
+        return self._encrypt(data=data, key=key, mode=mode, decrypt=True)
+
+    def decrypt_into(
+        self, data: Buffer, output: Buffer, key: bytes, mode: Mode | None = None
+    ) -> int:
+        """
+        Decrypt data into a caller-provided buffer.
+
+        The result is copied into the buffer, so this saves an allocation, not a copy.
+        The output may be the same buffer as the data to decrypt in place.
+
+        Args:
+            data: Data to decrypt, bytes or any other contiguous buffer.
+            output: Writable buffer large enough for the decrypted data.
+            key: Decryption key.
+            mode: Mode of operation, ECB with zero padding by default.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            ValueError: If the output buffer is too small for the largest possible result.
+        """
+        return self._encrypt_into(data=data, output=output, key=key, mode=mode, decrypt=True)
+
+    def encryptor(self, key: bytes, mode: Mode | None = None) -> CipherContext:
+        """
+        Create a streaming encryption context.
+
+        Args:
+            key: Encryption key.
+            mode: Mode of operation, ECB with zero padding by default.
+
+        Returns:
+            Context encrypting data chunk by chunk with `update` and `finalize`.
+        """
+        return self._context(key=key, mode=mode, decrypt=False)
+
+    def decryptor(self, key: bytes, mode: Mode | None = None) -> CipherContext:
+        """
+        Create a streaming decryption context.
+
+        Args:
+            key: Decryption key.
+            mode: Mode of operation, ECB with zero padding by default.
+
+        Returns:
+            Context decrypting data chunk by chunk with `update` and `finalize`.
+        """
+        return self._context(key=key, mode=mode, decrypt=True)
+
+    def key_schedule(self, key: bytes) -> KeySchedule:
+        """
+        Return the expanded key, computing it only on the first use of the key.
+
+        Args:
+            key: Encryption key.
+
+        Returns:
+            Round keys for encryption and decryption.
+        """
+        return self._key_schedules.get_or_create(bytes(key), self._expand_key)
+
+    def cache_info(self) -> CacheInfo:
+        """Return statistics of the expanded keys cache."""
+        return self._key_schedules.info()
+
+    def evict_key(self, key: bytes) -> bool:
+        """Drop the expanded key from the cache. Returns True if it was cached."""
+        return self._key_schedules.evict(bytes(key))
+
+    def clear_key_cache(self) -> None:
+        """Drop all expanded keys and reset the cache statistics."""
+        self._key_schedules.clear()
+
+    @contextlib.contextmanager
+    def instrument(self) -> typing.Iterator[Instrumentation]:
+        """
+        Count and time the cipher stages while the context is active.
+
+        Instrumentation is also enabled for all ciphers by the GIGARIJNDAEL_INSTRUMENT=1
+        environment variable, then it is available as `instrumentation`.
+
+        Yields:
+            Instrumentation, `snapshot()` returns its counters as a dict.
+        """
+        with self._encrypter.instrument() as instrumentation:
+            yield instrumentation
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """Active instrumentation of the cipher, None if it is disabled."""
+        return self._encrypter.instrumentation
+
+    def options(self) -> dict[str, typing.Any]:
+        """Keyword arguments creating an equal `Rijndael` cipher, e.g. in another process."""
+        return {
+            "block_size": self._encrypter.block_size,
+            "key_size": self._encrypter.key_size,
+            "experimental": self._encrypter.experimental,
+            "giga_bits": self._encrypter.giga_bits,
+            "engine": self._engine,
+            "key_cache_size": self._key_schedules.maxsize,
+            "workers": self._workers,
+        }
+
+    def _encrypt(self, data: Buffer, key: bytes, mode: Mode | None, decrypt: bool) -> bytes:
+        context = self._context(key=key, mode=mode, decrypt=decrypt)
+        return context.update(data) + context.finalize()
+
+    def _encrypt_into(
+        self, data: Buffer, output: Buffer, key: bytes, mode: Mode | None, decrypt: bool
+    ) -> int:
+        context = self._context(key=key, mode=mode, decrypt=decrypt)
+        written = context.update_into(data, output)
+        with memoryview(output).cast("B") as view:
+            return written + context.finalize_into(view[written:])
+
+    def _context(self, key: bytes, mode: Mode | None, decrypt: bool) -> CipherContext:
+        return (mode or ECB(workers=self._workers)).create_context(
+            encrypter=self._encrypter, key_schedule=self.key_schedule(key), decrypt=decrypt
+        )
+
+    def _expand_key(self, key: bytes) -> KeySchedule:
+        return self._encrypter.key_schedule(self._encrypter.split_key(key))
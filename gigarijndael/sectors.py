@@ -0,0 +1,171 @@
+"""
+Random access to XTS-encrypted disk images.
+
+A sector is encrypted on its own, so rewriting one costs the encryption of that sector only.
+Runs of sectors are encrypted in batches, and large ones are split between worker processes.
+Images are transformed in place through a memory map, one chunk of sectors at a time.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import typing
+
+from gigarijndael.modes.xts import BLOCK_BYTES, XTSContext, xts_sector
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from gigarijndael.rijndael import Rijndael
+
+
+class SectorCipher:
+    """
+    XTS encryption of sectors addressed by their index.
+    """
+
+    CHUNK_SIZE: int = 1 << 24  # Bytes of an image transformed at once
+
+    def __init__(
+        self,
+        cipher: Rijndael,
+        key: bytes,
+        tweak_key: bytes,
+        sector_size: int = 512,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Initialize the sector cipher.
+
+        Args:
+            cipher: Cipher with 128-bit blocks.
+            key: Key encrypting the data.
+            tweak_key: Key encrypting the sector indexes, independent of the data key.
+            sector_size: Sector size in bytes, a multiple of the block size.
+            workers: Number of processes transforming large runs of sectors, 1 disables them,
+                all CPUs by default.
+
+        Raises:
+            ValueError: If the block size of the cipher is not 128 bits or the sector size
+                is not a multiple of it.
+        """
+        self.cipher: Rijndael = cipher
+        self.sector_size: int = sector_size
+        self.workers: int | None = workers
+        self._key_schedule = cipher.key_schedule(key)
+        self._tweak_key_schedule = cipher.key_schedule(tweak_key)
+        # Validates the cipher and the sector size
+        self._context(0, decrypt=False)
+
+    def encrypt_sector(self, index: int, data: Buffer) -> bytes:
+        """
+        Encrypt one sector.
+
+        Args:
+            index: Index of the sector.
+            data: Sector data, the last sector of an image may be shorter but not
+                shorter than a block.
+
+        Returns:
+            Encrypted sector of the same size.
+        """
+        return self._transform_sector(index, data, decrypt=False)
+
+    def decrypt_sector(self, index: int, data: Buffer) -> bytes:
+        """Decrypt one sector, see `encrypt_sector`."""
+        return self._transform_sector(index, data, decrypt=True)
+
+    def encrypt_sectors(self, first: int, data: Buffer) -> bytes:
+        """
+        Encrypt consecutive sectors in one call.
+
+        Args:
+            first: Index of the first sector.
+            data: Data of the sectors, the last one may be shorter.
+
+        Returns:
+            Encrypted sectors.
+        """
+        context = self._context(first, decrypt=False)
+        return context.update(data) + context.finalize()
+
+    def decrypt_sectors(self, first: int, data: Buffer) -> bytes:
+        """Decrypt consecutive sectors in one call, see `encrypt_sectors`."""
+        context = self._context(first, decrypt=True)
+        return context.update(data) + context.finalize()
+
+    def encrypt_image(
+        self, path: str | os.PathLike[str], first: int = 0, count: int | None = None
+    ) -> int:
+        """
+        Encrypt sectors of an image file in place.
+
+        Sector `i` of the image starts at byte `i * sector_size`.
+
+        Args:
+            path: Image file.
+            first: Index of the first sector to encrypt.
+            count: Number of sectors to encrypt, up to the end of the image by default.
+
+        Returns:
+            Number of bytes encrypted.
+        """
+        return self._transform_image(path, first, count, decrypt=False)
+
+    def decrypt_image(
+        self, path: str | os.PathLike[str], first: int = 0, count: int | None = None
+    ) -> int:
+        """Decrypt sectors of an image file in place, see `encrypt_image`."""
+        return self._transform_image(path, first, count, decrypt=True)
+
+    def _transform_sector(self, index: int, data: Buffer, decrypt: bool) -> bytes:
+        size = len(memoryview(data))
+        if size > self.sector_size:
+            raise ValueError(f"Data is larger than a sector: {size} bytes")
+        if index < 0:
+            raise ValueError(f"Invalid sector index: {index}")
+        return xts_sector(
+            self.cipher.encrypter,
+            data,
+            index,
+            self._key_schedule,
+            self._tweak_key_schedule,
+            decrypt,
+        )
+
+    def _transform_image(
+        self, path: str | os.PathLike[str], first: int, count: int | None, decrypt: bool
+    ) -> int:
+        with open(path, "r+b") as file:
+            size = os.fstat(file.fileno()).st_size
+            start = min(first * self.sector_size, size)
+            end = size if count is None else min(start + count * self.sector_size, size)
+            if start == end:
+                return 0
+            # Checked before the image is modified, so an error never leaves it half done
+            tail = (end - start) % self.sector_size
+            if 0 < tail < BLOCK_BYTES:
+                raise ValueError(f"XTS sector is shorter than a block: {tail} bytes")
+            chunk_size = max(self.CHUNK_SIZE // self.sector_size, 1) * self.sector_size
+            with mmap.mmap(file.fileno(), 0) as image:
+                for offset in range(start, end, chunk_size):
+                    chunk_end = min(offset + chunk_size, end)
+                    context = self._context(offset // self.sector_size, decrypt)
+                    with memoryview(image)[offset:chunk_end] as view:
+                        written = context.update_into(view, view)
+                        with view[written:] as rest:
+                            context.finalize_into(rest)
+                image.flush()
+        return end - start
+
+    def _context(self, first: int, decrypt: bool) -> XTSContext:
+        return XTSContext(
+            self.cipher.encrypter,
+            self._key_schedule,
+            decrypt,
+            self._tweak_key_schedule,
+            self.sector_size,
+            first,
+            self.workers,
+        )
@@ -41,3 +41,17 @@ def test_aes_default_params(aes_cls, expected_block_size, expected_key_size):
 
     assert aes._encrypter.block_size == expected_block_size
     assert aes._encrypter.key_size == expected_key_size
+
+
+@pytest.mark.parametrize(
+    "aes_cls, key_fixture",
+    [(AES128, "sample_key_128"), (AES192, "sample_key_192"), (AES256, "sample_key_256")],
+)
+@pytest.mark.parametrize("engine", ["table", "bitsliced"])
+def test_aes_engine(request, sample_data, aes_cls, key_fixture, engine):
+    key = request.getfixturevalue(key_fixture)
+
+    encrypted = aes_cls(engine=engine).encrypt(sample_data, key)
+
+    assert encrypted == aes_cls().encrypt(sample_data, key)
+    assert aes_cls(engine=engine).decrypt(encrypted, key) == sample_data
@@ -0,0 +1,150 @@
+import asyncio
+import concurrent.futures
+import socket
+
+import pytest
+
+from gigarijndael.aio import AsyncRijndael, process_executor
+from gigarijndael.modes import CBC, CTR
+from gigarijndael.rijndael import Rijndael
+
+KEY = bytes(range(16))
+IV = bytes(range(16, 32))
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def transform_stream(async_cipher: AsyncRijndael, data: bytes, decrypt: bool, mode=None):
+    """Run the stream transform into one end of a socket pair and read the other end."""
+    first, second = socket.socketpair()
+    _, writer = await asyncio.open_connection(sock=first)
+    output_reader, output_writer = await asyncio.open_connection(sock=second)
+    transform = async_cipher.decrypt_stream if decrypt else async_cipher.encrypt_stream
+
+    async def run() -> int:
+        try:
+            return await transform(stream_reader(data), writer, KEY, mode)
+        finally:
+            writer.close()
+
+    written, output = await asyncio.gather(run(), output_reader.read())
+    output_writer.close()
+    assert written == len(output)
+    return output
+
+
+@pytest.mark.parametrize("mode", [None, CBC(IV), CTR(IV)])
+def test_async_encrypt(sample_data, mode):
+    cipher = Rijndael(block_size=4, key_size=4)
+    async_cipher = AsyncRijndael(cipher)
+
+    async def run():
+        encrypted = await async_cipher.encrypt(sample_data, KEY, mode)
+        return encrypted, await async_cipher.decrypt(encrypted, KEY, mode)
+
+    encrypted, decrypted = asyncio.run(run())
+
+    assert encrypted == cipher.encrypt(sample_data, KEY, mode)
+    assert decrypted == sample_data
+
+
+def test_async_encrypt_process_executor(sample_data):
+    cipher = Rijndael(block_size=6, key_size=4)
+    mode = CTR(bytes(24), workers=None)
+
+    async def run():
+        with process_executor(cipher, workers=2) as executor:
+            async_cipher = AsyncRijndael(cipher, executor)
+            return await asyncio.gather(
+                *(async_cipher.encrypt(memoryview(sample_data), KEY, mode) for _ in range(3))
+            )
+
+    results = asyncio.run(run())
+
+    assert results == [cipher.encrypt(sample_data, KEY, mode)] * 3
+
+
+@pytest.mark.parametrize("mode", [None, CBC(IV), CTR(IV)])
+@pytest.mark.parametrize("chunk_size", [1, 7, 16, 1000])
+def test_stream_round_trip(sample_data, mode, chunk_size):
+    cipher = Rijndael(block_size=4, key_size=4)
+    data = sample_data * 3
+    async_cipher = AsyncRijndael(cipher, chunk_size=chunk_size, max_in_flight=2)
+
+    async def run():
+        encrypted = await transform_stream(async_cipher, data, decrypt=False, mode=mode)
+        return encrypted, await transform_stream(async_cipher, encrypted, decrypt=True, mode=mode)
+
+    encrypted, decrypted = asyncio.run(run())
+
+    assert encrypted == cipher.encrypt(data, KEY, mode)
+    assert decrypted == data
+
+
+def test_stream_thread_executor(sample_data):
+    cipher = Rijndael(block_size=4, key_size=4)
+
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            async_cipher = AsyncRijndael(cipher, executor, chunk_size=64)
+            return await transform_stream(async_cipher, sample_data, decrypt=False)
+
+    assert asyncio.run(run()) == cipher.encrypt(sample_data, KEY)
+
+
+def test_stream_bounded_read_ahead():
+    cipher = Rijndael(block_size=4, key_size=4)
+    async_cipher = AsyncRijndael(cipher, chunk_size=16, max_in_flight=2)
+
+    class StalledWriter:
+        written: list[bytes] = []
+
+        def write(self, data):
+            self.written.append(data)
+
+        async def drain(self):
+            await asyncio.Event().wait()
+
+    async def run():
+        reader = stream_reader(bytes(16 * 100))
+        task = asyncio.ensure_future(async_cipher.encrypt_stream(reader, StalledWriter(), KEY))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        return len(reader._buffer)
+
+    remaining = asyncio.run(run())
+
+    # Written, read and processed chunks plus two queued on each side of the cipher
+    assert remaining == 16 * (100 - 3 - 2 * 2)
+
+
+def test_stream_invalid_padding():
+    cipher = Rijndael(block_size=4, key_size=4)
+    async_cipher = AsyncRijndael(cipher, chunk_size=16)
+
+    with pytest.raises(ValueError, match="Invalid padding"):
+        asyncio.run(transform_stream(async_cipher, bytes(32), decrypt=True, mode=CBC(IV)))
+
+
+def test_stream_failing_finalize_after_end_of_input():
+    # The whole input is one chunk, the reader is done long before `finalize` fails
+    async_cipher = AsyncRijndael(Rijndael(block_size=4, key_size=4))
+
+    async def run():
+        return await asyncio.wait_for(
+            transform_stream(async_cipher, b"\x01" * 32, decrypt=True, mode=CBC(bytes(16))), 10
+        )
+
+    with pytest.raises(ValueError, match="Invalid padding"):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_in_flight": 0}])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError, match="Invalid"):
+        AsyncRijndael(Rijndael(block_size=4, key_size=4), **kwargs)
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from benchmarks.suite import compare, main, summarize
+
+
+def test_summarize():
+    stats = summarize([float(i) for i in range(1, 101)])
+
+    assert stats == {"min": 1.0, "median": 50.5, "p95": 95.0}
+
+
+def test_compare():
+    baseline = {"fast": {"median": 1.0}, "slow": {"median": 1.0}, "removed": {"median": 1.0}}
+    results = {"fast": {"median": 1.1}, "slow": {"median": 1.5}, "new": {"median": 9.0}}
+
+    assert compare(results, baseline, threshold=0.2) == [("slow", 1.5)]
+
+
+def test_main_baseline(tmp_path):
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    options = ["-k", "field.3.", "-r", "2", "--min-time", "0.001"]
+
+    assert main([*options, "-o", str(output)]) == 0
+    results = json.loads(output.read_text())["results"]
+    assert set(results) == {"field.3.multiply", "field.3.inverse"}
+    assert set(results["field.3.multiply"]) == {"min", "median", "p95"}
+
+    for stats in results.values():
+        stats["median"] /= 100
+    baseline.write_text(json.dumps({"results": results}))
+    assert main([*options, "-o", str(output), "-b", str(baseline)]) == 1
+
+
+def test_main_missing_baseline(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main(["-k", "field.3.", "-b", str(tmp_path / "missing.json")])
+
+    error = capsys.readouterr().err
+    assert "make benchmark-baseline" in error
+    assert "field.3.multiply" not in error
@@ -0,0 +1,98 @@
+import pytest
+
+from gigarijndael.cache import CacheInfo, LRUCache
+
+
+def test_lru_cache_hits_and_misses():
+    cache = LRUCache(maxsize=2)
+    calls = []
+
+    def factory(key: int) -> int:
+        calls.append(key)
+        return key * 10
+
+    assert cache.get_or_create(1, factory) == 10
+    assert cache.get_or_create(1, factory) == 10
+    assert calls == [1]
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_lru_cache_get_or_create_many():
+    cache = LRUCache(maxsize=4)
+    cache.get_or_create(1, lambda key: key * 10)
+    calls = []
+
+    def factory(keys: list[int]) -> list[int]:
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    assert cache.get_or_create_many([3, 1, 2, 3], factory) == [30, 10, 20, 30]
+    assert cache.get_or_create_many([2, 1], factory) == [20, 10]
+    assert calls == [[3, 2]]
+    assert cache.info() == CacheInfo(hits=4, misses=3, maxsize=4, currsize=3)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+
+    cache.get_or_create(1, str)
+    cache.get_or_create(2, str)
+    cache.get_or_create(1, str)
+    cache.get_or_create(3, str)
+
+    assert 1 in cache
+    assert 2 not in cache
+    assert 3 in cache
+
+
+def test_lru_cache_evict_and_clear():
+    cache = LRUCache(maxsize=4)
+    cache.get_or_create(1, str)
+    cache.get_or_create(2, str)
+
+    assert cache.evict(1) is True
+    assert cache.evict(1) is False
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=4, currsize=0)
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+
+    cache.get_or_create(1, str)
+    cache.get_or_create(1, str)
+
+    assert cache.info() == CacheInfo(hits=0, misses=2, maxsize=0, currsize=0)
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError, match="Invalid cache size"):
+        LRUCache(maxsize=-1)
+
+
+def test_lru_cache_update_and_items():
+    cache = LRUCache(maxsize=3)
+    cache.get_or_create(1, str)
+
+    cache.update([(2, "two"), (3, "three"), (4, "four")])
+
+    assert cache.items() == [(2, "two"), (3, "three"), (4, "four")]
+    assert cache.info() == CacheInfo(hits=0, misses=1, maxsize=3, currsize=3)
+
+
+def test_lru_cache_resize():
+    cache = LRUCache(maxsize=3)
+    cache.update([(1, "1"), (2, "2"), (3, "3")])
+
+    cache.resize(1)
+
+    assert cache.items() == [(3, "3")]
+    with pytest.raises(ValueError, match="Invalid cache size"):
+        cache.resize(-1)
+
+
+def test_cache_info_hit_rate():
+    assert CacheInfo(hits=3, misses=1, maxsize=4, currsize=1).hit_rate == 0.75
+    assert CacheInfo(hits=0, misses=0, maxsize=4, currsize=0).hit_rate == 0.0
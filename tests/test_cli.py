@@ -0,0 +1,94 @@
+import pytest
+
+from gigarijndael.cli import main
+from gigarijndael.encryption.sbox import REGISTRY
+from gigarijndael.rijndael import Rijndael
+
+KEY = "000102030405060708090a0b0c0d0e0f"
+IV = "00112233445566778899aabbccddeeff"
+
+
+def run(tmp_path, command: str, data: bytes, *options: str) -> bytes:
+    source, target = tmp_path / f"{command}.in", tmp_path / f"{command}.out"
+    source.write_bytes(data)
+    assert main([command, str(source), str(target), "-k", KEY, *options]) == 0
+    return target.read_bytes()
+
+
+def test_cli_matches_rijndael(tmp_path, sample_data):
+    rijndael = Rijndael(block_size=6, key_size=8)
+
+    cipher_text = run(tmp_path, "encrypt", sample_data, "-b", "6", "-s", "8")
+
+    assert cipher_text == rijndael.encrypt(sample_data, bytes.fromhex(KEY))
+
+
+@pytest.mark.parametrize("mode", ["cbc", "ctr", "gcm"])
+@pytest.mark.parametrize("data", [b"", b"ends with zeros\x00\x00", bytes(range(256)) * 5])
+def test_cli_round_trip(tmp_path, mode, data):
+    options = ("-m", mode, "--iv", IV, "--chunk-size", "100")
+
+    cipher_text = run(tmp_path, "encrypt", data, *options)
+
+    assert run(tmp_path, "decrypt", cipher_text, *options) == data
+
+
+@pytest.mark.parametrize("giga_bits", [32, 64])
+def test_cli_experimental(tmp_path, sample_data, giga_bits):
+    options = ("-x", "--giga-bits", str(giga_bits), "-m", "cbc", "--iv", IV * (giga_bits // 8))
+
+    cipher_text = run(tmp_path, "encrypt", sample_data, *options)
+
+    assert run(tmp_path, "decrypt", cipher_text, *options) == sample_data
+
+
+def test_cli_reports_speed(tmp_path, sample_data, capsys):
+    run(tmp_path, "encrypt", sample_data)
+
+    assert "MB/s" in capsys.readouterr().err
+
+
+def test_cli_requires_iv(tmp_path, capsys):
+    source = tmp_path / "input"
+    source.write_bytes(b"data")
+
+    assert main(["encrypt", str(source), str(tmp_path / "output"), "-k", KEY, "-m", "ctr"]) == 1
+    assert "requires --iv" in capsys.readouterr().err
+
+
+def test_cli_s_box_cache(tmp_path, sample_data):
+    cache = tmp_path / "s_box.cache"
+    options = ("-x", "--s-box-cache", str(cache), "--s-box-cache-size", str(REGISTRY.cache_size))
+
+    cipher_text = run(tmp_path, "encrypt", sample_data, *options)
+    assert cache.stat().st_size > 0
+
+    assert run(tmp_path, "decrypt", cipher_text, *options).rstrip(b"\x00") == sample_data.rstrip(
+        b"\x00"
+    )
+
+
+@pytest.mark.parametrize(
+    ("mode", "tamper", "message"),
+    [
+        ("gcm", lambda cipher_text: cipher_text[:-1] + bytes([cipher_text[-1] ^ 1]), "tag"),
+        ("cbc", lambda cipher_text: cipher_text[:-16] + bytes(16), "padding"),
+    ],
+)
+def test_cli_failed_decryption_leaves_no_output(tmp_path, capsys, mode, tamper, message):
+    data = bytes(range(256)) * 400
+    options = ("-m", mode, "--iv", IV, "--chunk-size", "4096")
+    source, target = tmp_path / "tampered", tmp_path / "output"
+    source.write_bytes(tamper(run(tmp_path, "encrypt", data, *options)))
+    target.write_bytes(b"previous content")
+
+    assert main(["decrypt", str(source), str(target), "-k", KEY, *options]) == 1
+
+    assert message in capsys.readouterr().err
+    assert target.read_bytes() == b"previous content"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "encrypt.in",
+        "encrypt.out",
+        "output",
+        "tampered",
+    ]
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from gigarijndael.encryption.bitsliced import BitslicedRijndaelEncrypter, BitslicedSBox
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+from gigarijndael.encryption.sbox import GigaSBox, InvSBox, SBox
+from gigarijndael.encryption.word import Word
+
+
+def test_bitsliced_encrypter_experimental_not_supported():
+    with pytest.raises(ValueError, match="Bitsliced engine supports only GF"):
+        BitslicedRijndaelEncrypter(block_size=4, key_size=4, experimental=True)
+
+
+def test_bitsliced_s_box_requires_gf8():
+    with pytest.raises(ValueError, match="requires GF"):
+        BitslicedSBox(GigaSBox())
+
+
+@pytest.mark.parametrize("s_box_cls", [SBox, InvSBox])
+def test_bitsliced_s_box(s_box_cls):
+    s_box = s_box_cls()
+    circuit = BitslicedSBox(s_box)
+    # Plane of bit j holds bit j of every item, the item 0 is the most significant bit
+    planes = [sum((item >> bit & 1) << (255 - item) for item in range(256)) for bit in range(8)]
+
+    result = circuit(planes, mask=(1 << 256) - 1)
+
+    assert [
+        sum((result[bit] >> (255 - item) & 1) << bit for bit in range(8)) for item in range(256)
+    ] == list(s_box.table)
+
+
+def test_planes_round_trip():
+    encrypter = BitslicedRijndaelEncrypter(block_size=6, key_size=4)
+    data = os.urandom(encrypter.block_bytes * 5)
+
+    planes = encrypter._to_planes(data)
+
+    assert len(planes) == encrypter.block_bytes * 8
+    assert encrypter._from_planes(planes, blocks=5) == data
+
+
+def test_mix_state():
+    encrypter = BitslicedRijndaelEncrypter(block_size=4, key_size=4)
+    state = encrypter._to_planes(bytes.fromhex("637BC0D27B76D27C76757CC57563C5C0"))
+
+    mixed = encrypter._mix_state(state)
+
+    assert encrypter._from_planes(mixed, blocks=1).hex() == "591ceea1c28636d1caddaf024a27dca2"
+    assert encrypter._inv_mix_state(mixed) == state
+
+
+def test_shift_state():
+    encrypter = BitslicedRijndaelEncrypter(block_size=4, key_size=4)
+    state = encrypter._to_planes(bytes.fromhex("63637C7C7B7BC5C57676C0C07575D2D2"))
+
+    shifted = encrypter._shift_state(state)
+
+    assert encrypter._from_planes(shifted, blocks=1).hex() == "637bc0d27b76d27c76757cc57563c5c0"
+    assert encrypter._shift_state(shifted, inverse=True) == state
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("key_size", [4, 6, 8])
+def test_bitsliced_encrypt_matches_packed(monkeypatch, block_size, key_size, decrypt):
+    monkeypatch.setattr(BitslicedRijndaelEncrypter, "BATCH_BLOCKS", 16)
+    packed = PackedRijndaelEncrypter(block_size=block_size, key_size=key_size)
+    encrypter = BitslicedRijndaelEncrypter(block_size=block_size, key_size=key_size)
+    key = [Word(int.from_bytes(os.urandom(Word.size()))) for _ in range(key_size)]
+    data = os.urandom(packed.block_bytes * 37)
+
+    expected = packed.encrypt_bytes(data, packed.key_schedule(key), decrypt=decrypt)
+
+    assert encrypter.encrypt_bytes(data, encrypter.key_schedule(key), decrypt=decrypt) == expected
+
+
+def test_bitsliced_encrypt_empty():
+    encrypter = BitslicedRijndaelEncrypter(block_size=4, key_size=4)
+    key_schedule = encrypter.key_schedule([Word(0)] * 4)
+
+    assert encrypter.encrypt_bytes(b"", key_schedule, decrypt=False) == b""
@@ -0,0 +1,24 @@
+import pytest
+
+from gigarijndael.encryption.block import block_format, blocks_to_bytes, bytes_to_blocks
+
+
+@pytest.mark.parametrize(
+    ("item_size", "items_count", "expected_format"), [(1, 16, ">16B"), (4, 32, ">32I")]
+)
+def test_block_format(item_size, items_count, expected_format):
+    assert block_format(item_size=item_size, items_count=items_count) == expected_format
+
+
+@pytest.mark.parametrize(
+    ("item_size", "items_count", "data", "expected_blocks"),
+    [
+        (1, 2, b"\x01\x02\x03\x04", [(0x01, 0x02), (0x03, 0x04)]),
+        (4, 1, b"\x01\x02\x03\x04\x05\x06\x07\x08", [(0x01020304,), (0x05060708,)]),
+    ],
+)
+def test_bytes_to_blocks(item_size, items_count, data, expected_blocks):
+    blocks = list(bytes_to_blocks(data, item_size=item_size, items_count=items_count))
+
+    assert blocks == expected_blocks
+    assert blocks_to_bytes(blocks, item_size=item_size, items_count=items_count) == data
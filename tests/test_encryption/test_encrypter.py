@@ -1,7 +1,17 @@
 import pytest
 
 from gigarijndael.encryption.encrypter import RijndaelEncrypter
-from gigarijndael.encryption.word import Word
+from gigarijndael.encryption.word import GigaWord64, Word
+
+
+def test_giga_bits():
+    encrypter = RijndaelEncrypter(block_size=4, key_size=4, experimental=True, giga_bits=64)
+
+    assert encrypter.word_cls is GigaWord64
+    assert encrypter.finite_field.n == 64
+    assert encrypter.block_bytes == 128
+    with pytest.raises(ValueError, match="Invalid Giga field size"):
+        RijndaelEncrypter(block_size=4, key_size=4, experimental=True, giga_bits=16)
 
 
 @pytest.mark.parametrize(
@@ -172,9 +182,8 @@ def test_state_decrypt():
     encrypter = RijndaelEncrypter(block_size=4, key_size=4)
     key = [Word(0x00000000), Word(0x00000000), Word(0x00000000), Word(0x00000000)]
     state = [Word(0xC7D12419), Word(0x489E3B62), Word(0x33A2C5A7), Word(0xF4563172)]
-    key_schedule = encrypter._key_expansion(key)
+    init_key, *round_keys = encrypter.key_schedule(key).reverse
 
-    init_key, round_keys = encrypter._round_keys(key_schedule, decrypt=True)
     state = encrypter._add_round_key(state, init_key)
     for i in range(encrypter.rounds_number - 1):
         state = encrypter._inverse_round(state, round_keys[i])
@@ -0,0 +1,82 @@
+import pytest
+
+from gigarijndael.encryption.bitsliced import BitslicedRijndaelEncrypter
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.instrumentation import ENVIRONMENT_VARIABLE
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+from gigarijndael.encryption.table import TableRijndaelEncrypter
+from gigarijndael.rijndael import Rijndael
+
+
+def test_instrument_reference_stages(sample_data):
+    rijndael = Rijndael(block_size=4, key_size=4, engine="reference")
+
+    with rijndael.instrument() as instrumentation:
+        cipher_text = rijndael.encrypt(sample_data[:64], b"key")
+        rijndael.decrypt(cipher_text, b"key")
+        snapshot = instrumentation.snapshot()
+
+    stages = snapshot["stages"]
+    assert snapshot["blocks"] == 8
+    assert stages["key_expansion"]["calls"] == 1
+    assert stages["sub_bytes"]["calls"] == 8 * 10
+    assert stages["mix_columns"]["calls"] == 8 * 9
+    assert stages["add_round_key"]["calls"] == 8 * 11
+    assert all(stage["nanoseconds"] > 0 for stage in stages.values())
+    assert set(snapshot["s_box_cache"]) == {"hits", "misses"}
+
+
+@pytest.mark.parametrize(
+    "encrypter_cls, stages",
+    [
+        (PackedRijndaelEncrypter, {"sub_bytes", "shift_rows", "mix_columns", "key_expansion"}),
+        (TableRijndaelEncrypter, {"rounds", "key_expansion"}),
+        (
+            BitslicedRijndaelEncrypter,
+            {"sub_bytes", "shift_rows", "mix_columns", "add_round_key", "key_expansion"},
+        ),
+    ],
+)
+def test_instrument_engine_stages(encrypter_cls, stages):
+    encrypter = encrypter_cls(block_size=4, key_size=4)
+    key = encrypter.split_key(b"key")
+
+    with encrypter.instrument() as instrumentation:
+        key_schedule = encrypter.key_schedule(key)
+        encrypter.encrypt_bytes(bytes(32), key_schedule, decrypt=True)
+
+    assert set(instrumentation.snapshot()["stages"]) == stages | {"encrypt_bytes"}
+    assert instrumentation.snapshot()["blocks"] == 2
+
+
+def test_instrument_nested_stage_timed_once():
+    encrypter = PackedRijndaelEncrypter(block_size=4, key_size=4)
+
+    with encrypter.instrument() as instrumentation:
+        encrypter._inv_mix_state(12345)
+
+    assert instrumentation.snapshot()["stages"]["mix_columns"]["calls"] == 1
+
+
+def test_instrument_disabled_restores_methods():
+    encrypter = RijndaelEncrypter(block_size=4, key_size=4)
+
+    with encrypter.instrument() as instrumentation:
+        assert "_mix_columns" in vars(encrypter)
+        instrumentation.reset()
+
+    assert encrypter.instrumentation is None
+    assert not set(RijndaelEncrypter.INSTRUMENTED_STAGES) & set(vars(encrypter))
+    assert "encrypt_bytes" not in vars(encrypter)
+
+
+def test_instrument_environment_variable(sample_data, monkeypatch):
+    monkeypatch.setenv(ENVIRONMENT_VARIABLE, "1")
+    rijndael = Rijndael(block_size=4, key_size=4)
+
+    rijndael.encrypt(sample_data[:32], b"key")
+    with rijndael.instrument() as instrumentation:
+        pass
+
+    assert instrumentation is rijndael.instrumentation
+    assert rijndael.instrumentation.snapshot()["blocks"] == 2
@@ -1,7 +1,7 @@
 import pytest
 
-from gigarijndael.encryption.matrix import affine_transformation
-from gigarijndael.encryption.sbox import InvSBox, SBox
+from gigarijndael.encryption.matrix import affine_transformation, compile_affine_transformation
+from gigarijndael.encryption.sbox import GigaInvSBox, GigaSBox, InvSBox, SBox
 
 
 @pytest.mark.parametrize(
@@ -56,3 +56,30 @@ def test_affine_transformation_inverse(number: int):
     )
 
     assert inverse_number == number
+
+
+@pytest.mark.parametrize("s_box_cls", [SBox, InvSBox])
+def test_compiled_affine_transformation(s_box_cls):
+    transform = compile_affine_transformation(s_box_cls.AFFINE_ROW, s_box_cls.AFFINE_CONST)
+
+    assert [transform(number) for number in range(256)] == [
+        affine_transformation(number, s_box_cls.AFFINE_ROW, s_box_cls.AFFINE_CONST)
+        for number in range(256)
+    ]
+
+
+@pytest.mark.parametrize("s_box_cls", [GigaSBox, GigaInvSBox])
+@pytest.mark.parametrize("number", [0, 1, 2, 100500, 9999999, 0x12345678, 0xFFFFFFFF, 0xDEADBEEF])
+def test_compiled_affine_transformation_giga(s_box_cls, number: int):
+    transform = compile_affine_transformation(s_box_cls.AFFINE_ROW, s_box_cls.AFFINE_CONST, size=32)
+
+    assert transform(number) == affine_transformation(
+        number, s_box_cls.AFFINE_ROW, s_box_cls.AFFINE_CONST, size=32
+    )
+
+
+@pytest.mark.parametrize("number", [0, 1, 0x1234, 0xABCDE, 0xFFFFF])
+def test_compiled_affine_transformation_other_sizes(number: int):
+    transform = compile_affine_transformation(0x8F0F1, 0x1234, size=20)
+
+    assert transform(number) == affine_transformation(number, 0x8F0F1, 0x1234, size=20)
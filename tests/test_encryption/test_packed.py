@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+
+
+def test_shift_state():
+    encrypter = PackedRijndaelEncrypter(block_size=4, key_size=4)
+    state = 0x63637C7C_7B7BC5C5_7676C0C0_7575D2D2
+
+    shifted = encrypter._shift_state(state)
+
+    assert shifted == 0x637BC0D2_7B76D27C_76757CC5_7563C5C0
+    assert encrypter._shift_state(shifted, inverse=True) == state
+
+
+def test_mix_state():
+    encrypter = PackedRijndaelEncrypter(block_size=4, key_size=4)
+    state = 0x637BC0D2_7B76D27C_76757CC5_7563C5C0
+
+    mixed = encrypter._mix_state(state)
+
+    assert mixed == 0x591CEEA1_C28636D1_CADDAF02_4A27DCA2
+    assert encrypter._inv_mix_state(mixed) == state
+
+
+def test_sub_state():
+    encrypter = PackedRijndaelEncrypter(block_size=4, key_size=4)
+    state = 0x00000101_03030707_0F0F1F1F_3F3F7F7F
+
+    substituted = encrypter._sub_state(state)
+
+    assert substituted == 0x63637C7C_7B7BC5C5_7676C0C0_7575D2D2
+    assert encrypter._sub_state(substituted, inverse=True) == state
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+@pytest.mark.parametrize(("experimental", "giga_bits"), [(False, 32), (True, 32), (True, 64)])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("key_size", [4, 6, 8])
+def test_packed_encrypt_matches_reference(block_size, key_size, experimental, giga_bits, decrypt):
+    options = {"experimental": experimental, "giga_bits": giga_bits}
+    reference = RijndaelEncrypter(block_size=block_size, key_size=key_size, **options)
+    encrypter = PackedRijndaelEncrypter(block_size=block_size, key_size=key_size, **options)
+    word_cls = reference.word_cls
+    key = [word_cls(int.from_bytes(os.urandom(word_cls.size()))) for _ in range(key_size)]
+    data = os.urandom(reference.block_bytes * 2)
+
+    expected = reference.encrypt_bytes(data, reference.key_schedule(key), decrypt=decrypt)
+
+    assert encrypter.encrypt_bytes(data, encrypter.key_schedule(key), decrypt=decrypt) == expected
@@ -1,8 +1,19 @@
+import gc
 import random
+import weakref
 
 import pytest
 
-from gigarijndael.encryption.sbox import GigaInvSBox, GigaSBox, InvSBox, SBox
+from gigarijndael.encryption.sbox import (
+    REGISTRY,
+    GigaInvSBox,
+    GigaInvSBox64,
+    GigaSBox,
+    GigaSBox64,
+    InvSBox,
+    SBox,
+    SBoxRegistry,
+)
 
 
 def test_s_box(reference_s_box):
@@ -27,3 +38,118 @@ def test_giga_s_box(value):
     inv_s_box = GigaInvSBox()
 
     assert inv_s_box[s_box[value]] == value
+
+
+@pytest.mark.parametrize("value", [0, 1, 2, *(random.getrandbits(64) for _ in range(20))])
+def test_giga_s_box_64(value):
+    s_box = GigaSBox64()
+    inv_s_box = GigaInvSBox64()
+
+    assert inv_s_box[s_box[value]] == value
+    assert s_box[value] != value
+
+
+@pytest.mark.parametrize("s_box_cls", [SBox, InvSBox, GigaSBox, GigaInvSBox, GigaSBox64])
+def test_s_box_substitute_many(s_box_cls):
+    s_box = s_box_cls()
+    items = [0, 1, 0, *(random.getrandbits(s_box.finite_field.n) for _ in range(20))]
+
+    substituted = s_box.substitute_many(items)
+
+    assert substituted == [s_box_cls()._substitute(item) for item in items]
+    assert substituted == [s_box[item] for item in items]
+
+
+def test_s_box_table_shared_by_instances():
+    assert SBox().table is SBox().table
+    assert InvSBox().table is InvSBox().table
+    assert SBox().table != InvSBox().table
+
+
+def test_s_box_instances_not_retained():
+    s_box = GigaSBox()
+    s_box[12345]
+    reference = weakref.ref(s_box)
+
+    del s_box
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_giga_s_box_caches_separate():
+    s_box = GigaSBox()
+    inv_s_box = GigaInvSBox()
+
+    assert s_box.key != inv_s_box.key
+    assert s_box._values is GigaSBox()._values
+    assert s_box._values is not inv_s_box._values
+    assert s_box.cache_info().maxsize == REGISTRY.cache_size
+    assert SBox().cache_info() is None
+
+
+def test_giga_s_box_has_no_table():
+    with pytest.raises(ValueError, match="has no table"):
+        GigaSBox().table
+
+
+def test_s_box_derived_table_built_once():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b"derived"
+
+    assert SBox().derived("test_derived", build) == b"derived"
+    assert SBox().derived("test_derived", build) == b"derived"
+    assert InvSBox().derived("test_derived", build) == b"derived"
+
+    assert len(calls) == 2
+
+
+def test_registry_save_and_load(tmp_path):
+    s_box, inv_s_box = GigaSBox(), GigaInvSBox()
+    values = {item: s_box[item] for item in (5, 1, 0xFFFFFFFF, 123456789)}
+    inv_values = {item: inv_s_box[item] for item in (7, 8)}
+    path = tmp_path / "s_box.cache"
+
+    saved = REGISTRY.save(path)
+    registry = SBoxRegistry()
+    loaded = registry.load(path)
+
+    assert loaded == saved >= 6
+    assert values.items() <= dict(registry.cache(s_box.key).items()).items()
+    assert inv_values.items() <= dict(registry.cache(inv_s_box.key).items()).items()
+    assert registry.cache(s_box.key).info().hits == 0
+
+
+def test_registry_load_warms_cache_up(tmp_path):
+    registry = SBoxRegistry()
+    key = GigaSBox().key
+    registry.cache(key).update([(10, 20), (30, 40)])
+    path = tmp_path / "s_box.cache"
+    registry.save(path)
+
+    warm = SBoxRegistry(cache_size=1)
+    warm.load(path)
+
+    assert warm.cache(key).items() == [(30, 40)]
+
+
+@pytest.mark.parametrize("content", [b"", b"not a snapshot", b"GRSB\x01\x01\x00\x00\x00"])
+def test_registry_load_invalid(tmp_path, content):
+    path = tmp_path / "s_box.cache"
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError, match="S-Box snapshot"):
+        SBoxRegistry().load(path)
+
+
+def test_registry_resize():
+    registry = SBoxRegistry(cache_size=4)
+    cache = registry.cache(GigaSBox().key)
+
+    registry.resize(2)
+
+    assert cache.maxsize == 2
+    assert registry.cache(GigaInvSBox().key).maxsize == 2
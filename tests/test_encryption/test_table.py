@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.table import TableRijndaelEncrypter
+from gigarijndael.encryption.word import Word
+
+
+def test_table_encrypter_experimental_not_supported():
+    with pytest.raises(ValueError, match="Table engine supports only GF"):
+        TableRijndaelEncrypter(block_size=4, key_size=4, experimental=True)
+
+
+def test_encryption_tables():
+    encrypter = TableRijndaelEncrypter(block_size=4, key_size=4)
+
+    te0, te1, te2, te3 = encrypter.encryption_tables
+
+    assert (te0[0x00], te1[0x00], te2[0x00], te3[0x00]) == (
+        0xC66363A5,
+        0xA5C66363,
+        0x63A5C663,
+        0x6363A5C6,
+    )
+    assert te0[0x01] == 0xF87C7C84
+
+
+def test_inv_mix_tables():
+    encrypter = TableRijndaelEncrypter(block_size=4, key_size=4)
+
+    u0, *_ = encrypter.inv_mix_tables
+
+    assert u0[0x01] == 0x0E090D0B
+
+
+def test_decryption_tables():
+    encrypter = TableRijndaelEncrypter(block_size=4, key_size=4)
+
+    td0, td1, *_ = encrypter.decryption_tables
+
+    assert (td0[0x00], td1[0x00]) == (0x51F4A750, 0x5051F4A7)
+    assert td0[0x01] == 0x7E416553
+
+
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+def test_equivalent_inverse_round_keys_match_reference(block_size):
+    reference = RijndaelEncrypter(block_size=block_size, key_size=4)
+    encrypter = TableRijndaelEncrypter(block_size=block_size, key_size=4)
+    key = [Word(int.from_bytes(os.urandom(4))) for _ in range(4)]
+    round_keys = RijndaelEncrypter.key_schedule(reference, key).reverse
+
+    assert encrypter.equivalent_inverse_round_keys(
+        round_keys
+    ) == reference.equivalent_inverse_round_keys(round_keys)
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("key_size", [4, 6, 8])
+def test_table_encrypt_matches_reference(block_size, key_size, decrypt):
+    reference = RijndaelEncrypter(block_size=block_size, key_size=key_size)
+    encrypter = TableRijndaelEncrypter(block_size=block_size, key_size=key_size)
+    key = [Word(int.from_bytes(os.urandom(4))) for _ in range(key_size)]
+    blocks = [tuple(os.urandom(block_size * Word.LENGTH)) for _ in range(3)]
+
+    expected = reference.encrypt(blocks=blocks, key=key, decrypt=decrypt)
+
+    assert encrypter.encrypt(blocks=blocks, key=key, decrypt=decrypt) == expected
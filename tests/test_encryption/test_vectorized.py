@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from gigarijndael.encryption.encrypter import RijndaelEncrypter
+from gigarijndael.encryption.vectorized import NumpyRijndaelEncrypter
+
+np = pytest.importorskip("numpy")
+
+
+def test_mix_state():
+    encrypter = NumpyRijndaelEncrypter(block_size=4, key_size=4)
+    state = np.array(
+        [
+            [
+                [0x63, 0x7B, 0xC0, 0xD2],
+                [0x7B, 0x76, 0xD2, 0x7C],
+                [0x76, 0x75, 0x7C, 0xC5],
+                [0x75, 0x63, 0xC5, 0xC0],
+            ]
+        ],
+        dtype=np.uint8,
+    )
+    expected = np.array(
+        [
+            [
+                [0x59, 0x1C, 0xEE, 0xA1],
+                [0xC2, 0x86, 0x36, 0xD1],
+                [0xCA, 0xDD, 0xAF, 0x02],
+                [0x4A, 0x27, 0xDC, 0xA2],
+            ]
+        ],
+        dtype=np.uint8,
+    )
+
+    mixed = encrypter._mix_state(state)
+
+    assert (mixed == expected).all()
+    assert (encrypter._inv_mix_state(mixed) == state).all()
+
+
+def test_shift_state():
+    encrypter = NumpyRijndaelEncrypter(block_size=4, key_size=4)
+    state = np.arange(16, dtype=np.uint8).reshape(1, 4, 4)
+
+    shifted = encrypter._shift_state(state)
+
+    assert shifted[0].tolist() == [[0, 5, 10, 15], [4, 9, 14, 3], [8, 13, 2, 7], [12, 1, 6, 11]]
+    assert (encrypter._shift_state(shifted, inverse=True) == state).all()
+
+
+@pytest.mark.parametrize("decrypt", [False, True])
+@pytest.mark.parametrize(("experimental", "giga_bits"), [(False, 32), (True, 32), (True, 64)])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("key_size", [4, 8])
+def test_numpy_encrypt_matches_reference(block_size, key_size, experimental, giga_bits, decrypt):
+    options = {"experimental": experimental, "giga_bits": giga_bits}
+    reference = RijndaelEncrypter(block_size=block_size, key_size=key_size, **options)
+    encrypter = NumpyRijndaelEncrypter(block_size=block_size, key_size=key_size, **options)
+    word_cls = reference.word_cls
+    key = [word_cls(int.from_bytes(os.urandom(word_cls.size()))) for _ in range(key_size)]
+    data = os.urandom(reference.block_bytes * 3)
+
+    expected = reference.encrypt_bytes(data, reference.key_schedule(key), decrypt=decrypt)
+
+    assert encrypter.encrypt_bytes(data, encrypter.key_schedule(key), decrypt=decrypt) == expected
+
+
+def test_numpy_encrypt_batches(monkeypatch):
+    encrypter = NumpyRijndaelEncrypter(block_size=4, key_size=4)
+    key_schedule = encrypter.key_schedule([encrypter.word_cls(0)] * 4)
+    data = os.urandom(encrypter.block_bytes * 5)
+    expected = encrypter.encrypt_bytes(data, key_schedule, decrypt=False)
+
+    monkeypatch.setattr(NumpyRijndaelEncrypter, "BATCH_BLOCKS", 2)
+
+    assert encrypter.encrypt_bytes(data, key_schedule, decrypt=False) == expected
@@ -1,6 +1,6 @@
 import pytest
 
-from gigarijndael.encryption.word import GigaWord, Word
+from gigarijndael.encryption.word import GigaWord, GigaWord64, Word
 
 
 @pytest.mark.parametrize(
@@ -194,7 +194,7 @@ def test_word_reversed_manual():
         next(rev_iterator)
 
 
-@pytest.mark.parametrize("word_cls", [Word, GigaWord])
+@pytest.mark.parametrize("word_cls", [Word, GigaWord, GigaWord64])
 def test_word_length(word_cls):
     assert len(word_cls()) == word_cls.LENGTH
 
@@ -204,6 +204,7 @@ def test_word_length(word_cls):
     [
         (Word, b"\x01\x02\x03\x04"),
         (GigaWord, b"\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x04"),
+        (GigaWord64, b"".join(item.to_bytes(8) for item in range(1, 5))),
     ],
 )
 def test_word_bytes(word_cls, expected_bytes):
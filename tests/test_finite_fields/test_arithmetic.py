@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from gigarijndael.finite_fields.arithmetic import (
+    CombArithmetic,
+    LogArithmetic,
+    TableArithmetic,
+    find_generator,
+    select_arithmetic,
+)
+from gigarijndael.finite_fields.field import FiniteField
+
+
+def peasant_multiply(first: int, second: int, n: int, general_polynomial: int) -> int:
+    """Russian Peasant Multiplication of reduced polynomials, the reference product."""
+    product = 0
+    while first and second:
+        if second & 1:
+            product ^= first
+        first <<= 1
+        if first >> n:
+            first ^= general_polynomial
+        second >>= 1
+    return product
+
+
+@pytest.mark.parametrize(
+    "n, general_polynomial, arithmetic_cls",
+    [
+        (3, 0b1011, TableArithmetic),
+        (8, 0b100011011, TableArithmetic),
+        (16, 0b10000000000101101, LogArithmetic),
+        (16, 0b10000000000000001, CombArithmetic),  # Reducible, no generator
+        (32, FiniteField(32).general_polynomial, CombArithmetic),
+    ],
+)
+def test_select_arithmetic(n, general_polynomial, arithmetic_cls):
+    assert isinstance(select_arithmetic(n, general_polynomial), arithmetic_cls)
+
+
+def test_find_generator():
+    assert find_generator(8, 0b100011011) == 3
+    assert find_generator(4, 0b10101) is None
+
+
+@pytest.mark.parametrize(
+    "n, general_polynomial",
+    [
+        (3, 0b1011),
+        (8, 0b100011011),
+        (16, 0b10000000000101101),
+        (32, 0b100000000000000000000000010001101),
+        (64, FiniteField(64).general_polynomial),
+        (128, FiniteField(128).general_polynomial),
+        (40, (1 << 40) | (1 << 21) | 1),  # Dense low part, reduced with the table
+    ],
+)
+def test_arithmetic_multiply(n, general_polynomial):
+    arithmetic = select_arithmetic(n, general_polynomial)
+
+    for _ in range(200):
+        first, second = random.getrandbits(n), random.getrandbits(n)
+        product = peasant_multiply(first, second, n, general_polynomial)
+        assert arithmetic.multiply(first, second) == product
+        assert arithmetic.square(first) == peasant_multiply(first, first, n, general_polynomial)
+        assert arithmetic.multiplier(first)(second) == arithmetic.multiply(first, second)
+
+
+@pytest.mark.parametrize(
+    "n, general_polynomial", [(3, 0b1011), (8, 0b100011011), (16, 0b10000000000101101)]
+)
+def test_arithmetic_inverse(n, general_polynomial):
+    arithmetic = select_arithmetic(n, general_polynomial)
+
+    for element in random.sample(range(1, 1 << n), min(200, (1 << n) - 1)):
+        assert arithmetic.multiply(element, arithmetic.inverse(element)) == 1
+
+
+@pytest.mark.parametrize("n, general_polynomial", [(8, 0b100011011), (16, 0b10000000000101101)])
+def test_table_arithmetic_unreduced_operands(n, general_polynomial):
+    arithmetic = select_arithmetic(n, general_polynomial)
+    comb = CombArithmetic(n, general_polynomial)
+
+    for first, second in [(3, 1 << n), (1 << (2 * n), 5), (random.getrandbits(3 * n), 7)]:
+        assert arithmetic.multiply(first, second) == comb.multiply(first, second)
+    assert FiniteField(8).multiply(3, 0x100) == 45
+
+
+def test_comb_arithmetic_has_no_inverse():
+    assert CombArithmetic(8, 0b100011011).inverse(2) is None
+
+
+@pytest.mark.parametrize("karatsuba_bits", [8, 64, CombArithmetic.KARATSUBA_BITS])
+@pytest.mark.parametrize("bits", [1, 63, 200, 5000])
+def test_multiply_polynomials_karatsuba(monkeypatch, karatsuba_bits, bits):
+    first, second = random.getrandbits(bits), random.getrandbits(bits // 2 + 1)
+    expected = CombArithmetic._comb_multiply(first, second)
+    monkeypatch.setattr(CombArithmetic, "KARATSUBA_BITS", karatsuba_bits)
+
+    assert CombArithmetic.multiply_polynomials(first, second) == expected
+    assert CombArithmetic.multiply_polynomials(second, first) == expected
@@ -1,5 +1,8 @@
+import random
+
 import pytest
 
+from gigarijndael.finite_fields.arithmetic import CombArithmetic
 from gigarijndael.finite_fields.field import FiniteField
 
 
@@ -51,10 +54,19 @@ def test_field_divmod(dividend: int, divisor: int, expected_quotient):
     assert quotient == expected_quotient
 
 
+def test_field_divmod_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        FiniteField(n=3).divmod(5, 0)
+
+
 @pytest.mark.parametrize(
     ("polynomial_a", "polynomial_b", "expected_gcd"),
     [
         (3, 283, (1, 246, 1)),
+        (0, 283, (283, 0, 1)),
+        (283, 0, (283, 1, 0)),
+        (6, 10, (6, 1, 0)),
+        (12, 10, (6, 1, 1)),
     ],
 )
 def test_field_egcd(polynomial_a: int, polynomial_b: int, expected_gcd: int):
@@ -65,6 +77,18 @@ def test_field_egcd(polynomial_a: int, polynomial_b: int, expected_gcd: int):
     assert gcd == expected_gcd
 
 
+def test_field_egcd_bezout_identity():
+    field = FiniteField(n=8)
+    multiply = CombArithmetic.multiply_polynomials
+
+    for _ in range(200):
+        first, second = random.getrandbits(200), random.getrandbits(150)
+        gcd, x, y = field.egcd(first, second)
+
+        assert multiply(x, first) ^ multiply(y, second) == gcd
+        assert field.divmod(first, gcd)[1] == field.divmod(second, gcd)[1] == 0
+
+
 @pytest.mark.parametrize(
     ("polynomial", "expected_inverse"),
     [
@@ -83,3 +107,74 @@ def test_field_inverse(polynomial: int, expected_inverse: int):
     inverse = field.inverse(polynomial)
 
     assert inverse == expected_inverse
+
+
+@pytest.mark.parametrize(
+    ("polynomial", "expected_inverse"), [(1, 1), (2, 0x80000046), (0x80000046, 2)]
+)
+def test_field_inverse_32(polynomial: int, expected_inverse: int):
+    field = FiniteField(n=32)
+
+    inverse = field.inverse(polynomial)
+
+    assert inverse == expected_inverse
+
+
+@pytest.mark.parametrize(
+    ("field_n", "general_polynomial"),
+    [
+        (8, None),
+        (32, None),
+        # No table or tower inversion, Montgomery's trick
+        (24, 0x100001B),
+    ],
+)
+def test_field_inverse_many(field_n: int, general_polynomial: int | None):
+    field = FiniteField(n=field_n, general_polynomial=general_polynomial)
+    polynomials = [0, 1, 2, 0, *(random.randrange(field.q) for _ in range(30)), 0]
+
+    inverses = field.inverse_many(polynomials)
+
+    assert inverses == [field.inverse(p) if p else 0 for p in polynomials]
+    assert field.multiply_many(polynomials, inverses) == [int(p != 0) for p in polynomials]
+
+
+@pytest.mark.parametrize("field_n", [64, 128])
+def test_field_inverse_large(field_n: int):
+    field = FiniteField(n=field_n)
+
+    for _ in range(20):
+        polynomial = random.getrandbits(field_n) or 1
+        assert field.multiply(polynomial, field.inverse(polynomial)) == 1
+        assert field.square(polynomial) == field.multiply(polynomial, polynomial)
+
+
+@pytest.mark.parametrize("field_n", [4, 8, 32, 64])
+def test_field_inverse_unreduced(field_n: int):
+    field = FiniteField(n=field_n)
+    residue = random.getrandbits(field_n) | 1
+    polynomial = CombArithmetic.multiply_polynomials(field.general_polynomial, 0b101) ^ residue
+
+    assert field.inverse(polynomial) == field.inverse(residue)
+    assert field.divide(7, polynomial) == field.divide(7, residue)
+    with pytest.raises(ZeroDivisionError):
+        field.inverse(field.general_polynomial)
+
+
+def test_field_inverse_unreduced_baseline():
+    assert FiniteField(n=8).inverse(300) == 66
+
+
+def test_field_inverse_many_zeros():
+    field = FiniteField(n=24, general_polynomial=0x100001B)
+
+    assert field.inverse_many([0, 0]) == [0, 0]
+    assert field.inverse_many([]) == []
+
+
+def test_field_multiply_many_lengths():
+    field = FiniteField(n=8)
+
+    assert field.multiply_many([83, 87], [202, 19]) == [1, 254]
+    with pytest.raises(ValueError):
+        field.multiply_many([1, 2], [3])
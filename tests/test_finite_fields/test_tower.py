@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from gigarijndael.finite_fields.field import FiniteField
+from gigarijndael.finite_fields.tower import TowerField
+
+
+@pytest.fixture(scope="module")
+def tower_field() -> TowerField:
+    return TowerField(FiniteField(32))
+
+
+def test_tower_field_requires_32_bit_field():
+    with pytest.raises(ValueError, match="Tower field requires"):
+        TowerField(FiniteField(8))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [1, 2, 3, 0xFFFF, 0x10000, 0xFFFFFFFF, *(random.getrandbits(32) | 1 for _ in range(50))],
+)
+def test_tower_field_inverse(tower_field, value):
+    field = tower_field.field
+
+    inverse = tower_field.inverse(value)
+
+    assert field.multiply(value, inverse) == 1
+    assert inverse == field.egcd(value, field.general_polynomial)[1]
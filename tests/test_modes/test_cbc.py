@@ -0,0 +1,94 @@
+import pytest
+
+from gigarijndael.aes import AES128
+from gigarijndael.modes import CBC, CBCContext, pkcs7_pad, pkcs7_unpad
+from gigarijndael.rijndael import Rijndael
+
+# NIST SP 800-38A, F.2.1 CBC-AES128.Encrypt
+KEY = bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c")
+IV = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+PLAIN_TEXT = bytes.fromhex(
+    "6bc1bee22e409f96e93d7e117393172a"
+    "ae2d8a571e03ac9c9eb76fac45af8e51"
+    "30c81c46a35ce411e5fbc1191a0a52ef"
+    "f69f2445df4f9b17ad2b417be66c3710"
+)
+CIPHER_TEXT = bytes.fromhex(
+    "7649abac8119b246cee98e9b12e9197d"
+    "5086cb9b507219ee95db113a917678b2"
+    "73bed6b8e3c1743b7116e69e22229516"
+    "3ff1caa1681fac09120eca307586e1a7"
+)
+
+
+def test_cbc_nist_vector():
+    aes = AES128()
+
+    assert aes.encrypt(PLAIN_TEXT, KEY, mode=CBC(IV, padding=False)) == CIPHER_TEXT
+    assert aes.decrypt(CIPHER_TEXT, KEY, mode=CBC(IV, padding=False)) == PLAIN_TEXT
+
+
+def test_cbc_padding_keeps_trailing_zeros():
+    aes = AES128()
+    data = b"ends with zeros" + bytes(17)
+
+    cipher_text = aes.encrypt(data, KEY, mode=CBC(IV))
+
+    assert len(cipher_text) == 48
+    assert aes.decrypt(cipher_text, KEY, mode=CBC(IV)) == data
+
+
+@pytest.mark.parametrize("experimental", [True, False])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+def test_cbc_stream(sample_data, experimental, block_size):
+    rijndael = Rijndael(block_size=block_size, key_size=4, experimental=experimental)
+    iv = bytes(range(block_size * (16 if experimental else 4)))
+    cipher_text = rijndael.encrypt(sample_data, KEY, mode=CBC(iv))
+
+    context = rijndael.decryptor(KEY, mode=CBC(iv))
+    plain_text = b"".join(
+        context.update(cipher_text[i : i + 13]) for i in range(0, len(cipher_text), 13)
+    )
+
+    assert plain_text + context.finalize() == sample_data
+
+
+def test_cbc_parallel_decrypt(sample_data, monkeypatch):
+    monkeypatch.setattr(CBCContext, "PARALLEL_THRESHOLD", 64)
+    aes = AES128()
+    cipher_text = aes.encrypt(sample_data, KEY, mode=CBC(IV))
+
+    assert aes.decrypt(cipher_text, KEY, mode=CBC(IV, workers=2)) == sample_data
+
+
+def test_cbc_unaligned_data_without_padding():
+    with pytest.raises(ValueError, match="not a multiple of the block size"):
+        AES128().encrypt(b"data", KEY, mode=CBC(IV, padding=False))
+
+
+def test_cbc_invalid_iv():
+    with pytest.raises(ValueError, match="Invalid IV size"):
+        AES128().encrypt(b"data", KEY, mode=CBC(b"short"))
+
+
+def test_cbc_padding_of_large_blocks():
+    # 64-bit Giga words make blocks of 256 bytes, longer than PKCS#7 can express
+    rijndael = Rijndael(block_size=8, key_size=4, experimental=True, giga_bits=64)
+    iv = bytes(rijndael.block_bytes)
+
+    with pytest.raises(ValueError, match="PKCS#7 padding supports blocks of up to 255 bytes"):
+        rijndael.encrypt(iv, b"key", mode=CBC(iv))
+    cipher_text = rijndael.encrypt(iv, b"key", mode=CBC(iv, padding=False))
+    assert rijndael.decrypt(cipher_text, b"key", mode=CBC(iv, padding=False)) == iv
+
+
+def test_pkcs7_padding():
+    assert pkcs7_pad(b"data", 8) == b"data\x04\x04\x04\x04"
+    assert pkcs7_pad(b"12345678", 8) == b"12345678" + b"\x08" * 8
+    assert pkcs7_unpad(b"data\x04\x04\x04\x04", 8) == b"data"
+
+
+@pytest.mark.parametrize("data", [b"", b"data", b"data\x04\x04\x04\x03", b"data\x00\x00\x00\x00"])
+def test_pkcs7_invalid_padding(data):
+    with pytest.raises(ValueError, match="Invalid padding"):
+        pkcs7_unpad(data, 8)
@@ -0,0 +1,73 @@
+import pytest
+
+from gigarijndael.aes import AES128
+from gigarijndael.modes import CTR, CTRContext
+from gigarijndael.rijndael import Rijndael
+
+# NIST SP 800-38A, F.5.1 CTR-AES128.Encrypt
+KEY = bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c")
+NONCE = bytes.fromhex("f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff")
+PLAIN_TEXT = bytes.fromhex(
+    "6bc1bee22e409f96e93d7e117393172a"
+    "ae2d8a571e03ac9c9eb76fac45af8e51"
+    "30c81c46a35ce411e5fbc1191a0a52ef"
+    "f69f2445df4f9b17ad2b417be66c3710"
+)
+CIPHER_TEXT = bytes.fromhex(
+    "874d6191b620e3261bef6864990db6ce"
+    "9806f66b7970fdff8617187bb9fffdff"
+    "5ae4df3edbd5d35e5b4f09020db03eab"
+    "1e031dda2fbe03d1792170a0f3009cee"
+)
+
+
+def test_ctr_nist_vector():
+    aes = AES128()
+
+    assert aes.encrypt(PLAIN_TEXT, KEY, mode=CTR(NONCE)) == CIPHER_TEXT
+    assert aes.decrypt(CIPHER_TEXT, KEY, mode=CTR(NONCE)) == PLAIN_TEXT
+
+
+def test_ctr_no_padding():
+    aes = AES128()
+
+    assert aes.encrypt(PLAIN_TEXT[:21], KEY, mode=CTR(NONCE)) == CIPHER_TEXT[:21]
+
+
+def test_ctr_counter_wraps_around():
+    aes = AES128()
+    nonce = b"\xff" * 16
+
+    cipher_text = aes.encrypt(bytes(32), KEY, mode=CTR(nonce))
+
+    assert cipher_text[16:] == aes.encrypt(bytes(16), KEY, mode=CTR(bytes(16)))
+
+
+@pytest.mark.parametrize("experimental", [True, False])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+def test_ctr_stream(sample_data, experimental, block_size):
+    rijndael = Rijndael(block_size=block_size, key_size=4, experimental=experimental)
+    nonce = bytes(range(block_size * (16 if experimental else 4)))
+    cipher_text = rijndael.encrypt(sample_data, b"key", mode=CTR(nonce))
+
+    context = rijndael.decryptor(b"key", mode=CTR(nonce))
+    plain_text = b"".join(
+        context.update(cipher_text[i : i + 9]) for i in range(0, len(cipher_text), 9)
+    )
+
+    assert len(cipher_text) == len(sample_data)
+    assert plain_text + context.finalize() == sample_data
+
+
+def test_ctr_parallel(sample_data, monkeypatch):
+    monkeypatch.setattr(CTRContext, "PARALLEL_THRESHOLD", 64)
+    aes = AES128()
+
+    cipher_text = aes.encrypt(sample_data, KEY, mode=CTR(NONCE, workers=2))
+
+    assert cipher_text == aes.encrypt(sample_data, KEY, mode=CTR(NONCE, workers=1))
+
+
+def test_ctr_invalid_nonce():
+    with pytest.raises(ValueError, match="Invalid nonce size"):
+        AES128().encrypt(b"data", KEY, mode=CTR(b"short"))
@@ -0,0 +1,50 @@
+import pytest
+
+from gigarijndael.modes import ECB
+from gigarijndael.rijndael import Rijndael
+
+
+def stream(context, data: bytes, chunk_size: int) -> bytes:
+    chunks = [context.update(data[i : i + chunk_size]) for i in range(0, len(data), chunk_size)]
+    return b"".join(chunks) + context.finalize()
+
+
+@pytest.mark.parametrize("experimental", [True, False])
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("chunk_size", [1, 7, 16, 100])
+def test_ecb_stream_matches_encrypt(sample_data, experimental, block_size, chunk_size):
+    key = b"secret-key"
+    rijndael = Rijndael(block_size=block_size, key_size=4, experimental=experimental)
+    cipher_text = rijndael.encrypt(data=sample_data, key=key)
+
+    assert stream(rijndael.encryptor(key), sample_data, chunk_size) == cipher_text
+    assert stream(rijndael.decryptor(key, mode=ECB()), cipher_text, chunk_size) == sample_data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16])
+def test_ecb_stream_keeps_inner_zeros(chunk_size):
+    key = b"secret-key"
+    rijndael = Rijndael(block_size=4, key_size=4)
+    data = b"head" + bytes(40) + b"tail" + bytes(20)
+    cipher_text = rijndael.encrypt(data=data, key=key)
+
+    assert stream(rijndael.decryptor(key), cipher_text, chunk_size) == data.rstrip(b"\x00")
+
+
+def test_ecb_stream_update_returns_whole_blocks():
+    rijndael = Rijndael(block_size=4, key_size=4)
+    context = rijndael.encryptor(b"secret-key")
+
+    assert context.update(b"x" * 15) == b""
+    assert len(context.update(b"x" * 20)) == 32
+    assert len(context.finalize()) == 16
+
+
+def test_ecb_stream_finalized():
+    context = Rijndael(block_size=4, key_size=4).encryptor(b"secret-key")
+    context.finalize()
+
+    with pytest.raises(ValueError, match="already finalized"):
+        context.update(b"data")
+    with pytest.raises(ValueError, match="already finalized"):
+        context.finalize()
@@ -0,0 +1,141 @@
+import array
+
+import pytest
+
+from gigarijndael.aes import AES128
+from gigarijndael.modes import GCM, GCMContext
+from gigarijndael.modes.ctr import counter_keystream
+from gigarijndael.rijndael import Rijndael
+
+# The GCM specification (McGrew and Viega), test cases 2, 4 and 6
+KEY = bytes.fromhex("feffe9928665731c6d6a8f9467308308")
+NONCE = bytes.fromhex("cafebabefacedbaddecaf888")
+ASSOCIATED_DATA = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+PLAIN_TEXT = bytes.fromhex(
+    "d9313225f88406e5a55909c5aff5269a"
+    "86a7a9531534f7da2e4c303d8a318a72"
+    "1c3c0c95956809532fcf0e2449a6b525"
+    "b16aedf5aa0de657ba637b39"
+)
+CIPHER_TEXT = bytes.fromhex(
+    "42831ec2217774244b7221b784d0d49c"
+    "e3aa212f2c02a4e035c17e2329aca12e"
+    "21d514b25466931c7d8f6a5aac84aa05"
+    "1ba30b396a0aac973d58e091"
+)
+TAG = bytes.fromhex("5bc94fbc3221a5db94fae95ae7121a47")
+LONG_NONCE = bytes.fromhex(
+    "9313225df88406e555909c5aff5269aa"
+    "6a7a9538534f7da1e4c303d2a318a728"
+    "c3c0c95156809539fcf0e2429a6b5254"
+    "16aedbf5a0de6a57a637b39b"
+)
+
+
+@pytest.mark.parametrize(
+    ("key", "plain_text", "expected"),
+    [
+        (bytes(16), b"", "58e2fccefa7e3061367f1d57a4e7455a"),
+        (
+            bytes(16),
+            bytes(16),
+            "0388dace60b6a392f328c2b971b2fe78ab6e47d42cec13bdf53a67b21257bddf",
+        ),
+    ],
+)
+def test_gcm_vectors_without_associated_data(key, plain_text, expected):
+    aes = AES128()
+
+    assert aes.encrypt(plain_text, key, mode=GCM(bytes(12))) == bytes.fromhex(expected)
+
+
+def test_gcm_vector():
+    aes = AES128()
+    mode = GCM(NONCE, ASSOCIATED_DATA)
+
+    assert aes.encrypt(PLAIN_TEXT, KEY, mode=mode) == CIPHER_TEXT + TAG
+    assert aes.decrypt(CIPHER_TEXT + TAG, KEY, mode=mode) == PLAIN_TEXT
+
+
+def test_gcm_long_nonce():
+    cipher_text = AES128().encrypt(PLAIN_TEXT, KEY, mode=GCM(LONG_NONCE, ASSOCIATED_DATA))
+
+    assert cipher_text[-16:] == bytes.fromhex("619cc5aefffe0bfa462af43c1699d050")
+
+
+@pytest.mark.parametrize("tag_size", [16, 12, 4])
+def test_gcm_stream(sample_data, tag_size):
+    aes = AES128()
+    mode = GCM(NONCE, tag_size=tag_size)
+    cipher_text = aes.encrypt(sample_data, KEY, mode=GCM(NONCE, ASSOCIATED_DATA, tag_size))
+
+    context = aes.decryptor(KEY, mode=mode)
+    for i in range(0, len(ASSOCIATED_DATA), 7):
+        context.authenticate_additional_data(ASSOCIATED_DATA[i : i + 7])
+    plain_text = b"".join(
+        context.update(cipher_text[i : i + 9]) for i in range(0, len(cipher_text), 9)
+    )
+
+    assert len(cipher_text) == len(sample_data) + tag_size
+    assert plain_text + context.finalize() == sample_data
+    assert context.tag == cipher_text[-tag_size:]
+
+
+def test_gcm_associated_data_of_wide_items():
+    aes = AES128()
+    associated_data = array.array("I", range(5))
+
+    context = aes.encryptor(KEY, mode=GCM(NONCE))
+    context.authenticate_additional_data(associated_data)
+
+    expected = aes.encrypt(PLAIN_TEXT, KEY, mode=GCM(NONCE, associated_data.tobytes()))
+    assert context.update(PLAIN_TEXT) + context.finalize() == expected
+
+
+@pytest.mark.parametrize("position", [0, len(PLAIN_TEXT), len(PLAIN_TEXT) + 15])
+def test_gcm_tampered(position):
+    tampered = bytearray(CIPHER_TEXT + TAG)
+    tampered[position] ^= 1
+
+    with pytest.raises(ValueError, match="Invalid authentication tag"):
+        AES128().decrypt(tampered, KEY, mode=GCM(NONCE, ASSOCIATED_DATA))
+
+
+def test_gcm_associated_data_after_data():
+    context = AES128().encryptor(KEY, mode=GCM(NONCE))
+    context.update(PLAIN_TEXT)
+
+    with pytest.raises(ValueError, match="Additional data must come before the data"):
+        context.authenticate_additional_data(ASSOCIATED_DATA)
+
+
+def test_gcm_counter_increments_low_bits():
+    aes = AES128()
+    encrypter, key_schedule = aes._encrypter, aes.key_schedule(KEY)
+    start = int.from_bytes(NONCE + b"\xff\xff\xff\xff")
+
+    keystream = counter_keystream(encrypter, start, 2, key_schedule, counter_bits=32)
+
+    assert keystream[16:] == counter_keystream(
+        encrypter, int.from_bytes(NONCE + bytes(4)), 1, key_schedule
+    )
+
+
+def test_gcm_parallel(sample_data, monkeypatch):
+    monkeypatch.setattr(GCMContext, "PARALLEL_THRESHOLD", 64)
+    aes = AES128()
+    data = sample_data * 4
+
+    cipher_text = aes.encrypt(data, KEY, mode=GCM(NONCE, workers=2))
+
+    assert cipher_text == aes.encrypt(data, KEY, mode=GCM(NONCE, workers=1))
+    assert aes.decrypt(cipher_text, KEY, mode=GCM(NONCE, workers=2)) == data
+
+
+def test_gcm_invalid_arguments():
+    with pytest.raises(ValueError, match="Invalid tag size"):
+        GCM(NONCE, tag_size=10)
+    with pytest.raises(ValueError, match="128-bit blocks"):
+        Rijndael(block_size=6, key_size=4).encrypt(b"data", b"key", mode=GCM(NONCE))
+    with pytest.raises(ValueError, match="shorter than the authentication tag"):
+        AES128().decrypt(TAG[:8], KEY, mode=GCM(NONCE))
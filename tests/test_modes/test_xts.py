@@ -0,0 +1,106 @@
+import pytest
+
+from gigarijndael.aes import AES128
+from gigarijndael.modes import XTS, XTSContext
+from gigarijndael.modes.xts import tweak_masks, xts_blocks
+from gigarijndael.rijndael import Rijndael
+
+# IEEE 1619-2007, XTS-AES-128 vectors 1, 2, 3 and 15
+KEY = bytes.fromhex("fffefdfcfbfaf9f8f7f6f5f4f3f2f1f0")
+TWEAK_KEY = bytes.fromhex("bfbebdbcbbbab9b8b7b6b5b4b3b2b1b0")
+
+
+@pytest.mark.parametrize(
+    ("key", "tweak_key", "sector", "plain_text", "expected"),
+    [
+        (
+            bytes(16),
+            bytes(16),
+            0,
+            bytes(32),
+            "917cf69ebd68b2ec9b9fe9a3eadda692cd43d2f59598ed858c02c2652fbf922e",
+        ),
+        (
+            b"\x11" * 16,
+            b"\x22" * 16,
+            0x3333333333,
+            b"\x44" * 32,
+            "c454185e6a16936e39334038acef838bfb186fff7480adc4289382ecd6d394f0",
+        ),
+        (
+            KEY,
+            b"\x22" * 16,
+            0x3333333333,
+            b"\x44" * 32,
+            "af85336b597afc1a900b2eb21ec949d292df4c047e0b21532186a5971a227a89",
+        ),
+        (KEY, TWEAK_KEY, 0x123456789A, bytes(range(17)), "6c1625db4671522d3d7599601de7ca09ed"),
+    ],
+)
+def test_xts_vectors(key, tweak_key, sector, plain_text, expected):
+    aes = AES128()
+    mode = XTS(tweak_key, first_sector=sector)
+
+    assert aes.encrypt(plain_text, key, mode=mode) == bytes.fromhex(expected)
+    assert aes.decrypt(bytes.fromhex(expected), key, mode=mode) == plain_text
+
+
+@pytest.mark.parametrize("last_sector_size", [16, 31, 64])
+def test_xts_sectors_are_independent(sample_data, last_sector_size):
+    aes = AES128()
+    data = sample_data[: 3 * 64 + last_sector_size]
+
+    cipher_text = aes.encrypt(data, KEY, mode=XTS(TWEAK_KEY, sector_size=64, first_sector=5))
+
+    for index, offset in enumerate(range(0, len(data), 64)):
+        sector = aes.encrypt(data[offset : offset + 64], KEY, mode=XTS(TWEAK_KEY, 64, 5 + index))
+        assert cipher_text[offset : offset + 64] == sector
+    assert aes.decrypt(cipher_text, KEY, mode=XTS(TWEAK_KEY, 64, 5)) == data
+
+
+def test_xts_stream(sample_data):
+    aes = AES128()
+    mode = XTS(TWEAK_KEY, sector_size=32)
+    cipher_text = aes.encrypt(sample_data, KEY, mode=mode)
+
+    context = aes.decryptor(KEY, mode=mode)
+    plain_text = b"".join(
+        context.update(cipher_text[i : i + 9]) for i in range(0, len(cipher_text), 9)
+    )
+
+    assert plain_text + context.finalize() == sample_data
+
+
+def test_xts_blocks_from_the_middle_of_a_sector(sample_data):
+    aes = AES128()
+    encrypter, key_schedule = aes.encrypter, aes.key_schedule(KEY)
+    args = (key_schedule, aes.key_schedule(TWEAK_KEY), 64, 3, False)
+    data = sample_data[:320]
+
+    expected = xts_blocks(encrypter, data, 0, *args)
+
+    assert xts_blocks(encrypter, data[48:272], 3, *args) == expected[48:272]
+
+
+def test_tweak_masks_double_the_tweak():
+    masks = tweak_masks(1 << 127 | 1, 0, 3)
+
+    assert [int.from_bytes(mask, "little") for mask in masks] == [1 << 127 | 1, 0x85, 0x10A]
+
+
+def test_xts_parallel(sample_data, monkeypatch):
+    monkeypatch.setattr(XTSContext, "PARALLEL_THRESHOLD", 64)
+    aes = AES128()
+
+    cipher_text = aes.encrypt(sample_data, KEY, mode=XTS(TWEAK_KEY, 32, 7, workers=2))
+
+    assert cipher_text == aes.encrypt(sample_data, KEY, mode=XTS(TWEAK_KEY, 32, 7, workers=1))
+
+
+def test_xts_invalid_arguments():
+    with pytest.raises(ValueError, match="shorter than a block"):
+        AES128().encrypt(bytes(20), KEY, mode=XTS(TWEAK_KEY, sector_size=16))
+    with pytest.raises(ValueError, match="Invalid sector size"):
+        AES128().encrypt(bytes(32), KEY, mode=XTS(TWEAK_KEY, sector_size=40))
+    with pytest.raises(ValueError, match="128-bit blocks"):
+        Rijndael(block_size=6, key_size=4).encrypt(bytes(32), KEY, mode=XTS(TWEAK_KEY))
@@ -0,0 +1,57 @@
+import pytest
+
+from gigarijndael.encryption.packed import PackedRijndaelEncrypter
+from gigarijndael.modes import CipherContext
+from gigarijndael.parallel import WorkerPool, get_pool, split_range
+from gigarijndael.rijndael import Rijndael
+
+
+@pytest.fixture(scope="module")
+def encrypter() -> PackedRijndaelEncrypter:
+    return PackedRijndaelEncrypter(block_size=4, key_size=4)
+
+
+@pytest.fixture(scope="module")
+def pool(encrypter):
+    pool = WorkerPool(encrypter, workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize(
+    "count, parts, ranges",
+    [
+        (10, 3, [(0, 4), (4, 4), (8, 2)]),
+        (2, 8, [(0, 1), (1, 1)]),
+        (0, 4, []),
+    ],
+)
+def test_split_range(count, parts, ranges):
+    assert split_range(count, parts) == ranges
+
+
+@pytest.mark.parametrize("decrypt", [True, False])
+def test_worker_pool_encrypt_bytes(encrypter, pool, sample_data, decrypt):
+    data = sample_data[:320]
+    key_schedule = encrypter.key_schedule(encrypter.split_key(b"key"))
+
+    result = pool.encrypt_bytes(data, key_schedule, decrypt)
+
+    assert result == encrypter.encrypt_bytes(data, key_schedule, decrypt)
+
+
+def test_get_pool_reuses_pool(encrypter):
+    assert get_pool(encrypter, workers=2) is get_pool(encrypter, workers=2)
+    assert get_pool(encrypter, workers=2) is not get_pool(encrypter, workers=1)
+
+
+@pytest.mark.parametrize("experimental", [True, False])
+def test_rijndael_workers(sample_data, monkeypatch, experimental):
+    monkeypatch.setattr(CipherContext, "PARALLEL_THRESHOLD", 64)
+    rijndael = Rijndael(block_size=4, key_size=4, experimental=experimental, workers=2)
+    reference = Rijndael(block_size=4, key_size=4, experimental=experimental)
+
+    cipher_text = rijndael.encrypt(sample_data, b"key")
+
+    assert cipher_text == reference.encrypt(sample_data, b"key")
+    assert rijndael.decrypt(cipher_text, b"key") == sample_data
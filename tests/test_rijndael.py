@@ -1,5 +1,6 @@
 import pytest
 
+from gigarijndael.modes import CBC, CTR, GCM
 from gigarijndael.rijndael import Rijndael
 
 
@@ -27,3 +28,135 @@ def test_rijndael_decrypt(sample_data, experimental, block_size, key_size):
     cipher_text = rijndael.encrypt(data=plain_text, key=key)
 
     assert cipher_text == sample_data
+
+
+@pytest.mark.parametrize("block_size", [4, 6, 8])
+@pytest.mark.parametrize("key_size", [4, 6, 8])
+def test_rijndael_table_engine(sample_data, block_size, key_size):
+    key = b"secret-key"
+    reference = Rijndael(block_size=block_size, key_size=key_size)
+    rijndael = Rijndael(block_size=block_size, key_size=key_size, engine="table")
+
+    cipher_text = rijndael.encrypt(data=sample_data, key=key)
+
+    assert cipher_text == reference.encrypt(data=sample_data, key=key)
+    assert rijndael.decrypt(data=cipher_text, key=key) == sample_data
+
+
+def test_rijndael_options(sample_data):
+    rijndael = Rijndael(block_size=6, key_size=8, engine="table", key_cache_size=4)
+
+    copy = Rijndael(**rijndael.options())
+
+    assert copy.options() == rijndael.options()
+    assert copy.encrypt(sample_data, b"key") == rijndael.encrypt(sample_data, b"key")
+
+
+def test_rijndael_invalid_engine():
+    with pytest.raises(ValueError, match="Invalid engine"):
+        Rijndael(block_size=4, key_size=4, engine="unknown")
+
+
+def test_rijndael_key_schedule_cache(sample_data):
+    rijndael = Rijndael(block_size=4, key_size=4)
+
+    cipher_text = rijndael.encrypt(data=sample_data, key=b"first-key")
+    rijndael.decrypt(data=cipher_text, key=b"first-key")
+    rijndael.encrypt(data=sample_data, key=b"second-key")
+
+    info = rijndael.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_rijndael_key_schedule_cache_eviction(sample_data):
+    rijndael = Rijndael(block_size=4, key_size=4, key_cache_size=1)
+    rijndael.encrypt(data=sample_data, key=b"first-key")
+    rijndael.encrypt(data=sample_data, key=b"second-key")
+
+    assert rijndael.evict_key(b"first-key") is False
+    assert rijndael.evict_key(b"second-key") is True
+    rijndael.encrypt(data=sample_data, key=b"third-key")
+    rijndael.clear_key_cache()
+    assert rijndael.cache_info().currsize == 0
+
+
+def test_rijndael_key_schedule_directions():
+    rijndael = Rijndael(block_size=4, key_size=4, engine="reference")
+
+    key_schedule = rijndael.key_schedule(b"secret-key")
+
+    assert len(key_schedule.forward) == rijndael._encrypter.rounds_number + 1
+    assert key_schedule.reverse == key_schedule.forward[::-1]
+
+
+@pytest.mark.parametrize("engine", ["packed", "table"])
+def test_rijndael_key_schedule_equivalent_inverse(engine):
+    rijndael = Rijndael(block_size=4, key_size=4, engine=engine)
+
+    forward, reverse = rijndael.key_schedule(b"secret-key")
+
+    # Only the inner decryption round keys go through InvMixColumns
+    assert (reverse[0], reverse[-1]) == (forward[-1], forward[0])
+    assert reverse[1:-1] != forward[-2:0:-1]
+
+
+@pytest.mark.parametrize("engine", ["packed", "table", "bitsliced", "reference"])
+@pytest.mark.parametrize("buffer_type", [bytearray, memoryview])
+def test_rijndael_encrypt_buffer(sample_data, engine, buffer_type):
+    rijndael = Rijndael(block_size=4, key_size=4, engine=engine)
+    cipher_text = rijndael.encrypt(sample_data, b"key")
+
+    assert rijndael.encrypt(buffer_type(sample_data), b"key") == cipher_text
+    assert rijndael.decrypt(buffer_type(cipher_text), b"key") == sample_data
+
+
+def test_rijndael_encrypt_numpy_array(sample_data):
+    np = pytest.importorskip("numpy")
+    rijndael = Rijndael(block_size=4, key_size=4)
+    data = np.frombuffer(sample_data[:320], dtype=np.uint32)
+
+    assert rijndael.encrypt(data, b"key") == rijndael.encrypt(sample_data[:320], b"key")
+
+
+@pytest.mark.parametrize("experimental", [True, False])
+def test_rijndael_encrypt_into(sample_data, experimental):
+    rijndael = Rijndael(block_size=4, key_size=4, experimental=experimental)
+    output = bytearray(len(sample_data) + 64)
+
+    written = rijndael.encrypt_into(sample_data, output, b"key")
+
+    assert output[:written] == rijndael.encrypt(sample_data, b"key")
+
+
+def test_rijndael_encrypt_in_place(sample_data):
+    rijndael = Rijndael(block_size=4, key_size=4)
+    mode = CTR(bytes(16), workers=1)
+    buffer = bytearray(sample_data)
+
+    assert rijndael.encrypt_into(buffer, buffer, b"key", mode=mode) == len(sample_data)
+    assert buffer == rijndael.encrypt(sample_data, b"key", mode=mode)
+    assert rijndael.decrypt_into(buffer, buffer, b"key", mode=mode) == len(sample_data)
+    assert buffer == sample_data
+
+
+def test_rijndael_encrypt_into_small_buffer(sample_data):
+    rijndael = Rijndael(block_size=4, key_size=4)
+
+    with pytest.raises(ValueError, match="Output buffer is too small"):
+        rijndael.encrypt_into(sample_data, bytearray(16), b"key")
+
+
+@pytest.mark.parametrize("mode", [None, CBC(bytes(16)), GCM(bytes(12))])
+def test_rijndael_context_into_small_buffer(sample_data, mode):
+    rijndael = Rijndael(block_size=4, key_size=4)
+    context = rijndael.encryptor(b"key", mode)
+    output = bytearray(len(sample_data) + 32)
+
+    with pytest.raises(ValueError, match="Output buffer is too small"):
+        context.update_into(sample_data, bytearray(16))
+    written = context.update_into(sample_data, output)
+    with pytest.raises(ValueError, match="Output buffer is too small"):
+        context.finalize_into(bytearray(0))
+    written += context.finalize_into(memoryview(output)[written:])
+
+    assert output[:written] == rijndael.encrypt(sample_data, b"key", mode)
@@ -0,0 +1,76 @@
+import pytest
+
+from gigarijndael.aes import AES128
+from gigarijndael.modes import XTS, XTSContext
+from gigarijndael.sectors import SectorCipher
+
+KEY = bytes(range(16))
+TWEAK_KEY = bytes(range(16, 32))
+
+
+@pytest.fixture
+def sector_cipher() -> SectorCipher:
+    return SectorCipher(AES128(), KEY, TWEAK_KEY, sector_size=64, workers=1)
+
+
+def test_sector_round_trip(sector_cipher, sample_data):
+    sector = sample_data[:64]
+
+    cipher_text = sector_cipher.encrypt_sector(9, sector)
+
+    assert cipher_text == AES128().encrypt(sector, KEY, mode=XTS(TWEAK_KEY, 64, 9))
+    assert sector_cipher.decrypt_sector(9, cipher_text) == sector
+    assert sector_cipher.encrypt_sector(10, sector) != cipher_text
+
+
+def test_sectors_match_single_sectors(sector_cipher, sample_data):
+    cipher_text = sector_cipher.encrypt_sectors(2, sample_data)
+
+    for index, offset in enumerate(range(0, len(sample_data), 64)):
+        sector = sector_cipher.encrypt_sector(2 + index, sample_data[offset : offset + 64])
+        assert cipher_text[offset : offset + 64] == sector
+    assert sector_cipher.decrypt_sectors(2, cipher_text) == sample_data
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_image_in_place(tmp_path, sector_cipher, sample_data, monkeypatch, workers):
+    monkeypatch.setattr(XTSContext, "PARALLEL_THRESHOLD", 64)
+    monkeypatch.setattr(SectorCipher, "CHUNK_SIZE", 3 * 64)
+    sector_cipher.workers = workers
+    image = tmp_path / "disk.img"
+    image.write_bytes(sample_data)
+
+    assert sector_cipher.encrypt_image(image) == len(sample_data)
+    assert image.read_bytes() == sector_cipher.encrypt_sectors(0, sample_data)
+
+    assert sector_cipher.decrypt_image(image, first=1, count=4) == 4 * 64
+    encrypted = sector_cipher.encrypt_sectors(0, sample_data)
+    assert image.read_bytes() == encrypted[:64] + sample_data[64:320] + encrypted[320:]
+
+
+def test_empty_image(tmp_path, sector_cipher):
+    image = tmp_path / "empty.img"
+    image.write_bytes(b"")
+
+    assert sector_cipher.encrypt_image(image) == 0
+
+
+def test_image_tail_shorter_than_a_block(tmp_path, sector_cipher, sample_data):
+    image = tmp_path / "disk.img"
+    data = sample_data[: 3 * 64 + 8]
+    image.write_bytes(data)
+
+    with pytest.raises(ValueError, match="shorter than a block"):
+        sector_cipher.encrypt_image(image)
+
+    assert image.read_bytes() == data
+    assert sector_cipher.encrypt_image(image, count=3) == 3 * 64
+
+
+def test_sector_invalid_arguments(sector_cipher):
+    with pytest.raises(ValueError, match="larger than a sector"):
+        sector_cipher.encrypt_sector(0, bytes(65))
+    with pytest.raises(ValueError, match="Invalid sector index"):
+        sector_cipher.encrypt_sector(-1, bytes(64))
+    with pytest.raises(ValueError, match="Invalid sector size"):
+        SectorCipher(AES128(), KEY, TWEAK_KEY, sector_size=100)